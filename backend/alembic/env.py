@@ -10,6 +10,14 @@ fileConfig(config.config_file_name)
 # Set the target metadata from your SQLAlchemy models
 target_metadata = Base.metadata
 
+# Database-maintained objects that are intentionally not mapped on the models
+UNMAPPED_OBJECTS = {"search_vector", "ix_jobs_search_vector"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Keep autogenerate from dropping database-maintained objects."""
+    return not (reflected and name in UNMAPPED_OBJECTS)
+
 
 def run_migrations_online():
     """
@@ -31,7 +39,11 @@ def do_run_migrations(connection):
     """
     Configure and run migrations synchronously on the provided connection.
     """
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
     with context.begin_transaction():
         context.run_migrations()
 
@@ -47,6 +59,7 @@ def run_migrations_offline():
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,47 @@
+"""job feed pagination indexes
+
+Revision ID: 3b9d2f61a7c4
+Revises: 17f1c636065a
+Create Date: 2026-10-18 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d2f61a7c4'
+down_revision: Union[str, None] = '17f1c636065a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text("status = 'active'")
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_jobs_active_created_at_id', 'jobs', ['created_at', 'id'],
+        unique=False, postgresql_where=ACTIVE, sqlite_where=ACTIVE,
+    )
+    op.create_index(
+        'ix_jobs_active_location_created_at_id', 'jobs', ['location', 'created_at', 'id'],
+        unique=False, postgresql_where=ACTIVE, sqlite_where=ACTIVE,
+    )
+    op.create_index(
+        'ix_jobs_active_employment_type_created_at_id', 'jobs',
+        ['employment_type', 'created_at', 'id'],
+        unique=False, postgresql_where=ACTIVE, sqlite_where=ACTIVE,
+    )
+    op.create_index(
+        'ix_jobs_active_salary_range', 'jobs', ['salary_min', 'salary_max'],
+        unique=False, postgresql_where=ACTIVE, sqlite_where=ACTIVE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_active_salary_range', table_name='jobs')
+    op.drop_index('ix_jobs_active_employment_type_created_at_id', table_name='jobs')
+    op.drop_index('ix_jobs_active_location_created_at_id', table_name='jobs')
+    op.drop_index('ix_jobs_active_created_at_id', table_name='jobs')
@@ -0,0 +1,45 @@
+"""job full text search
+
+Revision ID: 5e07c4d9b2a1
+Revises: 3b9d2f61a7c4
+Create Date: 2026-10-18 10:03:17.220954
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e07c4d9b2a1'
+down_revision: Union[str, None] = '3b9d2f61a7c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The generated column is maintained by Postgres on every INSERT/UPDATE.
+    # It is deliberately not mapped on the Job model (see alembic/env.py).
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("""
+        ALTER TABLE jobs ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(company_name, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(requirements, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'D')
+        ) STORED
+    """)
+    op.create_index(
+        'ix_jobs_search_vector', 'jobs', ['search_vector'],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_jobs_search_vector', table_name='jobs')
+    op.drop_column('jobs', 'search_vector')
@@ -0,0 +1,54 @@
+"""application daily count rollup
+
+Revision ID: 9a41e6c2d8f0
+Revises: 5e07c4d9b2a1
+Create Date: 2026-10-18 11:26:52.871340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a41e6c2d8f0'
+down_revision: Union[str, None] = '5e07c4d9b2a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'application_daily_counts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('employer_id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['employer_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('job_id', 'day', 'status', name='uq_application_daily_counts_job_day_status'),
+    )
+    op.create_index(op.f('ix_application_daily_counts_id'), 'application_daily_counts', ['id'], unique=False)
+    op.create_index(
+        'ix_application_daily_counts_employer_day', 'application_daily_counts',
+        ['employer_id', 'day'], unique=False,
+    )
+
+    # Backfill from existing applications
+    op.execute("""
+        INSERT INTO application_daily_counts (employer_id, job_id, day, status, count)
+        SELECT j.posted_by_id, ja.job_id, date(ja.created_at), coalesce(ja.status, 'applied'), count(ja.id)
+        FROM job_applications ja
+        JOIN jobs j ON j.id = ja.job_id
+        GROUP BY j.posted_by_id, ja.job_id, date(ja.created_at), coalesce(ja.status, 'applied')
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_application_daily_counts_employer_day', table_name='application_daily_counts')
+    op.drop_index(op.f('ix_application_daily_counts_id'), table_name='application_daily_counts')
+    op.drop_table('application_daily_counts')
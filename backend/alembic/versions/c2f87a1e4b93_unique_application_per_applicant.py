@@ -0,0 +1,29 @@
+"""unique application per applicant
+
+Revision ID: c2f87a1e4b93
+Revises: 9a41e6c2d8f0
+Create Date: 2026-10-18 12:40:05.118372
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f87a1e4b93'
+down_revision: Union[str, None] = '9a41e6c2d8f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fails if duplicate (job_id, applicant_id) rows exist; resolve them first
+    op.create_unique_constraint(
+        'uq_job_applications_job_applicant', 'job_applications', ['job_id', 'applicant_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_job_applications_job_applicant', 'job_applications', type_='unique')
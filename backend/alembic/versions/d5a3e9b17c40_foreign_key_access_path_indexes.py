@@ -0,0 +1,45 @@
+"""foreign key access path indexes
+
+Revision ID: d5a3e9b17c40
+Revises: c2f87a1e4b93
+Create Date: 2026-10-18 15:02:27.641905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a3e9b17c40'
+down_revision: Union[str, None] = 'c2f87a1e4b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_jobs_posted_by_id_created_at', 'jobs', ['posted_by_id', 'created_at']),
+    ('ix_job_applications_job_id_created_at_id', 'job_applications', ['job_id', 'created_at', 'id']),
+    (
+        'ix_job_applications_applicant_id_created_at_id', 'job_applications',
+        ['applicant_id', 'created_at', 'id'],
+    ),
+    ('ix_interviews_application_id_scheduled_at', 'interviews', ['application_id', 'scheduled_at']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction. A build that fails part
+    # way leaves an INVALID index behind; drop it and rerun the upgrade.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=False, if_not_exists=True, postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -1,5 +1,3 @@
 """FastAPI React Starter Application"""
 
-from .main import app
-
 __version__ = "1.0.0"
@@ -1,11 +1,8 @@
-import os
 from pathlib import Path
 from functools import lru_cache
-from typing import Optional, List
+from typing import Literal, Optional, List
+from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 class Settings(BaseSettings):
@@ -31,17 +28,74 @@ class Settings(BaseSettings):
     DB_PASSWORD: Optional[str] = None
     DB_HOST: Optional[str] = None
     DB_PORT: Optional[int] = None
-    DB_POOL_SIZE: int = 20
+    DB_POOL_SIZE: int = 20  # Per process; `manage.py serve` derives it from DB_CONNECTION_BUDGET
     DB_MAX_OVERFLOW: int = 10
     DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
     DB_ECHO: bool = False
-    DB_SSL_MODE: Optional[str] = None
+    DB_SSL_MODE: Optional[str] = None  # disable, allow, prefer, require, verify-ca, verify-full
+    DB_STATEMENT_CACHE_SIZE: int = 100  # Set to 0 behind PgBouncer transaction pooling
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None  # Server-side statement_timeout
+    DB_CONNECTION_BUDGET: Optional[int] = None  # Connections all server workers may open per database
+    # Startup schema work: create_all (development), alembic (check the migrated revision only) or skip
+    DB_SCHEMA_MODE: Literal["create_all", "alembic", "skip"] = "create_all"
+
+    # Read replica settings
+    DB_REPLICA_URLS: List[str] = []  # postgresql+asyncpg:// URLs of streaming replicas
+    DB_REPLICA_LAG_TOLERANCE_SECONDS: float = 5.0  # Reads stay on the primary this long after a write
+    DB_REPLICA_RETRY_SECONDS: float = 30.0  # How long a failed replica stays out of rotation
+
+    # Pagination settings
+    JOBS_PAGE_SIZE: int = 20
+    JOBS_MAX_PAGE_SIZE: int = 100
+    APPLICATIONS_PAGE_SIZE: int = 50
+    APPLICATIONS_MAX_PAGE_SIZE: int = 500
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched from the cursor and written per chunk
+
+    # Cache settings
+    CACHE_URL: Optional[str] = None  # e.g. redis://localhost:6379/0; in-process when unset
+    USER_CACHE_TTL: int = 60
+    USER_CACHE_MAXSIZE: int = 10000
+    JOB_FEED_CACHE_TTL: float = 5.0  # Seconds; 0 disables. Bounds staleness in other workers without CACHE_URL
+    JOB_FEED_CACHE_MAXSIZE: int = 1000  # Cached feed pages (filter/cursor combinations)
+    APPLIED_JOBS_CACHE_TTL: int = 300  # Per-applicant set of applied job IDs, with CACHE_URL
+    APPLIED_JOBS_LOCAL_CACHE_TTL: float = 5.0  # Without CACHE_URL; bounds staleness in other workers
+    APPLIED_JOBS_CACHE_MAXSIZE: int = 10000
 
     # JWT Settings
-    SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "secret-key-for-development")
+    SECRET_KEY: str = Field(
+        "secret-key-for-development", validation_alias=AliasChoices("SECRET_KEY", "JWT_SECRET_KEY")
+    )
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Password hashing settings
+    BCRYPT_ROUNDS: int = 12  # Changing this rehashes passwords on next login
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 100
+
+    # Response compression settings
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # Bytes; 0 disables compression
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4  # Used when the brotli package is installed
+
+    # Logging settings. Records are handed to a background thread that formats
+    # and writes them; when its queue is full, "drop" discards the record and
+    # "block" waits up to LOG_QUEUE_BLOCK_TIMEOUT seconds before dropping it.
+    LOG_QUEUE: Optional[bool] = None  # Overrides the environment's default when set
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_QUEUE_POLICY: Literal["drop", "block"] = "drop"
+    LOG_QUEUE_BLOCK_TIMEOUT: float = 0.05
+    LOG_DEBUG_SAMPLE_EVERY: int = 1  # Keep one in every N DEBUG records per call site
+
+    # Metrics settings
+    METRICS_ENABLED: bool = True  # Per-route metrics at /api/metrics and Server-Timing headers
+
+    # Query profiler settings (development aid; adds overhead to every statement)
+    QUERY_PROFILER_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: int = 200  # Logged with EXPLAIN output on PostgreSQL
+    N_PLUS_ONE_THRESHOLD: int = 5  # Same statement this many times in one request
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -59,19 +113,33 @@ LOGGING_CONFIG = {
     "development": {
         "log_level": "DEBUG",
         "log_dir": BASE_DIR / "logs" / "dev",
+        "queue": True,
     },
     "production": {
         "log_level": "INFO",
         "log_dir": BASE_DIR / "logs" / "prod",
+        "queue": True,
     },
     "testing": {
         "log_level": "DEBUG",
         "log_dir": None,  # Console only
+        "queue": False,  # Write synchronously so test output stays ordered
     },
 }
 
-ENVIRONMENT = os.getenv("ENVIRONMENT", "development").lower()
+# Settings (including the .env file) are read once, here, by pydantic-settings
+_settings = get_settings()
+
+ENVIRONMENT = _settings.ENVIRONMENT.lower()
 # Ensure environment is one of the defined keys, default to development if not
 if ENVIRONMENT not in LOGGING_CONFIG:
     ENVIRONMENT = "development"
-CURRENT_LOGGING_CONFIG = LOGGING_CONFIG[ENVIRONMENT]
+CURRENT_LOGGING_CONFIG = dict(LOGGING_CONFIG[ENVIRONMENT])
+if _settings.LOG_QUEUE is not None:
+    CURRENT_LOGGING_CONFIG["queue"] = _settings.LOG_QUEUE
+CURRENT_LOGGING_CONFIG.update(
+    queue_size=_settings.LOG_QUEUE_SIZE,
+    queue_policy=_settings.LOG_QUEUE_POLICY,
+    queue_block_timeout=_settings.LOG_QUEUE_BLOCK_TIMEOUT,
+    debug_sample_every=max(1, _settings.LOG_DEBUG_SAMPLE_EVERY),
+)
@@ -1,14 +1,31 @@
 """Database Configuration and Models"""
 
-from .database import Base, get_db, init_db, get_database_url, engine, create_engine_with_retry
+from .database import (
+    Base,
+    get_db,
+    get_read_db,
+    init_db,
+    get_database_url,
+    get_engine,
+    create_engine_with_retry,
+)
 from .models import User
+from . import rollups  # noqa: F401  registers rollup maintenance hooks
 
 __all__ = [
     "Base",
     "get_db",
+    "get_read_db",
     "init_db",
     "get_database_url",
-    "engine",
+    "get_engine",
     "create_engine_with_retry",
     "User",
 ]
+
+
+def __getattr__(name: str):
+    # The engine is created lazily; see app.db.database.init_engines
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
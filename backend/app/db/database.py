@@ -1,7 +1,15 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+import hashlib
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+from fastapi import Request
+from sqlalchemy import event, exc, make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Session
 from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.utils.cache import create_cache
 from app.utils.logger import setup_logger
+from app.utils.metrics import Histogram, instrument_engine, startup_timings
 from app.config import get_settings
 from urllib.parse import quote_plus
 
@@ -26,39 +34,100 @@ def get_database_url() -> str:
     raise ValueError("No database URL found")
 
 
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long checkouts wait for a connection and
+    how many give up with a pool timeout.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_time = Histogram()
+        self.checkout_timeouts = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        self.wait_time.observe(time.perf_counter() - started)
+        return connection
+
+
+# SQLAlchemy logs pool activity under "<module>.<class>", which would otherwise
+# inherit this module's DEBUG level and log every checkout
+logging.getLogger(f"{__name__}.{InstrumentedAsyncQueuePool.__name__}").setLevel(logging.WARNING)
+
+
+def pool_size_for_budget(budget: int, workers: int) -> Tuple[int, int]:
+    """
+    Split a global connection budget across worker processes.
+
+    Returns (pool_size, max_overflow) for each worker so that all workers
+    together never open more than `budget` connections to one database.
+    """
+    per_worker = budget // workers
+    if per_worker < 1:
+        raise ValueError(f"A budget of {budget} connections cannot serve {workers} workers")
+    overflow = per_worker // 4
+    return per_worker - overflow, overflow
+
+
 def create_engine_with_retry(database_url: str):
     """
     Creates an async engine with retry logic and appropriate configuration
-    based on the database type.
+    based on the database type. Pool sizing, SSL and statement settings come
+    from the DB_* settings.
     """
     connect_args = {}
     pooling_args = {
         "pool_pre_ping": True,
-        "pool_recycle": 3600,
-        "echo": False,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "echo": settings.DB_ECHO,
     }
 
     if database_url.startswith("sqlite"):
         connect_args["check_same_thread"] = False
+        if ":memory:" not in database_url and not database_url.endswith("://"):
+            pooling_args["poolclass"] = InstrumentedAsyncQueuePool
     else:
         pooling_args.update(
             {
-                "poolclass": AsyncAdaptedQueuePool,
-                "pool_size": 20,
-                "max_overflow": 10,
-                "pool_timeout": 30,
+                "poolclass": InstrumentedAsyncQueuePool,
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_timeout": settings.DB_POOL_TIMEOUT,
             }
         )
+        if database_url.startswith("postgresql+asyncpg"):
+            if settings.DB_SSL_MODE:
+                connect_args["ssl"] = settings.DB_SSL_MODE
+            # asyncpg's own cache and SQLAlchemy's adapter cache; set both to 0
+            # behind PgBouncer in transaction pooling mode
+            connect_args["statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
+            database_url = make_url(database_url).update_query_dict(
+                {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+            )
+            if settings.DB_STATEMENT_TIMEOUT_MS:
+                connect_args["server_settings"] = {
+                    "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)
+                }
 
     return create_async_engine(database_url, connect_args=connect_args, **pooling_args)
 
 
-# Create the engine
-engine = create_engine_with_retry(get_database_url())
+class LazyBindSessionMaker(async_sessionmaker):
+    """Session factory that binds to the primary engine when first called."""
+
+    def __call__(self, **local_kw) -> AsyncSession:
+        local_kw.setdefault("bind", get_engine())
+        return super().__call__(**local_kw)
+
 
 # Create async session maker
-AsyncSessionLocal = async_sessionmaker(
-    engine,
+AsyncSessionLocal = LazyBindSessionMaker(
     class_=AsyncSession,
     expire_on_commit=False,
     autocommit=False,
@@ -66,11 +135,167 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+class ReplicaRouter:
+    """
+    Round-robin selection of read replicas with primary fallback.
+
+    A replica that fails to connect or drops its connection is taken out of
+    rotation for `retry_after` seconds; with no healthy replica, reads go to
+    the primary.
+    """
+
+    def __init__(self, primary: AsyncEngine, replicas: List[AsyncEngine], retry_after: float):
+        self.primary = primary
+        self.replicas = replicas
+        self.retry_after = retry_after
+        self._down_until = [0.0] * len(replicas)
+        self._next = 0
+        for index, replica in enumerate(replicas):
+            event.listen(replica.sync_engine, "handle_error", self._error_handler(index))
+
+    def _error_handler(self, index: int):
+        def _on_error(context):
+            if context.is_disconnect or context.connection is None:
+                self.mark_down(index)
+        return _on_error
+
+    def mark_down(self, index: int) -> None:
+        logger.warning(f"Read replica {index} unavailable, routing reads to primary")
+        self._down_until[index] = time.monotonic() + self.retry_after
+
+    def pick(self) -> AsyncEngine:
+        now = time.monotonic()
+        for _ in range(len(self.replicas)):
+            index = self._next
+            self._next = (self._next + 1) % len(self.replicas)
+            if self._down_until[index] <= now:
+                return self.replicas[index]
+        return self.primary
+
+
+_engine: Optional[AsyncEngine] = None
+_replica_router: Optional[ReplicaRouter] = None
+
+
+def init_engines() -> AsyncEngine:
+    """
+    Create the primary and replica engines. Called from the app lifespan so
+    importing the app stays cheap; anything that needs an engine earlier
+    (CLI commands, tests) creates it on first use through get_engine().
+    """
+    global _engine, _replica_router
+    if _engine is None:
+        with startup_timings.phase("engine"):
+            primary = create_engine_with_retry(get_database_url())
+            instrument_engine(primary)
+            replicas = [create_engine_with_retry(url) for url in settings.DB_REPLICA_URLS]
+            for replica in replicas:
+                instrument_engine(replica)
+            _replica_router = ReplicaRouter(
+                primary, replicas, retry_after=settings.DB_REPLICA_RETRY_SECONDS
+            )
+            _engine = primary
+    return _engine
+
+
+def get_engine() -> AsyncEngine:
+    """The primary engine, created on first use."""
+    return _engine or init_engines()
+
+
+def get_replica_router() -> ReplicaRouter:
+    """The read replica router, created along with the primary engine."""
+    init_engines()
+    return _replica_router
+
+
+def __getattr__(name: str):
+    # `engine` and `replica_router` stay importable by name; importing them
+    # creates the engines
+    if name == "engine":
+        return get_engine()
+    if name == "replica_router":
+        return get_replica_router()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Clients that wrote recently read from the primary until replicas catch up.
+# Shared across workers when CACHE_URL is configured.
+recent_writers = create_cache(
+    "recent-writers", ttl=settings.DB_REPLICA_LAG_TOLERANCE_SECONDS, maxsize=100000
+)
+
+
+def _client_key(request: Request) -> Optional[str]:
+    """Identify a client by its bearer token without decoding it."""
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return None
+    return hashlib.sha1(authorization.encode("utf-8")).hexdigest()
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_session_wrote(session, flush_context):
+    session.info["wrote"] = True
+
+
+class ReadOnlySession(Session):
+    """
+    Session for read-only requests. Any attempt to flush changes is rejected;
+    on PostgreSQL its transactions also begin READ ONLY (see ReadOnlySessionMaker).
+    """
+
+
+@event.listens_for(ReadOnlySession, "before_flush")
+def _reject_writes(session, flush_context, instances):
+    if session.new or session.dirty or session.deleted:
+        raise RuntimeError("Attempted to write through a read-only database session")
+
+
+_read_only_engines: Dict[AsyncEngine, AsyncEngine] = {}
+
+
+def read_only_engine(db_engine: AsyncEngine) -> AsyncEngine:
+    """
+    A view of `db_engine` whose PostgreSQL transactions are opened with
+    BEGIN READ ONLY. It shares the engine's pool; asyncpg sends the access
+    mode with the BEGIN itself, so no extra round-trip is made.
+    """
+    if (
+        db_engine.dialect.name != "postgresql"
+        or db_engine.get_execution_options().get("postgresql_readonly")
+    ):
+        return db_engine
+    read_only = _read_only_engines.get(db_engine)
+    if read_only is None:
+        read_only = db_engine.execution_options(postgresql_readonly=True)
+        _read_only_engines[db_engine] = read_only
+    return read_only
+
+
+class ReadOnlySessionMaker(LazyBindSessionMaker):
+    """Session factory for reads, bound to the read-only view of its engine."""
+
+    def __call__(self, **local_kw) -> AsyncSession:
+        local_kw["bind"] = read_only_engine(local_kw.get("bind") or get_engine())
+        return super().__call__(**local_kw)
+
+
+# Separate session maker for read-only dependencies so reads can be routed
+# independently of writes
+AsyncReadSessionLocal = ReadOnlySessionMaker(
+    class_=AsyncSession,
+    sync_session_class=ReadOnlySession,
+    expire_on_commit=False,
+    autoflush=False
+)
+
+
 class Base(DeclarativeBase):
     pass
 
 
-async def get_db() -> AsyncSession:
+async def get_db(request: Request) -> AsyncSession:
     """
     Dependency that provides a database session.
     Ensures proper handling of connections and error cases.
@@ -80,6 +305,11 @@ async def get_db() -> AsyncSession:
         try:
             yield session
             await session.commit()
+            if session.info.get("wrote") and get_replica_router().replicas:
+                # Read-your-own-writes: pin this client's reads to the primary
+                client_key = _client_key(request)
+                if client_key:
+                    await recent_writers.set(client_key, True)
         except Exception as e:
             logger.error(f"Database session error: {str(e)}")
             await session.rollback()
@@ -88,15 +318,157 @@ async def get_db() -> AsyncSession:
             logger.debug("Closing database session")
 
 
+async def get_read_engine(request: Request) -> AsyncEngine:
+    """Pick the engine for a read: a healthy replica unless the client just wrote."""
+    replica_router = get_replica_router()
+    if not replica_router.replicas:
+        return replica_router.primary
+    client_key = _client_key(request)
+    if client_key and await recent_writers.get(client_key):
+        return replica_router.primary
+    return replica_router.pick()
+
+
+async def get_read_db(request: Request) -> AsyncSession:
+    """
+    Dependency that provides a read-only database session.
+    Never commits; the transaction is rolled back when the session closes.
+    Use it for GET endpoints and other handlers that only read. Routed to
+    a read replica when DB_REPLICA_URLS is configured.
+    """
+    bind = await get_read_engine(request)
+    async with AsyncReadSessionLocal(bind=bind) as session:
+        yield session
+
+
+def _pool_stats(name: str, db_engine: AsyncEngine) -> dict:
+    pool = db_engine.pool
+    stats = {"name": name, "pool": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "timeout_seconds": pool.timeout(),
+            }
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        stats["checkout_timeouts"] = pool.checkout_timeouts
+        stats["checkout_wait"] = pool.wait_time.snapshot()
+    return stats
+
+
+def get_pool_stats() -> List[dict]:
+    """Connection pool usage for the primary and each replica engine."""
+    replica_router = get_replica_router()
+    stats = [_pool_stats("primary", replica_router.primary)]
+    for index, replica in enumerate(replica_router.replicas):
+        stats.append(_pool_stats(f"replica-{index}", replica))
+    return stats
+
+
+async def dispose_engines() -> None:
+    """Close the connection pools of the primary and every replica."""
+    if _engine is None:
+        return
+    await _engine.dispose()
+    for replica in _replica_router.replicas:
+        await replica.dispose()
+
+
+async def check_db() -> bool:
+    """Whether the primary database answers a trivial query."""
+    try:
+        async with get_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return True
+    except Exception as e:
+        logger.warning(f"Database readiness check failed: {str(e)}")
+        return False
+
+
+# Alembic head this code expects. Bump it with every new migration;
+# tests/unit/test_database.py fails while it lags behind alembic/versions.
+SCHEMA_REVISION = "d5a3e9b17c40"
+
+
+async def check_schema_revision(db_engine: Optional[AsyncEngine] = None) -> Optional[str]:
+    """
+    Compare the database's Alembic revision with SCHEMA_REVISION in one query.
+
+    A database that has never been migrated refuses startup. A different
+    revision only logs a warning: during a rolling deploy, old and new
+    workers legitimately run against the same schema.
+
+    Returns:
+        The revision stored in the database
+    """
+    try:
+        async with (db_engine or get_engine()).connect() as conn:
+            revision = (
+                await conn.execute(text("SELECT version_num FROM alembic_version"))
+            ).scalar_one_or_none()
+    except exc.DBAPIError as e:
+        raise RuntimeError(
+            "Database schema is not under Alembic control; run `alembic upgrade head`"
+        ) from e
+    if revision is None:
+        raise RuntimeError("Database has no Alembic revision; run `alembic upgrade head`")
+    if revision != SCHEMA_REVISION:
+        logger.warning(
+            f"Database schema revision {revision} differs from the expected {SCHEMA_REVISION}"
+        )
+    return revision
+
+
+# Generated full-text column behind /jobs/search on PostgreSQL. Migration
+# 5e07c4d9b2a1 adds it for alembic-managed databases; it is not mapped on the
+# Job model, so create_all needs this to match.
+SEARCH_VECTOR_DDL = (
+    """
+    ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(company_name, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(requirements, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING gin (search_vector)",
+)
+
+
+def create_search_vector(connection) -> None:
+    """Add jobs.search_vector and its GIN index on PostgreSQL (no-op elsewhere)."""
+    if connection.dialect.name != "postgresql":
+        return
+    for statement in SEARCH_VECTOR_DDL:
+        connection.exec_driver_sql(statement)
+
+
 async def init_db() -> None:
     """
     Initialize database tables and perform any startup database operations.
-    Includes retry logic for initial connection.
+
+    DB_SCHEMA_MODE selects the work done: "create_all" creates missing tables
+    (reflecting every table), "alembic" only checks the stored migration
+    revision, and "skip" just checks the database answers.
     """
-    logger.info("Initializing database")
+    logger.info(f"Initializing database (schema mode: {settings.DB_SCHEMA_MODE})")
     try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        with startup_timings.phase("db_check"):
+            if settings.DB_SCHEMA_MODE == "create_all":
+                async with get_engine().begin() as conn:
+                    await conn.run_sync(Base.metadata.create_all)
+                    await conn.run_sync(create_search_vector)
+            elif settings.DB_SCHEMA_MODE == "alembic":
+                await check_schema_revision()
+            else:
+                async with get_engine().connect() as conn:
+                    await conn.execute(text("SELECT 1"))
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Error initializing database: {str(e)}")
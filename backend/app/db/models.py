@@ -1,14 +1,13 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Float
-from sqlalchemy.sql import func
+from sqlalchemy import (
+    Column, Integer, String, Boolean, Date, DateTime, ForeignKey, Text, Float, Index, UniqueConstraint
+)
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from .database import Base
-from passlib.context import CryptContext
+from app.utils.passwords import get_pwd_context, hash_password, verify_and_update_password
 import secrets
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
 class User(Base):
     __tablename__ = "users"
 
@@ -27,11 +26,25 @@ class User(Base):
 
     def verify_password(self, password: str) -> bool:
         """Check if a plain password matches the hashed password."""
-        return pwd_context.verify(password, self.hashed_password)
+        return get_pwd_context().verify(password, self.hashed_password)
 
     def set_password(self, password: str):
         """Hash and store a password."""
-        self.hashed_password = pwd_context.hash(password)
+        self.hashed_password = get_pwd_context().hash(password)
+
+    async def verify_password_async(self, password: str) -> bool:
+        """
+        Check a password on the hashing pool without blocking the event loop.
+        Upgrades the stored hash when the configured cost factor has changed.
+        """
+        matches, new_hash = await verify_and_update_password(password, self.hashed_password)
+        if matches and new_hash:
+            self.hashed_password = new_hash
+        return matches
+
+    async def set_password_async(self, password: str):
+        """Hash and store a password on the hashing pool."""
+        self.hashed_password = await hash_password(password)
 
     def generate_reset_token(self):
         """Generate a secure reset token."""
@@ -64,6 +77,42 @@ class Job(Base):
     # Relationship to get the user who posted the job
     posted_by = relationship("User", backref="posted_jobs")
     
+    # Partial indexes backing the paginated active-jobs feed and its filters
+    __table_args__ = (
+        Index(
+            "ix_jobs_active_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+        Index(
+            "ix_jobs_active_location_created_at_id",
+            "location",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+        Index(
+            "ix_jobs_active_employment_type_created_at_id",
+            "employment_type",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+        Index(
+            "ix_jobs_active_salary_range",
+            "salary_min",
+            "salary_max",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+        # An employer's own postings, newest first
+        Index("ix_jobs_posted_by_id_created_at", "posted_by_id", "created_at"),
+    )
+
     def __repr__(self):
         return f"<Job {self.title} at {self.company_name}>"
 
@@ -95,6 +144,16 @@ class JobApplication(Base):
     job = relationship("Job", backref="applications")
     applicant = relationship("User", backref="job_applications")
     interviews = relationship("Interview", back_populates="application")
+
+    # One application per applicant per job, enforced by the database
+    __table_args__ = (
+        UniqueConstraint("job_id", "applicant_id", name="uq_job_applications_job_applicant"),
+        # Per-job and per-applicant listings, keyset-paginated on (created_at, id)
+        Index("ix_job_applications_job_id_created_at_id", "job_id", "created_at", "id"),
+        Index("ix_job_applications_applicant_id_created_at_id", "applicant_id", "created_at", "id"),
+    )
+    # Fetch server-generated timestamps in the INSERT (RETURNING) instead of a re-select
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self):
         return f"<JobApplication {self.applicant_id} for Job {self.job_id}>"
@@ -119,6 +178,33 @@ class Interview(Base):
     
     # Relationships
     application = relationship("JobApplication", back_populates="interviews")
-    
+
+    __table_args__ = (
+        Index("ix_interviews_application_id_scheduled_at", "application_id", "scheduled_at"),
+    )
+
     def __repr__(self):
         return f"<Interview for Application {self.application_id} at {self.scheduled_at}>"
+
+
+class ApplicationDailyCount(Base):
+    """
+    Rollup of applications per job, creation day and current status.
+    Maintained incrementally by app.db.rollups; rebuild with `manage.py rebuild-rollups`.
+    """
+    __tablename__ = "application_daily_counts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    employer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+    status = Column(String, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("job_id", "day", "status", name="uq_application_daily_counts_job_day_status"),
+        Index("ix_application_daily_counts_employer_day", "employer_id", "day"),
+    )
+
+    def __repr__(self):
+        return f"<ApplicationDailyCount job={self.job_id} {self.day} {self.status}={self.count}>"
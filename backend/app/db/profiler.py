@@ -0,0 +1,177 @@
+"""Opt-in query profiler: slow-query log, per-request statement counts and N+1 detection."""
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+from app.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger(__name__)
+
+
+class QueryRecord:
+    """One executed statement: SQL text, parameter shape and duration."""
+
+    __slots__ = ("statement", "parameters", "duration")
+
+    def __init__(self, statement: str, parameters: str, duration: float):
+        self.statement = statement
+        self.parameters = parameters
+        self.duration = duration
+
+
+class QueryProfile:
+    """
+    Statements executed while the profile is active.
+
+    Profiles nest: statements are recorded in the innermost profile and
+    every profile enclosing it.
+    """
+
+    def __init__(self, label: str = "", parent: Optional["QueryProfile"] = None):
+        self.label = label
+        self.parent = parent
+        self.queries: List[QueryRecord] = []
+
+    def record(self, query: QueryRecord) -> None:
+        self.queries.append(query)
+        if self.parent is not None:
+            self.parent.record(query)
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(query.duration for query in self.queries)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed at least `threshold` times, most repeated first."""
+        counts = Counter(query.statement for query in self.queries)
+        return [(statement, n) for statement, n in counts.most_common() if n >= threshold]
+
+    def report(self) -> str:
+        lines = [f"{self.count} queries in {self.total_seconds * 1000:.1f} ms"]
+        for index, query in enumerate(self.queries, 1):
+            statement = " ".join(query.statement.split())
+            lines.append(
+                f"{index:>3}. [{query.duration * 1000:.1f} ms] {statement} {query.parameters}"
+            )
+        return "\n".join(lines)
+
+
+_active_profile: ContextVar[Optional[QueryProfile]] = ContextVar("query_profile", default=None)
+
+
+@contextmanager
+def profile_queries(label: str = ""):
+    """Record every statement executed in this context (including awaited calls)."""
+    profile = QueryProfile(label, parent=_active_profile.get())
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+
+
+def _parameter_shape(parameters, executemany: bool) -> str:
+    """Describe parameters without their values, which may hold personal data."""
+    if executemany:
+        rows = list(parameters or ())
+        return f"{len(rows)} x {_parameter_shape(rows[0], False)}" if rows else "[]"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(sorted(map(str, parameters))) + "}"
+    if parameters:
+        return f"({len(parameters)} positional)"
+    return "()"
+
+
+def _explain(conn, statement: str, parameters) -> Optional[str]:
+    """EXPLAIN a slow SELECT on PostgreSQL inside a savepoint."""
+    if conn.dialect.name != "postgresql":
+        return None
+    if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return None
+    conn.info["profiler_explaining"] = True
+    try:
+        conn.exec_driver_sql("SAVEPOINT query_profiler_explain")
+        try:
+            rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).fetchall()
+        except Exception as e:
+            conn.exec_driver_sql("ROLLBACK TO SAVEPOINT query_profiler_explain")
+            return f"EXPLAIN failed: {e}"
+        conn.exec_driver_sql("RELEASE SAVEPOINT query_profiler_explain")
+        return "\n".join(row[0] for row in rows)
+    except Exception as e:
+        return f"EXPLAIN failed: {e}"
+    finally:
+        conn.info.pop("profiler_explaining", None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not conn.info.get("profiler_explaining"):
+        context._profiler_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_profiler_started", None)
+    if conn.info.get("profiler_explaining") or started is None:
+        return
+    duration = time.perf_counter() - started
+    shape = _parameter_shape(parameters, executemany)
+
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.record(QueryRecord(statement, shape, duration))
+
+    if duration * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+        message = f"Slow query ({duration * 1000:.1f} ms): {statement} {shape}"
+        plan = _explain(conn, statement, parameters)
+        if plan:
+            message += f"\n{plan}"
+        logger.warning(message)
+
+
+def install_query_profiler() -> None:
+    """Hook the profiler into every engine. Safe to call more than once."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryProfilerMiddleware:
+    """
+    ASGI middleware profiling each request: logs its statement count and
+    warns about statements repeated N_PLUS_ONE_THRESHOLD or more times.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        install_query_profiler()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries(scope["path"]) as profile:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                route = getattr(scope.get("route"), "path", scope["path"])
+                endpoint = f"{scope['method']} {route}"
+                logger.debug(
+                    f"{endpoint}: {profile.count} queries in {profile.total_seconds * 1000:.1f} ms"
+                )
+                for statement, count in profile.repeated(settings.N_PLUS_ONE_THRESHOLD):
+                    logger.warning(
+                        f"Possible N+1 on {endpoint}: executed {count} times: {' '.join(statement.split())}"
+                    )
@@ -0,0 +1,108 @@
+"""Incremental maintenance of the application_daily_counts rollup table."""
+
+from typing import Optional
+
+from sqlalchemy import delete, event, func, insert, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from .models import ApplicationDailyCount, Job, JobApplication
+
+DEFAULT_STATUS = "applied"
+
+
+def _status_value(value) -> str:
+    # Services assign both plain strings and ApplicationStatus members
+    return getattr(value, "value", value) or DEFAULT_STATUS
+
+
+def _bump(connection, job_id: int, application_id: int, status: str, delta: int) -> None:
+    """Add `delta` to the rollup row for an application's job, creation day and status."""
+    employer_id = select(Job.posted_by_id).where(Job.id == job_id).scalar_subquery()
+    day = (
+        select(func.date(JobApplication.created_at))
+        .where(JobApplication.id == application_id)
+        .scalar_subquery()
+    )
+    values = dict(employer_id=employer_id, job_id=job_id, day=day, status=status, count=delta)
+
+    dialect = connection.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = dialect_insert(ApplicationDailyCount).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["job_id", "day", "status"],
+            set_={"count": ApplicationDailyCount.count + delta},
+        )
+        connection.execute(stmt)
+        return
+
+    result = connection.execute(
+        update(ApplicationDailyCount)
+        .where(
+            ApplicationDailyCount.job_id == job_id,
+            ApplicationDailyCount.day == day,
+            ApplicationDailyCount.status == status,
+        )
+        .values(count=ApplicationDailyCount.count + delta)
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(ApplicationDailyCount).values(**values))
+
+
+@event.listens_for(JobApplication, "after_insert")
+def _count_new_application(mapper, connection, target):
+    _bump(connection, target.job_id, target.id, _status_value(target.status), 1)
+
+
+@event.listens_for(JobApplication, "after_update")
+def _move_application_status(mapper, connection, target):
+    history = inspect(target).attrs.status.history
+    if not history.deleted:
+        return
+    old_status = _status_value(history.deleted[0])
+    new_status = _status_value(target.status)
+    if old_status == new_status:
+        return
+    _bump(connection, target.job_id, target.id, old_status, -1)
+    _bump(connection, target.job_id, target.id, new_status, 1)
+
+
+@event.listens_for(JobApplication, "before_delete")
+def _uncount_application(mapper, connection, target):
+    # before_delete so the creation day can still be read from the row
+    _bump(connection, target.job_id, target.id, _status_value(target.status), -1)
+
+
+async def rebuild_application_rollups(session, job_id: Optional[int] = None) -> int:
+    """
+    Recompute rollup rows from job_applications, for every job or just one.
+    Returns the number of rollup rows written. The caller commits.
+    """
+    clear = delete(ApplicationDailyCount)
+    source = (
+        select(
+            Job.posted_by_id,
+            JobApplication.job_id,
+            func.date(JobApplication.created_at),
+            func.coalesce(JobApplication.status, DEFAULT_STATUS),
+            func.count(JobApplication.id),
+        )
+        .join(Job, Job.id == JobApplication.job_id)
+        .group_by(
+            Job.posted_by_id,
+            JobApplication.job_id,
+            func.date(JobApplication.created_at),
+            func.coalesce(JobApplication.status, DEFAULT_STATUS),
+        )
+    )
+    if job_id is not None:
+        clear = clear.where(ApplicationDailyCount.job_id == job_id)
+        source = source.where(JobApplication.job_id == job_id)
+
+    await session.execute(clear)
+    result = await session.execute(
+        insert(ApplicationDailyCount).from_select(
+            ["employer_id", "job_id", "day", "status", "count"], source
+        )
+    )
+    return result.rowcount
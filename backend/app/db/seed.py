@@ -0,0 +1,429 @@
+"""Synthetic dataset generation for benchmarks and local profiling."""
+
+import asyncio
+import random
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.utils.passwords import get_pwd_context
+
+from .models import Interview, Job, JobApplication, User
+from .rollups import rebuild_application_rollups
+
+# Every seeded account uses this password so benchmarks can log in
+SEED_PASSWORD = "seed-password"
+SEED_EMAIL_DOMAIN = "seed.example.com"
+
+
+@dataclass(frozen=True)
+class Scale:
+    users: int
+    jobs: int
+    applications: int
+    interviews: int
+
+
+# Named after the number of applications, the largest table
+SCALES: Dict[str, Scale] = {
+    "10k": Scale(users=2_000, jobs=1_000, applications=10_000, interviews=2_000),
+    "100k": Scale(users=20_000, jobs=10_000, applications=100_000, interviews=20_000),
+    "1m": Scale(users=200_000, jobs=100_000, applications=1_000_000, interviews=200_000),
+}
+
+EMPLOYER_SHARE = 0.1
+CLOSED_JOB_SHARE = 0.15
+
+TITLES = [
+    "Software Engineer",
+    "Senior Software Engineer",
+    "Data Analyst",
+    "Data Scientist",
+    "Product Manager",
+    "UX Designer",
+    "DevOps Engineer",
+    "QA Engineer",
+    "Frontend Developer",
+    "Backend Developer",
+    "Machine Learning Engineer",
+    "Technical Writer",
+    "Support Engineer",
+    "Sales Associate",
+    "Marketing Specialist",
+    "Accountant",
+    "HR Generalist",
+    "Nurse",
+    "Warehouse Associate",
+    "Customer Success Manager",
+]
+COMPANIES = [
+    "Acme",
+    "Globex",
+    "Initech",
+    "Umbrella",
+    "Hooli",
+    "Stark Industries",
+    "Wayne Enterprises",
+    "Wonka",
+    "Cyberdyne",
+    "Soylent",
+    "Tyrell",
+    "Aperture",
+    "Vandelay",
+    "Massive Dynamic",
+]
+LOCATIONS = [
+    "Remote",
+    "New York, NY",
+    "San Francisco, CA",
+    "Austin, TX",
+    "Seattle, WA",
+    "Chicago, IL",
+    "Boston, MA",
+    "Denver, CO",
+    "Atlanta, GA",
+    "Toronto, ON",
+    "London, UK",
+    "Berlin, DE",
+]
+EMPLOYMENT_TYPES = ["full-time", "part-time", "contract", "internship"]
+EMPLOYMENT_TYPE_WEIGHTS = [60, 15, 20, 5]
+SKILLS = [
+    "Python",
+    "SQL",
+    "FastAPI",
+    "React",
+    "TypeScript",
+    "PostgreSQL",
+    "Docker",
+    "Kubernetes",
+    "AWS",
+    "communication",
+    "Excel",
+    "customer service",
+    "leadership",
+    "statistics",
+]
+APPLICATION_STATUSES = [
+    "applied",
+    "under_review",
+    "interview_scheduled",
+    "interview_completed",
+    "rejected",
+    "offer_extended",
+    "offer_accepted",
+]
+APPLICATION_STATUS_WEIGHTS = [50, 20, 10, 5, 10, 3, 2]
+INTERVIEW_TYPES = ["technical", "behavioral", "hr", "onsite"]
+INTERVIEW_STATUSES = ["scheduled", "completed", "cancelled", "rescheduled"]
+INTERVIEW_STATUS_WEIGHTS = [40, 45, 10, 5]
+
+
+def seed_email(user_id: int) -> str:
+    return f"user{user_id}@{SEED_EMAIL_DOMAIN}"
+
+
+class DatasetGenerator:
+    """
+    Deterministic row generator for users, jobs, applications and interviews.
+
+    Ids are assigned explicitly, continuing after `id_offsets`, so related
+    rows can reference each other without reading anything back. Creation
+    times of jobs and applications are kept as compact arrays of seconds so
+    millions of rows can be generated as a stream.
+    """
+
+    def __init__(
+        self,
+        scale: Scale,
+        seed: int = 42,
+        id_offsets: Dict[str, int] = None,
+        password_hash: str = None,
+        now: datetime = None,
+    ):
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.offsets = id_offsets or {}
+        self.password_hash = password_hash or get_pwd_context().hash(SEED_PASSWORD)
+        self.now = (now or datetime.utcnow()).replace(microsecond=0)
+        self.n_employers = max(1, int(scale.users * EMPLOYER_SHARE))
+        self.n_seekers = max(1, scale.users - self.n_employers)
+        # Seconds before `now` each job / application was created
+        self._job_age = array("l")
+        self._application_age = array("l")
+
+    def _id(self, table: str, index: int) -> int:
+        return self.offsets.get(table, 0) + index + 1
+
+    def _days_ago(self, max_days: int) -> datetime:
+        return self.now - timedelta(seconds=self.rng.randint(0, max_days * 86400))
+
+    def _at(self, age: int) -> datetime:
+        return self.now - timedelta(seconds=age)
+
+    def employer_id(self, index: int) -> int:
+        return self._id("users", index)
+
+    def seeker_id(self, index: int) -> int:
+        return self._id("users", self.n_employers + index)
+
+    def users(self) -> Iterator[dict]:
+        for index in range(self.n_employers + self.n_seekers):
+            user_id = self._id("users", index)
+            created_at = self._days_ago(730)
+            yield {
+                "id": user_id,
+                "email": seed_email(user_id),
+                "username": f"user{user_id}",
+                "hashed_password": self.password_hash,
+                "role": "user",
+                "is_supervisor": index < self.n_employers,
+                "is_superuser": False,
+                "is_active": True,
+                "email_verified": self.rng.random() < 0.8,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def jobs(self) -> Iterator[dict]:
+        rng = self.rng
+        for index in range(self.scale.jobs):
+            # A few large employers post most of the jobs
+            employer = min(int(self.n_employers * rng.random() ** 3), self.n_employers - 1)
+            age = rng.randint(0, 180 * 86400)
+            self._job_age.append(age)
+            created_at = self._at(age)
+            salary_min = None
+            salary_max = None
+            if rng.random() < 0.8:
+                salary_min = float(rng.randrange(30_000, 150_000, 1_000))
+                salary_max = salary_min * rng.choice([1.1, 1.2, 1.3, 1.5])
+            skills = rng.sample(SKILLS, 3)
+            title = rng.choice(TITLES)
+            yield {
+                "id": self._id("jobs", index),
+                "title": title,
+                "company_name": rng.choice(COMPANIES),
+                "location": rng.choice(LOCATIONS),
+                "description": (
+                    f"We are hiring a {title} to join a growing team. "
+                    f"You will work with {skills[0]} and {skills[1]} every day. "
+                    "Competitive benefits and flexible hours."
+                ),
+                "requirements": ", ".join(skills),
+                "salary_min": salary_min,
+                "salary_max": salary_max,
+                "employment_type": rng.choices(EMPLOYMENT_TYPES, EMPLOYMENT_TYPE_WEIGHTS)[0],
+                "status": "closed" if rng.random() < CLOSED_JOB_SHARE else "active",
+                "created_at": created_at,
+                "updated_at": created_at,
+                "posted_by_id": self.employer_id(employer),
+            }
+
+    def applications(self) -> Iterator[dict]:
+        """Requires jobs() to have been consumed first (for creation dates)."""
+        rng = self.rng
+        n_jobs = len(self._job_age)
+        per_seeker = Counter(rng.randrange(self.n_seekers) for _ in range(self.scale.applications))
+        index = 0
+        for seeker in sorted(per_seeker):
+            chosen = set()
+            wanted = min(per_seeker[seeker], n_jobs // 2)
+            while len(chosen) < wanted:
+                # Skewed job popularity: low indexes attract most applications
+                chosen.add(int(n_jobs * rng.random() ** 2))
+            for job_index in sorted(chosen):
+                job_age = self._job_age[job_index]
+                age = max(job_age - rng.randint(0, 30 * 86400), 0)
+                self._application_age.append(age)
+                created_at = self._at(age)
+                yield {
+                    "id": self._id("job_applications", index),
+                    "job_id": self._id("jobs", job_index),
+                    "applicant_id": self.seeker_id(seeker),
+                    "cover_letter": (
+                        None if rng.random() < 0.5 else "I would love to join your team."
+                    ),
+                    "resume_url": f"https://{SEED_EMAIL_DOMAIN}/resumes/{seeker}.pdf",
+                    "status": rng.choices(APPLICATION_STATUSES, APPLICATION_STATUS_WEIGHTS)[0],
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+                index += 1
+
+    def interviews(self) -> Iterator[dict]:
+        """Requires applications() to have been consumed first."""
+        rng = self.rng
+        n_applications = len(self._application_age)
+        if not n_applications:
+            return
+        for index in range(self.scale.interviews):
+            application = rng.randrange(n_applications)
+            created_at = self._at(self._application_age[application])
+            yield {
+                "id": self._id("interviews", index),
+                "application_id": self._id("job_applications", application),
+                "scheduled_at": created_at
+                + timedelta(days=rng.randint(1, 21), hours=rng.randint(9, 17)),
+                "duration_minutes": rng.choice([30, 45, 60, 90]),
+                "location": None,
+                "meeting_link": f"https://meet.{SEED_EMAIL_DOMAIN}/{index}",
+                "interview_type": rng.choice(INTERVIEW_TYPES),
+                "notes": None,
+                "status": rng.choices(INTERVIEW_STATUSES, INTERVIEW_STATUS_WEIGHTS)[0],
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+
+def batched(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+SEEDED_TABLES = (User.__table__, Job.__table__, JobApplication.__table__, Interview.__table__)
+
+
+async def current_id_offsets(engine: AsyncEngine) -> Dict[str, int]:
+    """Highest existing id per seeded table, so new rows never collide."""
+    async with engine.connect() as conn:
+        return {
+            table.name: (
+                await conn.execute(select(func.coalesce(func.max(table.c.id), 0)))
+            ).scalar()
+            for table in SEEDED_TABLES
+        }
+
+
+async def reset_sequences(engine: AsyncEngine) -> None:
+    """Move PostgreSQL id sequences past explicitly inserted ids."""
+    if engine.dialect.name != "postgresql":
+        return
+    async with engine.begin() as conn:
+        for table in SEEDED_TABLES:
+            await conn.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                    f"COALESCE((SELECT MAX(id) FROM {table.name}), 0) + 1, false)"
+                )
+            )
+
+
+async def _copy_batch(conn, table, batch: List[dict]) -> None:
+    """Load a batch with PostgreSQL COPY through the asyncpg connection."""
+    columns = list(batch[0])
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table.name,
+        records=[tuple(row[column] for column in columns) for row in batch],
+        columns=columns,
+    )
+
+
+async def _insert_batch(conn, table, batch: List[dict]) -> None:
+    """Load a batch with one executemany INSERT."""
+    async with conn.begin():
+        await conn.execute(insert(table), batch)
+
+
+async def _load_table(
+    engine: AsyncEngine,
+    table,
+    rows: Iterable[dict],
+    batch_size: int,
+    workers: int,
+    progress: Optional[Callable[[str, int], None]],
+) -> int:
+    """
+    Stream generated rows into `table` through `workers` concurrent
+    connections, each loading whole batches, while generation continues.
+    """
+    use_copy = engine.dialect.name == "postgresql" and engine.dialect.driver == "asyncpg"
+    load = _copy_batch if use_copy else _insert_batch
+    batches: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+    errors: List[Exception] = []
+    inserted = 0
+
+    async def _writer():
+        nonlocal inserted
+        try:
+            async with engine.connect() as conn:
+                while (batch := await batches.get()) is not None:
+                    await load(conn, table, batch)
+                    inserted += len(batch)
+                    if progress:
+                        progress(table.name, inserted)
+        except Exception as e:
+            errors.append(e)
+            # Keep draining so the producer never blocks on a full queue
+            while await batches.get() is not None:
+                pass
+
+    writers = [asyncio.create_task(_writer()) for _ in range(workers)]
+    for batch in batched(rows, batch_size):
+        if errors:
+            break
+        await batches.put(batch)
+        # Generation is CPU-bound; yield so writers can send what is queued
+        await asyncio.sleep(0)
+    for _ in writers:
+        await batches.put(None)
+    await asyncio.gather(*writers)
+    if errors:
+        raise errors[0]
+    return inserted
+
+
+def default_workers(engine: AsyncEngine) -> int:
+    # SQLite has a single writer; more connections would only contend for the lock
+    return 1 if engine.dialect.name == "sqlite" else 4
+
+
+async def seed_dataset(
+    engine: AsyncEngine,
+    scale: Scale,
+    seed: int = 42,
+    batch_size: int = 5_000,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[str, int], None]] = None,
+) -> Dict[str, int]:
+    """
+    Insert a synthetic dataset, then rebuild the analytics rollups.
+
+    Rows are loaded with COPY on PostgreSQL (asyncpg) and batched executemany
+    INSERTs elsewhere, over `workers` concurrent connections. Every user
+    shares one precomputed password hash. Returns rows inserted per table.
+
+    Not atomic: each batch commits on its own, so a failed run leaves the
+    rows loaded so far, and a rerun appends after them (see
+    current_id_offsets) instead of retrying. Seed into a dedicated database
+    and recreate it (or drop and recreate its tables) after a failure.
+    """
+    workers = 1 if engine.dialect.name == "sqlite" else (workers or default_workers(engine))
+    generator = DatasetGenerator(scale, seed=seed, id_offsets=await current_id_offsets(engine))
+    counts = {}
+    # Parent tables first: each table is fully loaded before its children
+    for table, rows in (
+        (User.__table__, generator.users()),
+        (Job.__table__, generator.jobs()),
+        (JobApplication.__table__, generator.applications()),
+        (Interview.__table__, generator.interviews()),
+    ):
+        counts[table.name] = await _load_table(engine, table, rows, batch_size, workers, progress)
+
+    await reset_sequences(engine)
+    async with AsyncSession(engine) as session:
+        await rebuild_application_rollups(session)
+        await session.commit()
+    return counts
@@ -1,15 +1,26 @@
+import time
+
+# Start of the "import" startup phase
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from app.utils.logger import setup_logger
+from app.utils.logger import setup_logger, shutdown_logging
 from app.routes.health import router as health_router
 from app.routes.auth import router as auth_router
 from app.routes.jobs import router as jobs_router
 from app.routes.applications import router as applications_router
 from app.routes.analytics import router as analytics_router
-from app.db.database import init_db, engine
+from app.routes.metrics import router as metrics_router
+from app.db.database import init_db, init_engines, dispose_engines
+from app.db.profiler import QueryProfilerMiddleware
 from app.config import get_settings
+from app.utils.compression import CompressionMiddleware
+from app.utils.metrics import MetricsMiddleware, startup_timings
+from app.utils.passwords import password_hasher
+from app.utils.responses import FastJSONResponse
 
 settings = get_settings()
 logger = setup_logger(__name__)
@@ -23,17 +34,24 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("Starting application")
+    app.state.ready = False
     try:
+        init_engines()
         await init_db()
-        logger.info("Application started successfully")
+        # /api/health/ready reports 200 from here until shutdown begins
+        app.state.ready = True
+        logger.info(f"Application started successfully ({startup_timings.summary()})")
         yield
     except Exception as e:
         logger.error(f"Error during startup: {str(e)}")
         raise
     finally:
         # Cleanup
+        app.state.ready = False
         logger.info("Shutting down application")
-        await engine.dispose()
+        password_hasher.shutdown()
+        await dispose_engines()
+        shutdown_logging()
 
 
 app = FastAPI(
@@ -41,6 +59,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description=settings.APP_DESCRIPTION,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Configure CORS
@@ -54,11 +73,32 @@ app.add_middleware(
     max_age=600  # Cache preflight requests for 10 minutes
 )
 
+# Slow-query log and N+1 warnings per request
+if settings.QUERY_PROFILER_ENABLED:
+    app.add_middleware(QueryProfilerMiddleware)
+
+# gzip (or brotli, when installed) for responses above the size threshold
+if settings.COMPRESSION_MINIMUM_SIZE > 0:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+# Per-route latency, SQL time and response size; outermost so it times everything
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(health_router, prefix="/api")
 app.include_router(auth_router, prefix="/api")
 app.include_router(jobs_router, prefix="/api")
 app.include_router(applications_router, prefix="/api")
 app.include_router(analytics_router, prefix="/api")
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router, prefix="/api")
 
 logger.info("Application routes configured")
+
+startup_timings.record("import", time.perf_counter() - _import_started)
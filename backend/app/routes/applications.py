@@ -1,26 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.db.models import User, JobApplication
 from app.schemas.applications import (
     JobApplicationCreate,
     JobApplicationUpdate,
     JobApplicationResponse,
-    JobOfferCreate
+    JobApplicationSummaryPage,
+    MyApplicationSummaryPage,
+    JobOfferCreate,
+    AppliedJobs,
+    JobApplicationExportRow
 )
 from app.services.applications import (
     create_application,
     get_application_by_id,
     get_applications_by_job,
     get_applications_by_applicant,
+    get_application_summaries_by_job,
+    get_application_summaries_by_applicant,
     update_application_status,
     check_application_exists,
+    get_applied_subset,
+    stream_job_application_rows,
     extend_job_offer,
     respond_to_offer
 )
+from app.services.jobs import get_job_by_id
 from app.routes.auth import get_current_user
+from app.config import get_settings
+from app.utils.export import CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE, csv_chunks, ndjson_chunks
+from app.utils.responses import model_response
 
+settings = get_settings()
 router = APIRouter(prefix="/applications", tags=["applications"])
 
 
@@ -36,23 +50,24 @@ async def apply_for_job(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Employers cannot apply for jobs"
         )
-    return await create_application(db, application_data, current_user.id)
+    return await create_application(db, application_data, current_user)
 
 
 @router.get("/my-applications", response_model=List[JobApplicationResponse])
 async def list_my_applications(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """List all job applications for the current user."""
-    return await get_applications_by_applicant(db, current_user.id)
+    applications = await get_applications_by_applicant(db, current_user.id)
+    return model_response(List[JobApplicationResponse], applications)
 
 
 @router.get("/job/{job_id}", response_model=List[JobApplicationResponse])
 async def list_job_applications(
     job_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """List all applications for a specific job (only for the employer who posted the job)."""
     applications = await get_applications_by_job(db, job_id)
@@ -65,7 +80,83 @@ async def list_job_applications(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You can only view applications for jobs you posted"
         )
-    return applications
+    return model_response(List[JobApplicationResponse], applications)
+
+
+@router.get("/my-applications/summary", response_model=MyApplicationSummaryPage)
+async def list_my_application_summaries(
+    limit: int = Query(
+        settings.APPLICATIONS_PAGE_SIZE, ge=1, le=settings.APPLICATIONS_MAX_PAGE_SIZE
+    ),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """List the current user's applications as flat rows, one page at a time."""
+    items, next_cursor = await get_application_summaries_by_applicant(
+        db, current_user.id, limit, cursor
+    )
+    return model_response(MyApplicationSummaryPage, {"items": items, "next_cursor": next_cursor})
+
+
+@router.get("/job/{job_id}/summary", response_model=JobApplicationSummaryPage)
+async def list_job_application_summaries(
+    job_id: int,
+    limit: int = Query(
+        settings.APPLICATIONS_PAGE_SIZE, ge=1, le=settings.APPLICATIONS_MAX_PAGE_SIZE
+    ),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    List applications for a job as flat rows with the job included once,
+    one page at a time (only for the employer who posted the job).
+    """
+    job = await get_job_by_id(db, job_id)
+    if job.posted_by_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only view applications for jobs you posted"
+        )
+    items, next_cursor = await get_application_summaries_by_job(db, job_id, limit, cursor)
+    return model_response(
+        JobApplicationSummaryPage, {"job": job, "items": items, "next_cursor": next_cursor}
+    )
+
+
+@router.get("/job/{job_id}/export")
+async def export_job_applications(
+    job_id: int,
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="ndjson or csv"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Stream every application for a job as NDJSON or CSV (only for the
+    employer who posted the job). Memory use is constant however many
+    applications the job has. The rows are read from the same engine as
+    the permission check, so both see the same replica.
+    """
+    job = await get_job_by_id(db, job_id)
+    if job.posted_by_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only export applications for jobs you posted"
+        )
+
+    rows = stream_job_application_rows(db.bind, job_id, settings.EXPORT_BATCH_SIZE)
+    if format == "csv":
+        body, media_type = csv_chunks(rows, JobApplicationExportRow), CSV_MEDIA_TYPE
+    else:
+        body, media_type = ndjson_chunks(rows, JobApplicationExportRow), NDJSON_MEDIA_TYPE
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="job-{job_id}-applications.{format}"'
+        },
+    )
 
 
 @router.put("/{application_id}/status", response_model=JobApplicationResponse)
@@ -102,11 +193,31 @@ async def update_application(
         )
 
 
+@router.get("/check", response_model=AppliedJobs)
+async def check_applied_jobs(
+    job_ids: List[int] = Query(..., description="Job IDs to check, e.g. those on a feed page"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Return which of the given jobs the current user has applied to."""
+    if current_user.is_supervisor:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Employers cannot apply for jobs"
+        )
+    if len(job_ids) > settings.JOBS_MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.JOBS_MAX_PAGE_SIZE} job IDs can be checked at once"
+        )
+    return AppliedJobs(job_ids=await get_applied_subset(db, current_user.id, job_ids))
+
+
 @router.get("/check/{job_id}")
 async def check_if_applied(
     job_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Check if the current user has applied to a specific job."""
     if current_user.is_supervisor:
@@ -1,40 +1,65 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.db.database import get_db
+from app.db.database import AsyncReadSessionLocal, get_db, get_read_engine
 from app.db.models import User
 from app.schemas.auth import Token, TokenData, UserCreate, UserResponse, LoginRequest
-from app.services.auth import create_access_token
+from app.services.auth import (
+    cache_user,
+    create_access_token,
+    decode_access_token,
+    get_cached_user,
+)
 from app.config import get_settings
+from app.utils.passwords import PasswordHasherBusy
 from pydantic import EmailStr
 
 settings = get_settings()
 router = APIRouter(prefix="/auth", tags=["auth"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+hasher_busy_exception = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Too many concurrent sign-in requests, please retry shortly",
+    headers={"Retry-After": "1"},
+)
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
+
+async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)):
+    """
+    Resolve the bearer token to a user.
+
+    Users are served from the user cache when possible; otherwise they are
+    loaded through a session that is closed straight after the lookup, so
+    the connection is not held alongside the handler's own session. Either
+    way the returned object is a detached, read-only snapshot.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        token_data = TokenData(email=email)
-    except JWTError:
+    payload = decode_access_token(token)
+    if payload is None:
         raise credentials_exception
+    email: str = payload.get("sub")
+    if email is None:
+        raise credentials_exception
+    token_data = TokenData(email=email)
 
-    result = await db.execute(select(User).filter(User.email == token_data.email))
-    user = result.scalar_one_or_none()
+    user = await get_cached_user(token_data.email)
+    if user is not None:
+        return user
+
+    bind = await get_read_engine(request)
+    async with AsyncReadSessionLocal(bind=bind) as db:
+        result = await db.execute(select(User).filter(User.email == token_data.email))
+        user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
+    await cache_user(user)
     return user
 
 
@@ -59,7 +84,10 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
         username=user_data.username,
         is_supervisor=user_data.is_supervisor
     )
-    user.set_password(user_data.password)
+    try:
+        await user.set_password_async(user_data.password)
+    except PasswordHasherBusy:
+        raise hasher_busy_exception
 
     db.add(user)
     await db.commit()
@@ -73,13 +101,19 @@ async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).filter(User.email == login_data.email))
     user = result.scalar_one_or_none()
 
-    if not user or not user.verify_password(login_data.password):
+    try:
+        verified = user is not None and await user.verify_password_async(login_data.password)
+    except PasswordHasherBusy:
+        raise hasher_busy_exception
+
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # A rehashed password (cost factor change) is persisted by get_db's commit
     access_token = create_access_token(data={"sub": user.email})
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -111,7 +145,10 @@ async def reset_password(token: str, new_password: str, db: AsyncSession = Depen
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired reset token"
         )
 
-    user.set_password(new_password)
+    try:
+        await user.set_password_async(new_password)
+    except PasswordHasherBusy:
+        raise hasher_busy_exception
     user.clear_reset_token()
     await db.commit()
 
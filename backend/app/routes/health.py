@@ -1,5 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response, status
+from app.db.database import check_db, get_pool_stats
 from app.utils.logger import setup_logger
+from app.utils.passwords import password_hasher
 
 router = APIRouter()
 logger = setup_logger(__name__)
@@ -9,3 +11,30 @@ logger = setup_logger(__name__)
 async def health_check():
     logger.info("Health check endpoint called")
     return {"status": "healthy"}
+
+
+@router.get("/health/ready", tags=["Health"])
+async def readiness_check(request: Request, response: Response):
+    """
+    Readiness for load balancers: 503 until startup has finished, while the
+    worker is shutting down, or when the database is unreachable.
+    """
+    if not getattr(request.app.state, "ready", False):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "starting"}
+    if not await check_db():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "database unavailable"}
+    return {"status": "ready"}
+
+
+@router.get("/health/password-hasher", tags=["Health"])
+async def password_hasher_stats():
+    """Concurrency and queue-depth statistics for the bcrypt hashing pool."""
+    return password_hasher.stats()
+
+
+@router.get("/health/db-pool", tags=["Health"])
+async def db_pool_stats():
+    """Checked-out connections, overflow, checkout wait times and timeouts per pool."""
+    return get_pool_stats()
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.services.auth import get_current_user
 from app.db.models import User
 from app.services import interviews as interview_service
@@ -29,7 +29,7 @@ async def schedule_interview(
 async def get_interview_details(
     interview_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get details of a specific interview."""
     interview = await interview_service.get_interview(db, interview_id)
@@ -65,7 +65,7 @@ async def update_interview_details(
 async def get_application_interviews(
     application_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all interviews for a specific application."""
     # First get the application to check permissions
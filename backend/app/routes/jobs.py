@@ -1,26 +1,65 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List
-from app.db.database import get_db
-from app.db.models import User, Job
-from app.schemas.jobs import JobCreate, JobUpdate, JobResponse
+from typing import List, Optional
+from app.db.database import get_db, get_read_db
+from app.db.models import User
+from app.schemas.jobs import JobCreate, JobUpdate, JobResponse, JobSearchResult
 from app.services.jobs import (
+    get_active_jobs,
+    get_active_job_versions,
     get_jobs_by_employer,
+    get_employer_job_versions,
     get_job_by_id,
+    get_job_version,
+    get_job_feed_page,
     create_job,
     update_job,
     delete_job
 )
+from app.services.search import search_jobs
 from app.routes.auth import get_current_user
+from app.config import get_settings
+from app.utils.conditional import (
+    is_not_modified,
+    last_modified,
+    make_etag,
+    not_modified,
+    validator_headers,
+)
+from app.utils.responses import JSON_MEDIA_TYPE, dump_json, model_response
 
+settings = get_settings()
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+def _job_list_etag(jobs, *extra) -> str:
+    """
+    ETag for a list of jobs (ORM objects or id/updated_at rows). Lists get
+    no Last-Modified: closing or deleting a job can leave the newest
+    updated_at unchanged, which If-Modified-Since would miss.
+    """
+    return make_etag(((job.id, job.updated_at) for job in jobs), *extra)
+
+
+def _job_validators(job):
+    """ETag and Last-Modified for one job (ORM object or id/updated_at row)."""
+    return _job_list_etag([job]), last_modified([job.updated_at])
+
+
+def _render_feed_page(jobs, next_cursor: Optional[str]) -> dict:
+    """Serialized feed page and its ETag, in a form the feed cache can store."""
+    return {
+        "body": dump_json(List[JobResponse], jobs),
+        "etag": _job_list_etag(jobs, next_cursor is not None),
+        "next_cursor": next_cursor,
+    }
+
+
 @router.get("/my-jobs", response_model=List[JobResponse])
 async def list_my_jobs(
+    request: Request,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all jobs posted by the current employer."""
     if not current_user.is_supervisor:
@@ -28,7 +67,15 @@ async def list_my_jobs(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only employers can access job postings"
         )
-    return await get_jobs_by_employer(db, current_user.id)
+    versions = await get_employer_job_versions(db, current_user.id)
+    etag = _job_list_etag(versions)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    jobs = await get_jobs_by_employer(db, current_user.id)
+    return model_response(
+        List[JobResponse], jobs, headers=validator_headers(_job_list_etag(jobs))
+    )
 
 
 @router.post("", response_model=JobResponse)
@@ -46,16 +93,40 @@ async def create_job_posting(
     return await create_job(db, job_data, current_user.id)
 
 
+@router.get("/search", response_model=List[JobSearchResult])
+async def search_job_postings(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms"),
+    limit: int = Query(settings.JOBS_PAGE_SIZE, ge=1, le=settings.JOBS_MAX_PAGE_SIZE),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Search active job postings, best match first."""
+    results = await search_jobs(db, q, limit)
+    rows = []
+    for job, rank in results:
+        row = {field: getattr(job, field) for field in JobResponse.model_fields}
+        row["rank"] = rank
+        rows.append(row)
+    return model_response(List[JobSearchResult], rows)
+
+
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
     job_id: int,
+    request: Request,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get a specific job posting."""
+    version = await get_job_version(db, job_id)
+    etag, modified = _job_validators(version)
+    if is_not_modified(request, etag, modified):
+        return not_modified(etag, modified)
+
     job = await get_job_by_id(db, job_id)
+    etag, modified = _job_validators(job)
     # Allow access to job details for both employers and job seekers
-    return job
+    return model_response(JobResponse, job, headers=validator_headers(etag, modified))
 
 
 @router.put("/{job_id}", response_model=JobResponse)
@@ -91,12 +162,49 @@ async def delete_job_posting(
 
 @router.get("", response_model=List[JobResponse])
 async def list_active_jobs(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    limit: int = Query(
+        settings.JOBS_PAGE_SIZE, ge=1, le=settings.JOBS_MAX_PAGE_SIZE, description="Page size"
+    ),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+    location: Optional[str] = None,
+    employment_type: Optional[str] = None,
+    min_salary: Optional[float] = Query(None, ge=0),
+    max_salary: Optional[float] = Query(None, ge=0),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List all active job postings."""
+    """
+    List active job postings, newest first, one page at a time.
+    The cursor for the next page is returned in the X-Next-Cursor header.
+
+    Responses carry an ETag (no Last-Modified, see _job_list_etag). Rendered
+    pages are cached for JOB_FEED_CACHE_TTL seconds and dropped on any job
+    write; with the cache disabled, revalidation of an unchanged page costs a
+    two-column query.
+    """
     # This endpoint is accessible to both employers and job seekers
-    result = await db.execute(
-        select(Job).filter(Job.status == "active").order_by(Job.created_at.desc())
+    filters = dict(
+        limit=limit,
+        cursor=cursor,
+        location=location,
+        employment_type=employment_type,
+        min_salary=min_salary,
+        max_salary=max_salary,
     )
-    return result.scalars().all()
\ No newline at end of file
+    if settings.JOB_FEED_CACHE_TTL > 0:
+        # Shared by every user; no database work while the page is cached
+        page = await get_job_feed_page(db, _render_feed_page, **filters)
+    else:
+        versions, has_more = await get_active_job_versions(db, **filters)
+        etag = _job_list_etag(versions, has_more)
+        if is_not_modified(request, etag):
+            return not_modified(etag)
+        page = _render_feed_page(*await get_active_jobs(db, **filters))
+
+    if is_not_modified(request, page["etag"]):
+        return not_modified(page["etag"])
+    headers = dict(validator_headers(page["etag"]))
+    if page["next_cursor"]:
+        headers["X-Next-Cursor"] = page["next_cursor"]
+    return Response(page["body"], media_type=JSON_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,79 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.db.database import get_pool_stats
+from app.services.applications import applied_jobs_cache
+from app.services.auth import user_cache
+from app.services.jobs import job_feed_cache
+from app.utils.logger import get_logging_stats
+from app.utils.metrics import (
+    metrics_registry,
+    render_counters,
+    render_gauges,
+    render_histogram,
+    startup_timings,
+)
+from app.utils.passwords import password_hasher
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _process_metrics() -> list:
+    """Startup, connection pool, cache, password hasher and log queue metrics."""
+    lines = render_gauges(
+        "app_startup_phase_seconds",
+        "Time this worker spent in each cold-start phase.",
+        [({"phase": phase}, seconds) for phase, seconds in startup_timings.phases.items()],
+    )
+    pools = get_pool_stats()
+    lines += render_gauges(
+        "db_pool_checked_out_connections",
+        "Connections currently checked out of the pool.",
+        [({"pool": pool["name"]}, pool.get("checked_out", 0)) for pool in pools],
+    )
+    lines += render_counters(
+        "db_pool_checkout_timeouts",
+        "Checkouts that gave up waiting for a connection.",
+        [({"pool": pool["name"]}, pool.get("checkout_timeouts", 0)) for pool in pools],
+    )
+
+    caches = [cache.stats() for cache in (user_cache, job_feed_cache, applied_jobs_cache)]
+    lines += render_counters(
+        "cache_hits",
+        "Cache lookups answered from this process's cache client.",
+        [({"cache": stats["namespace"]}, stats["hits"]) for stats in caches],
+    )
+    lines += render_counters(
+        "cache_misses",
+        "Cache lookups that fell through to the database.",
+        [({"cache": stats["namespace"]}, stats["misses"]) for stats in caches],
+    )
+
+    hasher = password_hasher.stats()
+    lines += render_gauges(
+        "password_hasher_queue_depth",
+        "Password hashes waiting for a worker.",
+        [({}, hasher["queue_depth"])],
+    )
+    lines += render_counters(
+        "password_hasher_rejected",
+        "Password hashes rejected because the queue was full.",
+        [({}, hasher["rejected"])],
+    )
+
+    logging_stats = get_logging_stats()
+    if logging_stats["queued"]:
+        lines += render_counters(
+            "log_records_dropped",
+            "Log records dropped because the queue was full.",
+            [({}, logging_stats["dropped"])],
+        )
+    return lines
+
+
+@router.get("/metrics", tags=["Metrics"], include_in_schema=False)
+async def prometheus_metrics():
+    """Request, SQL and process metrics in Prometheus text format."""
+    body = metrics_registry.render() + "\n".join(_process_metrics()) + "\n"
+    return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
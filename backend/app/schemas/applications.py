@@ -101,4 +101,71 @@ class JobApplicationResponse(JobApplicationBase):
     class Config:
         from_attributes = True
         arbitrary_types_allowed = True
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class JobApplicationSummary(BaseModel):
+    """Flat application row for employer listings; the job is sent once per page."""
+    id: int
+    job_id: int
+    applicant_id: int
+    applicant_username: str
+    applicant_email: str
+    status: str
+    resume_url: str
+    created_at: datetime
+    updated_at: datetime
+    interview_count: int = 0
+
+    class Config:
+        from_attributes = True
+
+
+class JobApplicationSummaryPage(BaseModel):
+    job: JobResponse
+    items: list[JobApplicationSummary]
+    next_cursor: Optional[str] = None
+
+
+class MyApplicationSummary(BaseModel):
+    """Flat application row for an applicant's own listing."""
+    id: int
+    job_id: int
+    job_title: str
+    company_name: str
+    job_location: str
+    job_status: str
+    status: str
+    created_at: datetime
+    updated_at: datetime
+    interview_count: int = 0
+
+    class Config:
+        from_attributes = True
+
+
+class MyApplicationSummaryPage(BaseModel):
+    items: list[MyApplicationSummary]
+    next_cursor: Optional[str] = None
+
+
+class AppliedJobs(BaseModel):
+    """The requested job IDs the current user has applied to."""
+    job_ids: list[int]
+
+
+class JobApplicationExportRow(BaseModel):
+    """One application in an employer's CSV / NDJSON export."""
+    id: int
+    applicant_id: int
+    applicant_username: str
+    applicant_email: str
+    status: str
+    resume_url: str
+    cover_letter: Optional[str] = None
+    interview_count: int = 0
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -37,4 +37,8 @@ class JobResponse(JobBase):
     updated_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class JobSearchResult(JobResponse):
+    rank: float
@@ -0,0 +1,89 @@
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import ApplicationDailyCount, Job
+
+# Status buckets reported on the employer dashboard
+DASHBOARD_STATUSES = [
+    "pending",
+    "under_review",
+    "interview_scheduled",
+    "interview_completed",
+    "offer_extended",
+    "offer_accepted",
+    "offer_declined",
+    "rejected",
+]
+
+
+async def get_job_application_summary(
+    db: AsyncSession,
+    employer_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+):
+    """
+    Per-job application totals and status counts for an employer,
+    optionally limited to applications created within a date range.
+    """
+    join_on = [ApplicationDailyCount.job_id == Job.id]
+    if start_date:
+        join_on.append(ApplicationDailyCount.day >= start_date)
+    if end_date:
+        join_on.append(ApplicationDailyCount.day <= end_date)
+
+    result = await db.execute(
+        select(
+            Job.id,
+            Job.title,
+            ApplicationDailyCount.status,
+            func.sum(ApplicationDailyCount.count).label("count"),
+        )
+        .outerjoin(ApplicationDailyCount, and_(*join_on))
+        .filter(Job.posted_by_id == employer_id)
+        .group_by(Job.id, Job.title, ApplicationDailyCount.status)
+        .order_by(Job.id.desc())
+    )
+
+    jobs = {}
+    for row in result:
+        job = jobs.setdefault(
+            row.id,
+            {
+                "job_title": row.title,
+                "total_applications": 0,
+                "status_counts": dict.fromkeys(DASHBOARD_STATUSES, 0),
+            },
+        )
+        if row.status is None:
+            continue
+        job["total_applications"] += row.count
+        if row.status in job["status_counts"]:
+            job["status_counts"][row.status] += row.count
+    return list(jobs.values())
+
+
+async def get_application_timeline(
+    db: AsyncSession, employer_id: int, start_date: date, end_date: date
+):
+    """Applications received per day across an employer's jobs, zero-filled."""
+    result = await db.execute(
+        select(ApplicationDailyCount.day, func.sum(ApplicationDailyCount.count))
+        .filter(
+            ApplicationDailyCount.employer_id == employer_id,
+            ApplicationDailyCount.day >= start_date,
+            ApplicationDailyCount.day <= end_date,
+        )
+        .group_by(ApplicationDailyCount.day)
+    )
+    counts = {day: total for day, total in result}
+
+    timeline = []
+    day = start_date
+    while day <= end_date:
+        timeline.append({"date": day.strftime("%Y-%m-%d"), "applications": counts.get(day, 0)})
+        day += timedelta(days=1)
+    return timeline
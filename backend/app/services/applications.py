@@ -1,8 +1,13 @@
 from datetime import datetime
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, FrozenSet, Iterable, Optional, Sequence
+from sqlalchemy import exists, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import selectinload
-from app.db.models import JobApplication, Job
+from app.config import get_settings
+from app.db.database import AsyncReadSessionLocal
+from app.db.models import Interview, JobApplication, Job, User
 from app.schemas.applications import (
     JobApplicationCreate,
     JobApplicationUpdate,
@@ -10,9 +15,50 @@ from app.schemas.applications import (
     JobOfferCreate,
     JobApplicationResponse
 )
+from app.schemas.auth import UserResponse
+from app.schemas.jobs import JobResponse
+from app.utils.cache import create_cache
+from app.utils.pagination import encode_cursor, keyset_before, keyset_sort_key
 from fastapi import HTTPException, status
 from sqlalchemy.orm.strategy_options import selectinload
 
+settings = get_settings()
+
+# Job IDs each applicant has applied to, so a page of job cards can be
+# annotated without a query per card. Applications are never deleted;
+# create_application drops the applicant's entry. Without CACHE_URL each
+# worker has its own copy that the drop does not reach, so entries live only
+# APPLIED_JOBS_LOCAL_CACHE_TTL seconds, and only the batch check reads them.
+applied_jobs_cache = create_cache(
+    "applied-jobs",
+    ttl=(
+        settings.APPLIED_JOBS_CACHE_TTL
+        if settings.CACHE_URL
+        else settings.APPLIED_JOBS_LOCAL_CACHE_TTL
+    ),
+    maxsize=settings.APPLIED_JOBS_CACHE_MAXSIZE,
+)
+
+
+async def get_applied_job_ids(db: AsyncSession, applicant_id: int) -> FrozenSet[int]:
+    """IDs of every job an applicant has applied to, cached per applicant."""
+    applied = await applied_jobs_cache.get(applicant_id)
+    if applied is None:
+        result = await db.execute(
+            select(JobApplication.job_id).filter(JobApplication.applicant_id == applicant_id)
+        )
+        applied = frozenset(result.scalars().all())
+        await applied_jobs_cache.set(applicant_id, applied)
+    return applied
+
+
+async def get_applied_subset(
+    db: AsyncSession, applicant_id: int, job_ids: Iterable[int]
+) -> list:
+    """The subset of `job_ids` the applicant has applied to, in request order."""
+    applied = await get_applied_job_ids(db, applicant_id)
+    return [job_id for job_id in dict.fromkeys(job_ids) if job_id in applied]
+
 
 async def check_application_exists(
     db: AsyncSession,
@@ -20,39 +66,30 @@ async def check_application_exists(
     applicant_id: int
 ) -> bool:
     """Check if a user has already applied to a specific job."""
-    result = await db.execute(
-        select(JobApplication).filter(
-            JobApplication.job_id == job_id,
-            JobApplication.applicant_id == applicant_id
+    return await db.scalar(
+        select(
+            exists().where(
+                JobApplication.job_id == job_id,
+                JobApplication.applicant_id == applicant_id
+            )
         )
     )
-    return result.scalar_one_or_none() is not None
 
 
 async def create_application(
     db: AsyncSession,
     application_data: JobApplicationCreate,
-    applicant_id: int
+    applicant: User
 ):
-    """Create a new job application."""
-    # Check if user has already applied
-    existing = await db.execute(
-        select(JobApplication).filter(
-            JobApplication.job_id == application_data.job_id,
-            JobApplication.applicant_id == applicant_id
-        )
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You have already applied for this job"
-        )
+    """
+    Create a new job application.
 
+    Duplicate applications are rejected by the (job_id, applicant_id) unique
+    constraint rather than a prior SELECT, and the response is built from the
+    job and applicant already in hand instead of re-reading the new row.
+    """
     # Check if job exists and is active
-    job = await db.execute(
-        select(Job).filter(Job.id == application_data.job_id)
-    )
-    job = job.scalar_one_or_none()
+    job = await db.get(Job, application_data.job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -67,35 +104,43 @@ async def create_application(
     # Create new application
     application = JobApplication(
         job_id=application_data.job_id,
-        applicant_id=applicant_id,
+        applicant_id=applicant.id,
         cover_letter=application_data.cover_letter,
         resume_url=application_data.resume_url,
         status="applied"
     )
 
+    db.add(application)
     try:
-        # Save the application
-        db.add(application)
         await db.commit()
-
-        # Fetch the complete application with relationships
-        stmt = (
-            select(JobApplication)
-            .filter(JobApplication.id == application.id)
-            .options(
-                selectinload(JobApplication.job),
-                selectinload(JobApplication.applicant),
-                selectinload(JobApplication.interviews)
-            )
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You have already applied for this job"
         )
-        result = await db.execute(stmt)
-        return result.scalar_one()
     except Exception as e:
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create application: {str(e)}"
         )
+    # Dropped rather than patched: a get-then-set could lose a concurrent apply
+    await applied_jobs_cache.delete(applicant.id)
+
+    return JobApplicationResponse(
+        id=application.id,
+        job_id=application.job_id,
+        applicant_id=application.applicant_id,
+        cover_letter=application.cover_letter,
+        resume_url=application.resume_url,
+        status=application.status,
+        created_at=application.created_at,
+        updated_at=application.updated_at,
+        job=JobResponse.model_validate(job),
+        applicant=UserResponse.model_validate(applicant),
+        interviews=[],
+    )
 
 
 async def get_application_by_id(db: AsyncSession, application_id: int):
@@ -152,6 +197,125 @@ async def get_applications_by_applicant(db: AsyncSession, applicant_id: int):
     return result.scalars().all()
 
 
+def _interview_count():
+    return (
+        select(func.count(Interview.id))
+        .where(Interview.application_id == JobApplication.id)
+        .correlate(JobApplication)
+        .scalar_subquery()
+        .label("interview_count")
+    )
+
+
+async def _fetch_summary_page(db: AsyncSession, stmt, limit: int, cursor: Optional[str]):
+    """Apply (created_at, id) keyset pagination to a summary query and run it."""
+    dialect_name = db.bind.dialect.name
+    try:
+        after = keyset_before(JobApplication.created_at, JobApplication.id, cursor, dialect_name)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if after is not None:
+        stmt = stmt.filter(after)
+    stmt = stmt.order_by(
+        keyset_sort_key(JobApplication.created_at, dialect_name).desc(),
+        JobApplication.id.desc(),
+    ).limit(limit + 1)
+
+    rows = (await db.execute(stmt)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return rows, next_cursor
+
+
+async def get_application_summaries_by_job(
+    db: AsyncSession, job_id: int, limit: int, cursor: Optional[str] = None
+):
+    """
+    Get one page of flat application rows for a job.
+
+    Selects only the listed columns (no job body, no ORM hydration) and
+    replaces the interviews collection with a count.
+    """
+    stmt = (
+        select(
+            JobApplication.id,
+            JobApplication.job_id,
+            JobApplication.applicant_id,
+            User.username.label("applicant_username"),
+            User.email.label("applicant_email"),
+            JobApplication.status,
+            JobApplication.resume_url,
+            JobApplication.created_at,
+            JobApplication.updated_at,
+            _interview_count(),
+        )
+        .join(User, User.id == JobApplication.applicant_id)
+        .filter(JobApplication.job_id == job_id)
+    )
+    return await _fetch_summary_page(db, stmt, limit, cursor)
+
+
+async def get_application_summaries_by_applicant(
+    db: AsyncSession, applicant_id: int, limit: int, cursor: Optional[str] = None
+):
+    """Get one page of flat application rows, with job headline columns, for an applicant."""
+    stmt = (
+        select(
+            JobApplication.id,
+            JobApplication.job_id,
+            Job.title.label("job_title"),
+            Job.company_name,
+            Job.location.label("job_location"),
+            Job.status.label("job_status"),
+            JobApplication.status,
+            JobApplication.created_at,
+            JobApplication.updated_at,
+            _interview_count(),
+        )
+        .join(Job, Job.id == JobApplication.job_id)
+        .filter(JobApplication.applicant_id == applicant_id)
+    )
+    return await _fetch_summary_page(db, stmt, limit, cursor)
+
+
+async def stream_job_application_rows(
+    db_engine: AsyncEngine, job_id: int, batch_size: int
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    Yield a job's applications as flat export rows, `batch_size` at a time,
+    oldest first.
+
+    Rows are read through a server-side cursor, so memory use does not grow
+    with the number of applications. The generator opens its own read-only
+    session: a streamed response body is sent after the request's
+    dependencies, and their session, have been closed.
+    """
+    stmt = (
+        select(
+            JobApplication.id,
+            JobApplication.applicant_id,
+            User.username.label("applicant_username"),
+            User.email.label("applicant_email"),
+            JobApplication.status,
+            JobApplication.resume_url,
+            JobApplication.cover_letter,
+            _interview_count(),
+            JobApplication.created_at,
+            JobApplication.updated_at,
+        )
+        .join(User, User.id == JobApplication.applicant_id)
+        .filter(JobApplication.job_id == job_id)
+        .order_by(JobApplication.created_at, JobApplication.id)
+        .execution_options(yield_per=batch_size)
+    )
+    async with AsyncReadSessionLocal(bind=db_engine) as session:
+        result = await session.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
+
+
 async def get_application_with_relationships(db: AsyncSession, application_id: int):
     """Get a job application with all its relationships loaded."""
     try:
@@ -204,13 +368,11 @@ async def update_application_status(
             detail="You can only update applications for jobs you posted"
         )
     
-    # Update the status
+    # Update the status; relationships stay loaded (expire_on_commit=False)
+    # and updated_at is fetched back by the flush (eager_defaults)
     application.status = new_status
     await db.commit()
-    
-    # Refresh with relationships
-    refreshed_application = await get_application_with_relationships(db, application_id)
-    return refreshed_application
+    return application
 
 
 async def extend_job_offer(
@@ -1,13 +1,87 @@
 from datetime import datetime, timedelta
-from jose import jwt
+from itertools import chain
+from typing import Optional
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 from app.config import get_settings
+from app.db.models import User
+from app.utils.cache import create_cache
 
 settings = get_settings()
 
+# Columns never copied into the user cache; the cache may be shared (Redis)
+USER_CACHE_EXCLUDED = {"hashed_password", "reset_token"}
+
+user_cache = create_cache("users", ttl=settings.USER_CACHE_TTL, maxsize=settings.USER_CACHE_MAXSIZE)
+
 
 def create_access_token(data: dict):
+    # python-jose (and the cryptography package behind it) loads on first use
+    from jose import jwt
+
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
+
+
+def decode_access_token(token: str) -> Optional[dict]:
+    """Verify a bearer token and return its claims, or None if it is invalid or expired."""
+    from jose import JWTError, jwt
+
+    try:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+
+
+async def get_cached_user(subject: str) -> Optional[User]:
+    """
+    Return the cached user for a token subject, or None on a miss.
+
+    The user is a detached snapshot without credential columns: it is safe
+    to read but must not be modified or added to a session.
+    """
+    snapshot = await user_cache.get(subject)
+    if snapshot is None:
+        return None
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+async def cache_user(user: User) -> None:
+    """Store a snapshot of a freshly loaded user under its token subject."""
+    snapshot = {
+        column.key: getattr(user, column.key)
+        for column in User.__table__.columns
+        if column.key not in USER_CACHE_EXCLUDED
+    }
+    await user_cache.set(user.email, snapshot)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_stale_users(session, flush_context):
+    """Remember the subjects of users changed or deleted in this transaction."""
+    stale = None
+    for obj in chain(session.dirty, session.deleted):
+        if not isinstance(obj, User):
+            continue
+        if stale is None:
+            stale = session.info.setdefault("stale_user_subjects", set())
+        history = inspect(obj).attrs.email.history
+        stale.update(email for email in chain([obj.email], history.deleted or ()) if email)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stale_users(session):
+    """Evict changed users (password reset, role change, deactivation) on commit."""
+    subjects = session.info.pop("stale_user_subjects", None)
+    if subjects:
+        user_cache.delete_nowait(subjects)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_users(session):
+    session.info.pop("stale_user_subjects", None)
@@ -1,9 +1,169 @@
+import uuid
+from typing import Any, Callable, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import get_settings
 from app.db.models import Job, User
 from app.schemas.jobs import JobCreate, JobUpdate
+from app.services.search import index_job, unindex_job
+from app.utils.cache import SingleFlight, create_cache
+from app.utils.pagination import encode_cursor, keyset_before, keyset_sort_key
 from fastapi import HTTPException, status
 
+settings = get_settings()
+
+# Rendered pages of the active-job feed, which is the same for every user.
+# Keys carry a generation that every job write replaces, so invalidation is
+# one write however many filter/cursor combinations are cached.
+job_feed_cache = create_cache(
+    "job-feed", ttl=settings.JOB_FEED_CACHE_TTL, maxsize=settings.JOB_FEED_CACHE_MAXSIZE
+)
+_job_feed_flight = SingleFlight()
+
+FEED_GENERATION_KEY = "generation"
+FEED_GENERATION_TTL = 86400
+
+
+def _active_jobs_page(
+    db: AsyncSession,
+    columns,
+    limit: int,
+    cursor: Optional[str],
+    location: Optional[str],
+    employment_type: Optional[str],
+    min_salary: Optional[float],
+    max_salary: Optional[float],
+):
+    """
+    Statement selecting `columns` for one page of active jobs (plus one extra
+    row to learn whether another page exists), newest first.
+    """
+    dialect_name = db.bind.dialect.name
+    created_key = keyset_sort_key(Job.created_at, dialect_name)
+
+    stmt = select(*columns).filter(Job.status == "active")
+    if location:
+        stmt = stmt.filter(Job.location == location)
+    if employment_type:
+        stmt = stmt.filter(Job.employment_type == employment_type)
+    # Salary filters match jobs whose advertised range overlaps the requested one
+    if min_salary is not None:
+        stmt = stmt.filter(Job.salary_max >= min_salary)
+    if max_salary is not None:
+        stmt = stmt.filter(Job.salary_min <= max_salary)
+
+    try:
+        after = keyset_before(Job.created_at, Job.id, cursor, dialect_name)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if after is not None:
+        stmt = stmt.filter(after)
+
+    return stmt.order_by(created_key.desc(), Job.id.desc()).limit(limit + 1)
+
+
+async def get_active_jobs(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[str] = None,
+    location: Optional[str] = None,
+    employment_type: Optional[str] = None,
+    min_salary: Optional[float] = None,
+    max_salary: Optional[float] = None,
+):
+    """
+    Get one page of active jobs, newest first.
+
+    Pages are keyed on (created_at, id) so every page costs the same index
+    range scan regardless of how deep the client has paged. Returns the jobs
+    and the cursor for the next page (None on the last page).
+    """
+    stmt = _active_jobs_page(
+        db, (Job,), limit, cursor, location, employment_type, min_salary, max_salary
+    )
+    result = await db.execute(stmt)
+    jobs = result.scalars().all()
+
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        next_cursor = encode_cursor(jobs[-1].created_at, jobs[-1].id)
+    return jobs, next_cursor
+
+
+async def get_active_job_versions(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[str] = None,
+    location: Optional[str] = None,
+    employment_type: Optional[str] = None,
+    min_salary: Optional[float] = None,
+    max_salary: Optional[float] = None,
+):
+    """
+    (id, updated_at) of the jobs get_active_jobs would return, and whether a
+    next page exists. Reads two narrow columns so a conditional request can
+    be answered without loading or rendering the page.
+    """
+    stmt = _active_jobs_page(
+        db, (Job.id, Job.updated_at), limit, cursor, location, employment_type,
+        min_salary, max_salary,
+    )
+    result = await db.execute(stmt)
+    versions = result.all()
+    return versions[:limit], len(versions) > limit
+
+
+async def invalidate_job_feed() -> str:
+    """Start a new feed generation; pages cached under earlier ones are never read again."""
+    generation = uuid.uuid4().hex
+    await job_feed_cache.set(FEED_GENERATION_KEY, generation, ttl=FEED_GENERATION_TTL)
+    return generation
+
+
+async def get_job_feed_page(
+    db: AsyncSession,
+    render: Callable[[list, Optional[str]], Any],
+    limit: int,
+    cursor: Optional[str] = None,
+    location: Optional[str] = None,
+    employment_type: Optional[str] = None,
+    min_salary: Optional[float] = None,
+    max_salary: Optional[float] = None,
+):
+    """
+    Return render(jobs, next_cursor) for one page of the active-job feed,
+    from the shared cache when possible.
+
+    Concurrent misses for the same page in this process wait for a single
+    query and render. A page computed while a write lands is stored under
+    the generation it started with and so is never served afterwards.
+    """
+    generation = await job_feed_cache.get(FEED_GENERATION_KEY)
+    if generation is None:
+        generation = await invalidate_job_feed()
+    key = f"{generation}:{(limit, cursor, location, employment_type, min_salary, max_salary)!r}"
+
+    page = await job_feed_cache.get(key)
+    if page is not None:
+        return page
+
+    async def _compute():
+        jobs, next_cursor = await get_active_jobs(
+            db,
+            limit=limit,
+            cursor=cursor,
+            location=location,
+            employment_type=employment_type,
+            min_salary=min_salary,
+            max_salary=max_salary,
+        )
+        rendered = render(jobs, next_cursor)
+        await job_feed_cache.set(key, rendered)
+        return rendered
+
+    return await _job_feed_flight.run(key, _compute)
+
 
 async def get_jobs_by_employer(db: AsyncSession, employer_id: int):
     """Get all jobs posted by a specific employer."""
@@ -13,6 +173,16 @@ async def get_jobs_by_employer(db: AsyncSession, employer_id: int):
     return result.scalars().all()
 
 
+async def get_employer_job_versions(db: AsyncSession, employer_id: int):
+    """(id, updated_at) of every job posted by an employer."""
+    result = await db.execute(
+        select(Job.id, Job.updated_at)
+        .filter(Job.posted_by_id == employer_id)
+        .order_by(Job.created_at.desc())
+    )
+    return result.all()
+
+
 async def get_job_by_id(db: AsyncSession, job_id: int):
     """Get a specific job by its ID."""
     result = await db.execute(select(Job).filter(Job.id == job_id))
@@ -25,6 +195,18 @@ async def get_job_by_id(db: AsyncSession, job_id: int):
     return job
 
 
+async def get_job_version(db: AsyncSession, job_id: int):
+    """(id, updated_at) of a specific job, without loading the row."""
+    result = await db.execute(select(Job.id, Job.updated_at).filter(Job.id == job_id))
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return row
+
+
 async def create_job(db: AsyncSession, job_data: JobCreate, employer_id: int):
     """Create a new job posting."""
     job = Job(
@@ -34,6 +216,8 @@ async def create_job(db: AsyncSession, job_data: JobCreate, employer_id: int):
     db.add(job)
     await db.commit()
     await db.refresh(job)
+    index_job(job)
+    await invalidate_job_feed()
     return job
 
 
@@ -60,6 +244,8 @@ async def update_job(
 
     await db.commit()
     await db.refresh(job)
+    index_job(job)
+    await invalidate_job_feed()
     return job
 
 
@@ -76,4 +262,6 @@ async def delete_job(db: AsyncSession, job_id: int, employer_id: int):
 
     await db.delete(job)
     await db.commit()
+    unindex_job(job_id)
+    await invalidate_job_feed()
     return {"message": "Job deleted successfully"}
\ No newline at end of file
@@ -0,0 +1,203 @@
+import asyncio
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Job
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Same relative weighting as the setweight() labels on jobs.search_vector
+FIELD_WEIGHTS = {
+    "title": 1.0,  # A
+    "company_name": 0.4,  # B
+    "requirements": 0.2,  # C
+    "description": 0.1,  # D
+}
+
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has in is it of on or that the to was were will with".split()
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _stem(token: str) -> str:
+    """Strip the most common English suffixes so 'developers' matches 'developer'."""
+    for suffix in ("ing", "ers", "er", "ed", "es", "s"):
+        if len(token) > len(suffix) + 2 and token.endswith(suffix):
+            return token[: -len(suffix)]
+    return token
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-case, split on non-alphanumerics, drop stop words and stem."""
+    if not text:
+        return []
+    return [_stem(t) for t in _TOKEN_RE.findall(text.lower()) if t not in STOP_WORDS]
+
+
+class InvertedIndex:
+    """
+    In-process inverted index over active job postings.
+
+    Used when the database has no full-text support (the SQLite test
+    database). Postings map each term to {job_id: weighted term frequency};
+    queries use AND semantics like websearch_to_tsquery and score documents
+    with a tf-idf sum.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._doc_terms: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.built = False
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def add(self, doc_id: int, fields: Dict[str, Optional[str]]) -> None:
+        """Index (or re-index) a document."""
+        weights: Dict[str, float] = defaultdict(float)
+        for field, text in fields.items():
+            field_weight = FIELD_WEIGHTS.get(field, 0.1)
+            for term in tokenize(text):
+                weights[term] += field_weight
+
+        with self._lock:
+            self._remove_locked(doc_id)
+            for term, weight in weights.items():
+                self._postings[term][doc_id] = weight
+            self._doc_terms[doc_id] = set(weights)
+
+    def remove(self, doc_id: int) -> None:
+        """Drop a document from the index."""
+        with self._lock:
+            self._remove_locked(doc_id)
+
+    def _remove_locked(self, doc_id: int) -> None:
+        for term in self._doc_terms.pop(doc_id, ()):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self.built = False
+
+    def search(self, query: str, limit: int) -> List[Tuple[int, float]]:
+        """Return up to `limit` (doc_id, score) pairs, best match first."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            posting_lists = [self._postings.get(term, {}) for term in terms]
+            if not all(posting_lists):
+                return []
+            total_docs = len(self._doc_terms)
+            # Intersect starting from the rarest term to keep candidate sets small
+            ordered = sorted(posting_lists, key=len)
+            candidates = set(ordered[0])
+            for postings in ordered[1:]:
+                candidates.intersection_update(postings)
+                if not candidates:
+                    return []
+
+            scores = {}
+            for postings in posting_lists:
+                idf = math.log(1 + total_docs / len(postings))
+                for doc_id in candidates:
+                    scores[doc_id] = scores.get(doc_id, 0.0) + postings[doc_id] * idf
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+        return ranked[:limit]
+
+
+job_search_index = InvertedIndex()
+_build_lock = asyncio.Lock()
+
+
+def _job_fields(job) -> Dict[str, Optional[str]]:
+    return {field: getattr(job, field) for field in FIELD_WEIGHTS}
+
+
+def index_job(job: Job) -> None:
+    """Keep the in-process index in step with a created or updated job."""
+    if not job_search_index.built:
+        return
+    if job.status == "active":
+        job_search_index.add(job.id, _job_fields(job))
+    else:
+        job_search_index.remove(job.id)
+
+
+def unindex_job(job_id: int) -> None:
+    """Remove a deleted job from the in-process index."""
+    if job_search_index.built:
+        job_search_index.remove(job_id)
+
+
+async def _ensure_index_built(db: AsyncSession) -> None:
+    if job_search_index.built:
+        return
+    async with _build_lock:
+        if job_search_index.built:
+            return
+        result = await db.execute(
+            select(Job.id, *(getattr(Job, field) for field in FIELD_WEIGHTS)).filter(
+                Job.status == "active"
+            )
+        )
+        for row in result:
+            job_search_index.add(row.id, _job_fields(row))
+        job_search_index.built = True
+        logger.info(f"Built in-process job search index with {len(job_search_index)} jobs")
+
+
+def _ordered_by_ids(jobs: Iterable[Job], ranked: List[Tuple[int, float]]):
+    by_id = {job.id: job for job in jobs}
+    return [(by_id[doc_id], score) for doc_id, score in ranked if doc_id in by_id]
+
+
+def postgres_search_statement(query: str, limit: int):
+    """(job, rank) query matching jobs.search_vector through its GIN index."""
+    ts_query = func.websearch_to_tsquery("english", query)
+    search_vector = literal_column("jobs.search_vector")
+    rank = func.ts_rank_cd(search_vector, ts_query).label("rank")
+    return (
+        select(Job, rank)
+        .filter(Job.status == "active", search_vector.op("@@")(ts_query))
+        .order_by(rank.desc(), Job.id.desc())
+        .limit(limit)
+    )
+
+
+async def search_jobs(db: AsyncSession, query: str, limit: int) -> List[Tuple[Job, float]]:
+    """
+    Full-text search over active jobs, returning (job, rank) pairs best first.
+
+    On PostgreSQL this matches the generated jobs.search_vector column (created
+    by migration 5e07c4d9b2a1 or by init_db in create_all mode) through its GIN
+    index; elsewhere it falls back to the in-process inverted index.
+    """
+    if db.bind.dialect.name == "postgresql":
+        result = await db.execute(postgres_search_statement(query, limit))
+        return [(job, float(score)) for job, score in result.all()]
+
+    await _ensure_index_built(db)
+    ranked = job_search_index.search(query, limit)
+    if not ranked:
+        return []
+    result = await db.execute(select(Job).filter(Job.id.in_([doc_id for doc_id, _ in ranked])))
+    return _ordered_by_ids(result.scalars().all(), ranked)
@@ -0,0 +1,212 @@
+import asyncio
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+
+from app.config import get_settings
+
+
+class CacheBackend:
+    """
+    Minimal async key/value cache interface.
+
+    Keys are namespaced so several caches can share one external store.
+    """
+
+    def __init__(self, namespace: str, ttl: float):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, key: Any) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: Any) -> Optional[Any]:
+        raise NotImplementedError
+
+    async def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    async def delete(self, *keys: Any) -> None:
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    def delete_nowait(self, keys: Iterable[Any]) -> None:
+        """
+        Delete keys from synchronous code such as SQLAlchemy session events.
+        Backends that need I/O schedule the delete on the running event loop.
+        """
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {"namespace": self.namespace, "hits": self.hits, "misses": self.misses}
+
+
+class MemoryCache(CacheBackend):
+    """Bounded in-process LRU cache with per-entry expiry."""
+
+    def __init__(self, namespace: str, ttl: float, maxsize: int):
+        super().__init__(namespace, ttl)
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            entry = self._data.get(self._key(key))
+            return entry is not None and entry[0] > time.monotonic()
+
+    def get_nowait(self, key: Any) -> Optional[Any]:
+        full_key = self._key(key)
+        with self._lock:
+            entry = self._data.get(full_key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[full_key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(full_key)
+            self.hits += 1
+            return value
+
+    def set_nowait(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        full_key = self._key(key)
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[full_key] = (expires_at, value)
+            self._data.move_to_end(full_key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete_nowait(self, keys: Iterable[Any]) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(self._key(key), None)
+
+    async def get(self, key: Any) -> Optional[Any]:
+        return self.get_nowait(key)
+
+    async def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        self.set_nowait(key, value, ttl)
+
+    async def delete(self, *keys: Any) -> None:
+        self.delete_nowait(keys)
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        return {**super().stats(), "size": len(self._data), "maxsize": self.maxsize}
+
+
+class RedisCache(CacheBackend):
+    """
+    Shared cache backed by Redis, for deployments running several workers.
+    Requires the optional `redis` package.
+    """
+
+    def __init__(self, namespace: str, ttl: float, url: str):
+        super().__init__(namespace, ttl)
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError("CACHE_URL is set but the 'redis' package is not installed") from e
+        self._client = redis_asyncio.from_url(url)
+        self._pending: Set[asyncio.Task] = set()
+
+    async def get(self, key: Any) -> Optional[Any]:
+        raw = await self._client.get(self._key(key))
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(raw)
+
+    async def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        await self._client.set(self._key(key), pickle.dumps(value), px=int(ttl * 1000))
+
+    async def delete(self, *keys: Any) -> None:
+        if keys:
+            await self._client.delete(*(self._key(key) for key in keys))
+
+    async def clear(self) -> None:
+        async for full_key in self._client.scan_iter(match=f"{self.namespace}:*"):
+            await self._client.delete(full_key)
+
+    def delete_nowait(self, keys: Iterable[Any]) -> None:
+        keys = list(keys)
+        if not keys:
+            return
+        task = asyncio.get_running_loop().create_task(self.delete(*keys))
+        # Hold a reference until the task finishes so it is not garbage collected
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent computations of the same key within this process:
+    the first caller runs the factory and the others await its result, so an
+    expired hot entry is recomputed once rather than once per request.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Any, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: Any, factory: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The leader was cancelled (e.g. its client went away); retry
+                # unless this caller is the one being cancelled
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark failures as retrieved when nobody else was waiting
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+
+def create_cache(namespace: str, ttl: float, maxsize: int) -> CacheBackend:
+    """
+    Create a cache for `namespace`: Redis when CACHE_URL is configured,
+    otherwise a bounded in-process LRU.
+    """
+    settings = get_settings()
+    if settings.CACHE_URL:
+        return RedisCache(namespace, ttl, settings.CACHE_URL)
+    return MemoryCache(namespace, ttl, maxsize)
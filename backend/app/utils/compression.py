@@ -0,0 +1,92 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+# Content-coding suffixes added to ETags of compressed responses
+ETAG_CODING_SUFFIXES = ("-br", "-gzip")
+
+
+def accepts_encoding(accept_encoding: str, coding: str) -> bool:
+    """Whether an Accept-Encoding header allows `coding` (q=0 means refused)."""
+    for item in accept_encoding.lower().split(","):
+        name, *params = [part.strip() for part in item.split(";")]
+        if name != coding:
+            continue
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+class _ETagSuffixMixin:
+    """
+    Give compressed responses their own strong ETag ("abc" -> "abc-gzip"),
+    as each content-coding is a different representation.
+    """
+
+    _etag_tagged = False
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if not self._etag_tagged:
+            self._etag_tagged = True
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            etag = headers.get("etag")
+            if etag and etag.endswith('"'):
+                headers["ETag"] = f'{etag[:-1]}-{self.content_encoding}"'
+        return super().apply_compression(body, more_body=more_body)
+
+
+class _GZipResponder(_ETagSuffixMixin, GZipResponder):
+    pass
+
+
+class _BrotliResponder(_ETagSuffixMixin, IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app, minimum_size: int, quality: int):
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        super().apply_compression(body, more_body=more_body)
+        data = self.compressor.process(body)
+        return data + (self.compressor.flush() if more_body else self.compressor.finish())
+
+
+class CompressionMiddleware:
+    """
+    Compress responses of at least `minimum_size` bytes with brotli (when the
+    brotli package is installed and the client accepts it) or gzip.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        if brotli is not None and accepts_encoding(accept_encoding, "br"):
+            responder = _BrotliResponder(self.app, self.minimum_size, self.brotli_quality)
+        elif accepts_encoding(accept_encoding, "gzip"):
+            responder = _GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
@@ -0,0 +1,91 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Mapping, Optional, Tuple
+
+from fastapi import Request, Response, status
+
+from app.config import get_settings
+from app.utils.compression import ETAG_CODING_SUFFIXES
+
+settings = get_settings()
+
+# Clients may reuse a stored response only after revalidating it with us
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(versions: Iterable[Tuple[int, Optional[datetime]]], *extra: object) -> str:
+    """
+    Strong ETag over (id, updated_at) pairs plus anything else that shapes
+    the response (e.g. whether a next page exists). The app version is mixed
+    in so a change to the response schema invalidates every stored copy.
+    """
+    digest = hashlib.blake2b(settings.APP_VERSION.encode("utf-8"), digest_size=16)
+    for row_id, updated_at in versions:
+        digest.update(f"|{row_id}:{updated_at.isoformat() if updated_at else ''}".encode("utf-8"))
+    for value in extra:
+        digest.update(f"|{value!r}".encode("utf-8"))
+    return f'"{digest.hexdigest()}"'
+
+
+def last_modified(timestamps: Iterable[Optional[datetime]]) -> Optional[datetime]:
+    """Newest of `timestamps` as an aware UTC datetime (naive values are UTC)."""
+    newest = max((ts for ts in timestamps if ts is not None), default=None)
+    if newest is None:
+        return None
+    if newest.tzinfo is None:
+        return newest.replace(tzinfo=timezone.utc)
+    return newest.astimezone(timezone.utc)
+
+
+def _opaque_tag(etag: str) -> str:
+    """Strip the weak prefix and any content-coding suffix from an entity tag."""
+    tag = etag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    for suffix in ETAG_CODING_SUFFIXES:
+        if tag.endswith(suffix):
+            return tag[: -len(suffix)]
+    return tag
+
+
+def is_not_modified(request: Request, etag: str, modified: Optional[datetime] = None) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against the current validators.
+    If-None-Match takes precedence when both are sent (RFC 9110 13.2.2).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        current = _opaque_tag(etag)
+        return any(_opaque_tag(tag) == current for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have one-second resolution
+        return modified.replace(microsecond=0) <= since
+    return False
+
+
+def validator_headers(etag: str, modified: Optional[datetime] = None) -> Mapping[str, str]:
+    """ETag, Last-Modified and Cache-Control headers for a conditional response."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if modified is not None:
+        headers["Last-Modified"] = format_datetime(modified, usegmt=True)
+    return headers
+
+
+def not_modified(etag: str, modified: Optional[datetime] = None) -> Response:
+    """Empty 304 response carrying the validators the client should keep."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, modified),
+    )
@@ -0,0 +1,60 @@
+import csv
+import io
+from typing import Any, AsyncIterator, Sequence, Type
+
+from pydantic import BaseModel
+
+from app.utils.responses import get_type_adapter
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+
+# Leading characters a spreadsheet treats as the start of a formula
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_cell(value: Any) -> Any:
+    """A CSV cell for `value`, with text that would run as a formula quoted with '."""
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def ndjson_chunks(
+    batches: AsyncIterator[Sequence[Any]], row_type: Type[BaseModel]
+) -> AsyncIterator[bytes]:
+    """Encode batches of rows as newline-delimited JSON, one chunk per batch."""
+    adapter = get_type_adapter(row_type)
+    async for batch in batches:
+        yield b"".join(
+            adapter.dump_json(adapter.validate_python(row, from_attributes=True)) + b"\n"
+            for row in batch
+        )
+
+
+async def csv_chunks(
+    batches: AsyncIterator[Sequence[Any]], row_type: Type[BaseModel]
+) -> AsyncIterator[bytes]:
+    """
+    Encode batches of rows as CSV with a header row, one chunk per batch.
+    Text that a spreadsheet would evaluate as a formula is prefixed with '.
+    """
+    adapter = get_type_adapter(row_type)
+    fields = list(row_type.model_fields)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    async for batch in batches:
+        for row in batch:
+            values = adapter.dump_python(
+                adapter.validate_python(row, from_attributes=True), mode="json"
+            )
+            writer.writerow(_csv_cell(values[field]) for field in fields)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    # Header only, for an export without rows
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
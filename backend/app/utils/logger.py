@@ -1,12 +1,22 @@
+import atexit
+import copy
 import logging
+import queue
 import sys
+import threading
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import json
 from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 from app.config import CURRENT_LOGGING_CONFIG
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
 
 class CustomFormatter(logging.Formatter):
     """Custom formatter with colors for console output"""
@@ -29,14 +39,20 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: bold_red + format_str + reset,
     }
 
+    def __init__(self, datefmt: str = "%Y-%m-%d %H:%M:%S"):
+        super().__init__(datefmt=datefmt)
+        # Built once; creating a Formatter per record was a hot spot
+        self._formatters = {
+            level: logging.Formatter(fmt, datefmt=datefmt) for level, fmt in self.FORMATS.items()
+        }
+        self._default = logging.Formatter(self.format_str, datefmt=datefmt)
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt, datefmt="%Y-%m-%d %H:%M:%S")
-        return formatter.format(record)
+        return self._formatters.get(record.levelno, self._default).format(record)
 
 
 class JSONFormatter(logging.Formatter):
-    """JSON formatter for file output"""
+    """JSON formatter for file output. Uses orjson when it is installed."""
 
     def format(self, record):
         log_record = {
@@ -52,21 +68,237 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_record)
+        if orjson is not None:
+            return orjson.dumps(log_record, default=str).decode("utf-8")
+        return json.dumps(log_record, default=str)
+
+
+class DebugSampler(logging.Filter):
+    """
+    Keep one in every `every` DEBUG records per call site.
+
+    Applied on the logger, so discarded records are never formatted or
+    queued. Counters are not locked; under contention the rate is approximate.
+    """
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = every
+        self._seen: Dict[Tuple[str, int], int] = {}
+
+    def filter(self, record):
+        if record.levelno != logging.DEBUG:
+            return True
+        site = (record.pathname, record.lineno)
+        count = self._seen.get(site, 0)
+        self._seen[site] = count + 1
+        return count % self.every == 0
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Queue handler with a bounded queue and an explicit overflow policy.
+
+    Only the message interpolation happens on the calling thread; formatting
+    and file I/O are left to the QueueListener thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: str = "drop", block_timeout: float = 0.05):
+        super().__init__(log_queue)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        # Set once the listener has stopped, so late records are still written
+        self.direct: Optional[logging.Handler] = None
+
+    def emit(self, record):
+        if self.direct is not None:
+            self.direct.handle(record)
+        else:
+            super().emit(record)
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self.policy == "block":
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DispatchHandler(logging.Handler):
+    """
+    Listener-side handler routing each record to its logger's handler set.
+
+    Records from child loggers without a route of their own (they reached the
+    queue by propagating) go to the nearest configured ancestor's handlers,
+    as they would without the queue.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.routes: Dict[str, List[logging.Handler]] = {}
+
+    def _route(self, name: str) -> List[logging.Handler]:
+        while True:
+            handlers = self.routes.get(name)
+            if handlers is not None or "." not in name:
+                return handlers or []
+            name = name.rsplit(".", 1)[0]
+
+    def handle(self, record):
+        for handler in self._route(record.name):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record):  # pragma: no cover - handle() does the work
+        pass
+
+
+class _QueuePipeline:
+    """Process-wide log queue, its QueueListener thread and the real handlers."""
+
+    def __init__(self, size: int, policy: str, block_timeout: float):
+        self.queue: queue.Queue = queue.Queue(maxsize=size)
+        self.dispatcher = _DispatchHandler()
+        self.handler = BoundedQueueHandler(self.queue, policy, block_timeout)
+        self.listener = QueueListener(self.queue, self.dispatcher)
+        self.listener.start()
+
+    def stop(self) -> None:
+        """Drain the queue, stop the listener thread and close the handlers."""
+        self.listener.stop()
+        self.handler.direct = self.dispatcher
+        # Shared handler sets appear under many routes; close each once.
+        # File handlers reopen their stream if a late record arrives.
+        closed = set()
+        for handlers in self.dispatcher.routes.values():
+            for handler in handlers:
+                if id(handler) not in closed:
+                    closed.add(id(handler))
+                    handler.close()
+
+
+_shared_handlers: Dict[Optional[Path], List[logging.Handler]] = {}
+_console_handler: Optional[logging.Handler] = None
+_handlers_lock = threading.Lock()
+
+
+def _get_shared_handlers(log_dir: Optional[Path]) -> List[logging.Handler]:
+    """
+    Process-wide handler set shared by every logger: one console handler plus
+    one app.log / app.error.log pair per log directory.
+    """
+    global _console_handler
+    key = Path(log_dir) if log_dir else None
+    with _handlers_lock:
+        handlers = _shared_handlers.get(key)
+        if handlers is not None:
+            return handlers
+
+        # Console Handler
+        if _console_handler is None:
+            _console_handler = logging.StreamHandler(sys.stdout)
+            _console_handler.setFormatter(CustomFormatter())
+        handlers = [_console_handler]
+
+        # File Handlers (if log_dir is provided)
+        if key is not None:
+            key.mkdir(parents=True, exist_ok=True)
+            json_formatter = JSONFormatter()
+
+            # Regular log file
+            file_handler = RotatingFileHandler(
+                filename=key / "app.log",
+                maxBytes=10485760,  # 10MB
+                backupCount=5,
+                encoding="utf-8",
+            )
+            file_handler.setFormatter(json_formatter)
+            handlers.append(file_handler)
+
+            # Error log file
+            error_handler = RotatingFileHandler(
+                filename=key / "app.error.log",
+                maxBytes=10485760,  # 10MB
+                backupCount=5,
+                encoding="utf-8",
+            )
+            error_handler.setLevel(logging.ERROR)
+            error_handler.setFormatter(json_formatter)
+            handlers.append(error_handler)
+
+        _shared_handlers[key] = handlers
+        return handlers
+
+
+_pipeline: Optional[_QueuePipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def _get_pipeline() -> _QueuePipeline:
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = _QueuePipeline(
+                CURRENT_LOGGING_CONFIG["queue_size"],
+                CURRENT_LOGGING_CONFIG["queue_policy"],
+                CURRENT_LOGGING_CONFIG["queue_block_timeout"],
+            )
+            atexit.register(shutdown_logging)
+        return _pipeline
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background logging thread."""
+    global _pipeline
+    with _pipeline_lock:
+        pipeline, _pipeline = _pipeline, None
+    if pipeline is not None:
+        pipeline.stop()
+
+
+def get_logging_stats() -> dict:
+    """Queue depth and dropped-record count of the queued logging pipeline."""
+    if _pipeline is None:
+        return {"queued": False}
+    return {
+        "queued": True,
+        "queue_size": _pipeline.queue.qsize(),
+        "queue_maxsize": _pipeline.queue.maxsize,
+        "policy": _pipeline.handler.policy,
+        "dropped": _pipeline.handler.dropped,
+    }
 
 
 def setup_logger(
     name: str,
     log_level: str = CURRENT_LOGGING_CONFIG["log_level"],
     log_dir: Path = CURRENT_LOGGING_CONFIG["log_dir"],
+    use_queue: bool = CURRENT_LOGGING_CONFIG["queue"],
+    debug_sample_every: int = CURRENT_LOGGING_CONFIG["debug_sample_every"],
 ) -> logging.Logger:
     """
     Set up a logger with both console and file handlers
 
+    Every logger writes through the same process-wide handlers, so all
+    modules share app.log and app.error.log in log_dir.
+
     Args:
         name: Name of the logger
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: Directory for log files
+        use_queue: Hand records to a background thread instead of writing
+            them on the calling thread
+        debug_sample_every: Keep one in every N DEBUG records per call site
 
     Returns:
         logging.Logger: Configured logger instance
@@ -75,38 +307,20 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Remove existing handlers
+    # Remove existing handlers and filters
     logger.handlers = []
+    logger.filters = [f for f in logger.filters if not isinstance(f, DebugSampler)]
+    if debug_sample_every > 1:
+        logger.addFilter(DebugSampler(debug_sample_every))
+
+    handlers = _get_shared_handlers(log_dir)
 
-    # Console Handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(CustomFormatter())
-    logger.addHandler(console_handler)
-
-    # File Handler (if log_dir is provided)
-    if log_dir:
-        log_dir = Path(log_dir)
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        # Regular log file
-        file_handler = RotatingFileHandler(
-            filename=log_dir / f"{name}.log",
-            maxBytes=10485760,  # 10MB
-            backupCount=5,
-            encoding="utf-8",
-        )
-        file_handler.setFormatter(JSONFormatter())
-        logger.addHandler(file_handler)
-
-        # Error log file
-        error_handler = RotatingFileHandler(
-            filename=log_dir / f"{name}.error.log",
-            maxBytes=10485760,  # 10MB
-            backupCount=5,
-            encoding="utf-8",
-        )
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(JSONFormatter())
-        logger.addHandler(error_handler)
+    if use_queue:
+        pipeline = _get_pipeline()
+        pipeline.dispatcher.routes[name] = handlers
+        logger.addHandler(pipeline.handler)
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     return logger
@@ -0,0 +1,296 @@
+import bisect
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Latency buckets in seconds, Prometheus-style upper bounds
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed durations (seconds)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def cumulative_counts(self):
+        """Return [(upper_bound, cumulative_count), ...] ending with +Inf."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self._counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.sum, 6),
+            "buckets": {
+                ("+Inf" if bound == float("inf") else str(bound)): count
+                for bound, count in self.cumulative_counts()
+            },
+        }
+
+
+class RequestStats:
+    """SQL activity of the request currently being served."""
+
+    __slots__ = ("statements", "db_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+class RouteMetrics:
+    """Per-route latency histogram plus status, SQL and byte counters."""
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.statuses: Dict[int, int] = defaultdict(int)
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.response_bytes = 0
+
+
+class MetricsRegistry:
+    """Process-wide request metrics keyed by (method, route template)."""
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        stats: RequestStats,
+        response_bytes: int,
+    ) -> None:
+        key = (method, route)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self.routes.setdefault(key, RouteMetrics())
+        metrics.latency.observe(duration)
+        with self._lock:
+            metrics.statuses[status] += 1
+            metrics.statements += stats.statements
+            metrics.db_seconds += stats.db_seconds
+            metrics.response_bytes += response_bytes
+
+    def reset(self) -> None:
+        with self._lock:
+            self.routes.clear()
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = [
+            "# HELP http_requests_total Requests served, by route and status code.",
+            "# TYPE http_requests_total counter",
+        ]
+        routes = sorted(self.routes.items())
+        for (method, route), metrics in routes:
+            for status, count in sorted(metrics.statuses.items()):
+                labels = _labels(method=method, route=route, status=status)
+                lines.append(f"http_requests_total{labels} {count}")
+
+        lines += [
+            "# HELP http_request_duration_seconds Request latency, by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), metrics in routes:
+            lines += render_histogram(
+                "http_request_duration_seconds", metrics.latency, method=method, route=route
+            )
+
+        for name, attr, help_text in (
+            ("http_request_db_statements_total", "statements", "SQL statements executed."),
+            ("http_request_db_seconds_total", "db_seconds", "Time spent executing SQL."),
+            ("http_response_bytes_total", "response_bytes", "Response body bytes sent."),
+        ):
+            lines += [f"# HELP {name} {help_text[:-1]}, by route.", f"# TYPE {name} counter"]
+            for (method, route), metrics in routes:
+                value = getattr(metrics, attr)
+                lines.append(f"{name}{_labels(method=method, route=route)} {_number(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+def render_histogram(name: str, histogram: Histogram, **labels) -> List[str]:
+    """Prometheus lines (_bucket, _sum, _count) for one labelled histogram."""
+    lines = []
+    for bound, count in histogram.cumulative_counts():
+        bucket_labels = _labels(**labels, le=_number(bound))
+        lines.append(f"{name}_bucket{bucket_labels} {count}")
+    lines.append(f"{name}_sum{_labels(**labels)} {_number(histogram.sum)}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+    return lines
+
+
+def _render_samples(
+    name: str, kind: str, help_text: str, samples: Iterable[Tuple[dict, float]]
+) -> List[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines += [f"{name}{_labels(**labels)} {_number(value)}" for labels, value in samples]
+    return lines
+
+
+def render_gauges(name: str, help_text: str, samples: Iterable[Tuple[dict, float]]) -> List[str]:
+    """Prometheus lines for a gauge with one sample per label set."""
+    return _render_samples(name, "gauge", help_text, samples)
+
+
+def render_counters(name: str, help_text: str, samples: Iterable[Tuple[dict, float]]) -> List[str]:
+    """
+    Prometheus lines for a monotonic counter with one sample per label set.
+    `name` gets the conventional _total suffix.
+    """
+    return _render_samples(f"{name}_total", "counter", help_text, samples)
+
+
+metrics_registry = MetricsRegistry()
+
+
+class StartupTimings:
+    """Wall-clock time of each cold-start phase, in the order they ran."""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, phase: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - started)
+
+    def summary(self) -> str:
+        parts = [f"{phase}={seconds * 1000:.1f}ms" for phase, seconds in self.phases.items()]
+        parts.append(f"total={sum(self.phases.values()) * 1000:.1f}ms")
+        return ", ".join(parts)
+
+
+startup_timings = StartupTimings()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Count statements and time spent in SQL for the current request."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _request_stats.get() is not None:
+            context._metrics_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _request_stats.get()
+        started = getattr(context, "_metrics_started", None)
+        if stats is None or started is None:
+            return
+        stats.statements += 1
+        stats.db_seconds += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status, SQL time and response size per
+    route template, and adding a Server-Timing header to every response.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = metrics_registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+        response_bytes = 0
+
+        async def send_wrapper(message):
+            nonlocal status, response_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                server_timing = (
+                    f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.statements} queries", '
+                    f"app;dur={elapsed_ms:.1f}"
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            route = scope.get("route")
+            # Unmatched paths share one label to keep cardinality bounded
+            template = getattr(route, "path", None) or "unmatched"
+            self.registry.record(
+                scope["method"],
+                template,
+                status,
+                time.perf_counter() - started,
+                stats,
+                response_bytes,
+            )
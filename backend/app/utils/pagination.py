@@ -0,0 +1,54 @@
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import func, literal, tuple_
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque URL-safe token."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a token produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def keyset_sort_key(column, dialect_name: str):
+    """
+    Return the expression used to order and compare a timestamp column.
+
+    SQLite stores func.now() defaults as 'YYYY-MM-DD HH:MM:SS' while bound
+    datetimes carry microseconds, so plain string comparison breaks ties.
+    julianday() normalises both sides there; other databases compare natively
+    so the composite indexes stay usable.
+    """
+    if dialect_name == "sqlite":
+        return func.julianday(column)
+    return column
+
+
+def keyset_before(created_col, id_col, cursor: Optional[str], dialect_name: str):
+    """
+    Build the WHERE clause selecting rows after `cursor` in
+    (created_at DESC, id DESC) order, or None for the first page.
+    """
+    if not cursor:
+        return None
+    created_at, row_id = decode_cursor(cursor)
+    bound = literal(created_at, created_col.type)
+    return tuple_(keyset_sort_key(created_col, dialect_name), id_col) < tuple_(
+        keyset_sort_key(bound, dialect_name), row_id
+    )
@@ -0,0 +1,138 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from app.config import get_settings
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+settings = get_settings()
+
+
+@lru_cache(maxsize=None)
+def get_pwd_context() -> "CryptContext":
+    """
+    The bcrypt CryptContext, built on first use so passlib and bcrypt are not
+    imported during worker start-up.
+
+    Hashes created with a different cost factor report needs_update() and are
+    upgraded transparently on the next successful login.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+    )
+
+
+def __getattr__(name: str):
+    # `pwd_context` is still importable by name; it is built on access
+    if name == "pwd_context":
+        return get_pwd_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full and the request should be shed."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a bounded thread pool so it never blocks the event loop.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism
+    without the pickling and start-up cost of a process pool. At most
+    `max_workers` hashes run at once; up to `max_queue` more may wait, beyond
+    which callers get PasswordHasherBusy.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.pending = 0  # running + waiting; only touched on the event loop thread
+        self.peak_queue_depth = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hasher"
+            )
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker thread."""
+        return max(0, self.pending - self.max_workers)
+
+    async def run(self, func, *args):
+        """Run `func(*args)` on the pool, tracking queue depth and timings."""
+        if self.queue_depth >= self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy("Password hashing queue is full")
+
+        submitted_at = time.perf_counter()
+
+        def _timed():
+            started_at = time.perf_counter()
+            return started_at, func(*args), time.perf_counter()
+
+        self.pending += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            started_at, result, finished_at = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), _timed
+            )
+        finally:
+            self.pending -= 1
+
+        self.completed += 1
+        self.total_wait_seconds += started_at - submitted_at
+        self.total_run_seconds += finished_at - started_at
+        return result
+
+    def stats(self) -> dict:
+        completed = self.completed or 1
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": min(self.pending, self.max_workers),
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait_seconds / completed * 1000, 2),
+            "avg_run_ms": round(self.total_run_seconds / completed * 1000, 2),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS, max_queue=settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password off the event loop."""
+    return await password_hasher.run(get_pwd_context().hash, password)
+
+
+async def verify_and_update_password(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password off the event loop.
+
+    Returns (matches, new_hash); new_hash is set when the stored hash uses an
+    outdated cost factor and should replace it.
+    """
+    return await password_hasher.run(get_pwd_context().verify_and_update, password, hashed)
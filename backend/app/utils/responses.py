@@ -0,0 +1,58 @@
+import json
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+class FastJSONResponse(JSONResponse):
+    """App-wide JSON response rendered with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(response_type: Any) -> TypeAdapter:
+    """Build each TypeAdapter (and its compiled validator/serializer) once."""
+    return TypeAdapter(response_type)
+
+
+def dump_json(response_type: Any, data: Any) -> bytes:
+    """
+    Validate ORM objects (or rows, or dicts holding them) against
+    `response_type` once and serialize straight to JSON bytes in pydantic-core.
+    """
+    adapter = get_type_adapter(response_type)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def model_response(
+    response_type: Any,
+    data: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Response for list endpoints. Returning a Response skips FastAPI's own
+    validate-then-serialize pass on the route's response_model, which stays
+    declared for the OpenAPI schema.
+    """
+    return Response(
+        dump_json(response_type, data),
+        status_code=status_code,
+        media_type=JSON_MEDIA_TYPE,
+        headers=headers,
+    )
@@ -0,0 +1,70 @@
+"""
+Compare two benchmark result files and flag latency/throughput regressions.
+
+    python -m benchmarks.compare baseline.json candidate.json --threshold 10
+
+Exits with status 1 when any endpoint's p95 or p99 grows, or its throughput
+drops, by more than the threshold percentage.
+"""
+
+import json
+from pathlib import Path
+
+import typer
+
+cli = typer.Typer()
+
+# (metric, True when higher is better)
+METRICS = [("throughput_rps", True), ("p50_ms", False), ("p95_ms", False), ("p99_ms", False)]
+GATED = {"throughput_rps", "p95_ms", "p99_ms"}
+
+
+def change_pct(before: float, after: float) -> float:
+    if not before:
+        return 0.0
+    return (after - before) / before * 100
+
+
+@cli.command()
+def main(
+    baseline: Path = typer.Argument(..., exists=True),
+    candidate: Path = typer.Argument(..., exists=True),
+    threshold: float = typer.Option(10.0, help="Allowed regression in percent"),
+):
+    """Print per-endpoint deltas between two runs."""
+    before = json.loads(baseline.read_text())
+    after = json.loads(candidate.read_text())
+    typer.echo(f"baseline:  {before['meta'].get('commit')} ({before['meta'].get('timestamp')})")
+    typer.echo(f"candidate: {after['meta'].get('commit')} ({after['meta'].get('timestamp')})")
+    for key in ("scale", "concurrency", "target", "database"):
+        if before["meta"].get(key) != after["meta"].get(key):
+            typer.secho(
+                f"warning: {key} differs ({before['meta'].get(key)} vs {after['meta'].get(key)})",
+                fg=typer.colors.YELLOW,
+            )
+
+    regressions = []
+    header = f"{'endpoint':<28}" + "".join(f"{metric:>24}" for metric, _ in METRICS)
+    typer.echo(header)
+    for name in sorted(set(before["endpoints"]) & set(after["endpoints"]) - {"_total"}):
+        cells = []
+        for metric, higher_is_better in METRICS:
+            old = before["endpoints"][name][metric]
+            new = after["endpoints"][name][metric]
+            delta = change_pct(old, new)
+            worse = -delta if higher_is_better else delta
+            if metric in GATED and worse > threshold:
+                regressions.append(f"{name} {metric}: {old} -> {new} ({delta:+.1f}%)")
+            cells.append(f"{old:>9} -> {new:<9}{delta:+5.0f}%")
+        typer.echo(f"{name:<28}" + "".join(f"{cell:>24}" for cell in cells))
+
+    if regressions:
+        typer.secho("Regressions:", fg=typer.colors.RED)
+        for line in regressions:
+            typer.echo(f"  {line}")
+        raise typer.Exit(code=1)
+    typer.secho("No regressions above threshold", fg=typer.colors.GREEN)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,98 @@
+"""
+Measure how long importing the app takes in a fresh interpreter, which is
+what every worker spawn and serverless cold start pays before serving.
+
+    python -m benchmarks.importtime --runs 5 --top 15 --budget-ms 1500
+
+Each run is a new `python -X importtime -c "import app.main"` process. The
+report shows the median total and the packages contributing the most
+self time, and the command exits non-zero when the median exceeds
+--budget-ms.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import typer
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Median cold import of app.main must stay under this; enforced by the opt-in
+# benchmark in tests/unit/test_import_time.py. FastAPI and its OpenAPI models
+# alone take roughly half of it.
+IMPORT_BUDGET_MS = 1500
+
+cli = typer.Typer()
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) for each line of -X importtime output."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def measure_import(module: str = "app.main") -> Tuple[float, Dict[str, float]]:
+    """
+    Import `module` in a fresh interpreter.
+
+    Returns the cumulative import time of `module` in milliseconds and the
+    self time of every top-level package in milliseconds.
+    """
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    env.setdefault("ENVIRONMENT", "testing")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = parse_importtime(completed.stderr)
+    total_us = max(cumulative for name, _, cumulative in modules if name == module)
+    packages: Dict[str, float] = defaultdict(float)
+    for name, self_us, _ in modules:
+        packages[name.split(".", 1)[0]] += self_us / 1000
+    return total_us / 1000, dict(packages)
+
+
+@cli.command()
+def main(
+    module: str = typer.Option("app.main", help="Module to import"),
+    runs: int = typer.Option(5, help="Fresh interpreters to time"),
+    top: int = typer.Option(15, help="Packages to list by self time"),
+    budget_ms: Optional[float] = typer.Option(None, help="Fail when the median exceeds this"),
+):
+    totals = []
+    package_runs: Dict[str, List[float]] = defaultdict(list)
+    for _ in range(runs):
+        total, packages = measure_import(module)
+        totals.append(total)
+        for package, ms in packages.items():
+            package_runs[package].append(ms)
+
+    median = statistics.median(totals)
+    typer.echo(f"import {module}: median {median:.1f} ms "
+               f"(min {min(totals):.1f}, max {max(totals):.1f}, {runs} runs)")
+    typer.echo(f"{'package':<28}{'self ms':>10}")
+    ranked = sorted(package_runs.items(), key=lambda item: -statistics.median(item[1]))
+    for package, samples in ranked[:top]:
+        typer.echo(f"{package:<28}{statistics.median(samples):>10.1f}")
+
+    if budget_ms is not None and median > budget_ms:
+        typer.secho(f"Over budget: {median:.1f} ms > {budget_ms:.1f} ms", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,341 @@
+"""
+Drive concurrent, mixed traffic against the API and report latency per endpoint.
+
+    python -m benchmarks.run --scale 10k --seed-data --concurrency 32 --duration 30
+    python -m benchmarks.run --url http://localhost:8000 --duration 60
+
+Without --url the ASGI app is driven in-process through httpx; client and
+server then share one event loop, so absolute numbers are pessimistic but
+comparable between commits. Results are written as JSON (see compare.py).
+"""
+
+import asyncio
+import json
+import math
+import platform
+import random
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import httpx
+import typer
+from sqlalchemy import select
+
+from app.config import get_settings
+from app.db.database import get_engine
+from app.db.models import Job, JobApplication, User
+from app.db.seed import SCALES, SEED_EMAIL_DOMAIN, SEED_PASSWORD, seed_dataset
+
+settings = get_settings()
+cli = typer.Typer()
+
+RESULTS_DIR = Path(__file__).parent / "results"
+API = settings.API_PREFIX
+SEARCH_TERMS = ["engineer", "python", "remote data", "manager", "sales", "react developer"]
+STATUS_UPDATES = ["under_review", "interview_scheduled", "interview_completed", "rejected"]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+@dataclass
+class Accounts:
+    seekers: List[dict] = field(default_factory=list)  # {"headers": ...}
+    employers: List[dict] = field(default_factory=list)  # {"headers": ..., "applications": [...]}
+    job_ids: List[int] = field(default_factory=list)
+
+
+@dataclass
+class Operation:
+    name: str
+    weight: int
+    call: Callable  # async (client, accounts, rng) -> httpx.Response
+    ok_statuses: tuple = (200,)
+
+
+async def _list_jobs(client, accounts, rng):
+    params = {"limit": 20}
+    roll = rng.random()
+    if roll < 0.2:
+        params["location"] = "Remote"
+    elif roll < 0.3:
+        params["employment_type"] = "contract"
+    elif roll < 0.4:
+        params["min_salary"] = 80_000
+    return await client.get(f"{API}/jobs", params=params, headers=rng.choice(accounts.seekers)["headers"])
+
+
+async def _list_jobs_page_two(client, accounts, rng):
+    headers = rng.choice(accounts.seekers)["headers"]
+    first = await client.get(f"{API}/jobs", params={"limit": 20}, headers=headers)
+    cursor = first.headers.get("x-next-cursor")
+    if not cursor:
+        return first
+    return await client.get(f"{API}/jobs", params={"limit": 20, "cursor": cursor}, headers=headers)
+
+
+async def _get_job(client, accounts, rng):
+    job_id = rng.choice(accounts.job_ids)
+    return await client.get(f"{API}/jobs/{job_id}", headers=rng.choice(accounts.seekers)["headers"])
+
+
+async def _search_jobs(client, accounts, rng):
+    return await client.get(
+        f"{API}/jobs/search",
+        params={"q": rng.choice(SEARCH_TERMS)},
+        headers=rng.choice(accounts.seekers)["headers"],
+    )
+
+
+async def _apply(client, accounts, rng):
+    return await client.post(
+        f"{API}/applications",
+        json={"job_id": rng.choice(accounts.job_ids), "resume_url": "https://example.com/cv.pdf"},
+        headers=rng.choice(accounts.seekers)["headers"],
+    )
+
+
+async def _my_applications(client, accounts, rng):
+    return await client.get(
+        f"{API}/applications/my-applications/summary", headers=rng.choice(accounts.seekers)["headers"]
+    )
+
+
+async def _update_status(client, accounts, rng):
+    employer = rng.choice(accounts.employers)
+    return await client.put(
+        f"{API}/applications/{rng.choice(employer['applications'])}/status",
+        json={"status": rng.choice(STATUS_UPDATES)},
+        headers=employer["headers"],
+    )
+
+
+async def _employer_analytics(client, accounts, rng):
+    return await client.get(f"{API}/analytics/employer", headers=rng.choice(accounts.employers)["headers"])
+
+
+async def _employer_timeline(client, accounts, rng):
+    end = date.today()
+    return await client.get(
+        f"{API}/analytics/employer/timeline",
+        params={"start_date": (end - timedelta(days=30)).isoformat(), "end_date": end.isoformat()},
+        headers=rng.choice(accounts.employers)["headers"],
+    )
+
+
+OPERATIONS = [
+    Operation("list_jobs", 30, _list_jobs),
+    Operation("list_jobs_page_two", 5, _list_jobs_page_two),
+    Operation("get_job", 15, _get_job),
+    Operation("search_jobs", 10, _search_jobs),
+    # Re-applying to the same job is rejected with 400, which is expected here
+    Operation("apply", 10, _apply, ok_statuses=(200, 400)),
+    Operation("my_applications", 8, _my_applications),
+    Operation("update_application_status", 10, _update_status),
+    Operation("employer_analytics", 7, _employer_analytics),
+    Operation("employer_timeline", 5, _employer_timeline),
+]
+
+
+async def _login(client: httpx.AsyncClient, email: str) -> dict:
+    response = await client.post(f"{API}/auth/login", json={"email": email, "password": SEED_PASSWORD})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _load_accounts(client: httpx.AsyncClient, n_seekers: int, n_employers: int) -> Accounts:
+    """Pick seeded accounts and data straight from the database, then log in."""
+    accounts = Accounts()
+    seeded = User.email.like(f"%@{SEED_EMAIL_DOMAIN}")
+    async with get_engine().connect() as conn:
+        seeker_emails = (await conn.execute(
+            select(User.email).where(seeded, User.is_supervisor.is_(False)).limit(n_seekers)
+        )).scalars().all()
+        # Employers that have received applications
+        employer_ids = (await conn.execute(
+            select(Job.posted_by_id)
+            .join(JobApplication, JobApplication.job_id == Job.id)
+            .group_by(Job.posted_by_id)
+            .order_by(Job.posted_by_id)
+            .limit(n_employers)
+        )).scalars().all()
+        for employer_id in employer_ids:
+            email = (await conn.execute(select(User.email).where(User.id == employer_id))).scalar()
+            applications = (await conn.execute(
+                select(JobApplication.id)
+                .join(Job, Job.id == JobApplication.job_id)
+                .where(Job.posted_by_id == employer_id)
+                .limit(500)
+            )).scalars().all()
+            accounts.employers.append({"email": email, "applications": applications})
+        accounts.job_ids = (await conn.execute(
+            select(Job.id).where(Job.status == "active").order_by(Job.id.desc()).limit(5_000)
+        )).scalars().all()
+
+    if not seeker_emails or not accounts.employers or not accounts.job_ids:
+        raise typer.BadParameter("No seeded data found; run with --seed-data first")
+
+    for email in seeker_emails:
+        accounts.seekers.append({"email": email, "headers": await _login(client, email)})
+    for employer in accounts.employers:
+        employer["headers"] = await _login(client, employer["email"])
+    return accounts
+
+
+async def _worker(client, accounts, rng, deadline, samples, operations, weights):
+    while time.perf_counter() < deadline:
+        operation = rng.choices(operations, weights)[0]
+        started = time.perf_counter()
+        try:
+            response = await operation.call(client, accounts, rng)
+            status = response.status_code
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        samples[operation.name].append(
+            (time.perf_counter() - started, status in operation.ok_statuses, status)
+        )
+
+
+def summarize(samples: Dict[str, list], elapsed: float) -> Dict[str, dict]:
+    report = {}
+    for name, entries in sorted(samples.items()):
+        latencies = sorted(duration * 1000 for duration, _, _ in entries)
+        errors = [status for _, ok, status in entries if not ok]
+        report[name] = {
+            "requests": len(entries),
+            "errors": len(errors),
+            "error_statuses": sorted({str(status) for status in errors}),
+            "throughput_rps": round(len(entries) / elapsed, 2),
+            "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        }
+    total = sum(len(entries) for entries in samples.values())
+    report["_total"] = {"requests": total, "throughput_rps": round(total / elapsed, 2)}
+    return report
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def _run(url, scale, seed_data, seed, concurrency, duration, warmup, seekers, employers, only):
+    if seed_data:
+        typer.echo(f"Seeding {scale} dataset...")
+        counts = await seed_dataset(get_engine(), SCALES[scale], seed=seed)
+        typer.echo(f"Seeded {counts}")
+
+    operations = [op for op in OPERATIONS if not only or op.name in only]
+    weights = [op.weight for op in operations]
+
+    if url:
+        client = httpx.AsyncClient(base_url=url, timeout=30, limits=httpx.Limits(max_connections=concurrency))
+        lifespan = None
+    else:
+        from app.main import app
+
+        lifespan = app.router.lifespan_context(app)
+        await lifespan.__aenter__()
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=30)
+
+    try:
+        async with client:
+            accounts = await _load_accounts(client, seekers, employers)
+            if warmup:
+                typer.echo(f"Warming up for {warmup}s...")
+                discard = {op.name: [] for op in operations}
+                deadline = time.perf_counter() + warmup
+                await asyncio.gather(*(
+                    _worker(client, accounts, random.Random(seed + i), deadline, discard, operations, weights)
+                    for i in range(concurrency)
+                ))
+
+            typer.echo(f"Running {concurrency} workers for {duration}s...")
+            samples = {op.name: [] for op in operations}
+            started = time.perf_counter()
+            await asyncio.gather(*(
+                _worker(client, accounts, random.Random(seed * 1000 + i), started + duration,
+                        samples, operations, weights)
+                for i in range(concurrency)
+            ))
+            elapsed = time.perf_counter() - started
+    finally:
+        if lifespan is not None:
+            await lifespan.__aexit__(None, None, None)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+            "target": url or "in-process",
+            "database": get_engine().dialect.name,
+            "scale": scale,
+            "concurrency": concurrency,
+            "duration_seconds": round(elapsed, 2),
+            "python": platform.python_version(),
+        },
+        "endpoints": summarize(samples, elapsed),
+    }
+
+
+def print_report(result: dict) -> None:
+    typer.echo(f"{'endpoint':<28}{'reqs':>8}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, stats in result["endpoints"].items():
+        if name == "_total":
+            continue
+        typer.echo(
+            f"{name:<28}{stats['requests']:>8}{stats['errors']:>6}{stats['throughput_rps']:>9}"
+            f"{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['p99_ms']:>9}"
+        )
+    total = result["endpoints"]["_total"]
+    typer.echo(f"{'total':<28}{total['requests']:>8}{'':>6}{total['throughput_rps']:>9}")
+
+
+@cli.command()
+def main(
+    url: Optional[str] = typer.Option(None, help="Base URL of a running server; in-process when omitted"),
+    scale: str = typer.Option("10k", help=f"Dataset size: {', '.join(SCALES)}"),
+    seed_data: bool = typer.Option(False, "--seed-data", help="Insert the synthetic dataset first"),
+    seed: int = typer.Option(42, help="Random seed for data and traffic"),
+    concurrency: int = typer.Option(16, help="Concurrent virtual users"),
+    duration: float = typer.Option(30.0, help="Measured run length in seconds"),
+    warmup: float = typer.Option(5.0, help="Unmeasured warm-up in seconds"),
+    seekers: int = typer.Option(20, help="Job seeker accounts to log in"),
+    employers: int = typer.Option(5, help="Employer accounts to log in"),
+    only: List[str] = typer.Option([], help="Restrict traffic to these operations"),
+    output: Optional[Path] = typer.Option(None, help="Result file (default: benchmarks/results/)"),
+):
+    """Run the benchmark and save the results as JSON."""
+    if scale not in SCALES:
+        raise typer.BadParameter(f"scale must be one of {', '.join(SCALES)}")
+    result = asyncio.run(
+        _run(url, scale, seed_data, seed, concurrency, duration, warmup, seekers, employers, only)
+    )
+    print_report(result)
+
+    if output is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        output = RESULTS_DIR / f"{stamp}-{result['meta']['commit'] or 'nogit'}-{scale}.json"
+    output.write_text(json.dumps(result, indent=2))
+    typer.echo(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    cli()
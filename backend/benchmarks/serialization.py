@@ -0,0 +1,130 @@
+"""
+Compare FastAPI's default response path with the TypeAdapter fast path on
+large lists of ORM objects.
+
+    python -m benchmarks.serialization --rows 1000 --repeat 20
+
+The default path validates the route's return value against response_model,
+serializes it to Python primitives and then encodes those with json.dumps.
+The fast path validates from attributes once and lets pydantic-core write
+JSON bytes directly.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import typer
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.db.models import Interview, Job, JobApplication, User
+from app.schemas.applications import JobApplicationResponse
+from app.schemas.jobs import JobResponse
+from app.utils.responses import FastJSONResponse, dump_json
+
+cli = typer.Typer()
+
+
+def build_jobs(count: int) -> List[Job]:
+    now = datetime(2025, 1, 1)
+    return [
+        Job(
+            id=index, title=f"Software Engineer {index}", company_name="Acme", location="Remote",
+            description="A long job description. " * 40, requirements="Python, SQL, FastAPI",
+            salary_min=90_000.0, salary_max=120_000.0, employment_type="full-time",
+            status="active", created_at=now, updated_at=now, posted_by_id=1,
+        )
+        for index in range(count)
+    ]
+
+
+def build_applications(count: int) -> List[JobApplication]:
+    now = datetime(2025, 1, 1)
+    applicant = User(
+        id=2, email="seeker@example.com", username="seeker", role="user", is_supervisor=False,
+        is_superuser=False, is_active=True, email_verified=True, created_at=now, updated_at=now,
+    )
+    applications = []
+    for index, job in enumerate(build_jobs(count)):
+        application = JobApplication(
+            id=index, job_id=job.id, applicant_id=applicant.id, cover_letter="Hello " * 20,
+            resume_url="https://example.com/cv.pdf", status="applied",
+            created_at=now, updated_at=now, job=job, applicant=applicant,
+        )
+        application.interviews = [
+            Interview(
+                id=index * 2 + n, application_id=index, scheduled_at=now + timedelta(days=n),
+                duration_minutes=60, interview_type="technical", status="scheduled",
+                created_at=now, updated_at=now,
+            )
+            for n in range(2)
+        ]
+        applications.append(application)
+    return applications
+
+
+async def _default_path(response_type, data, response_class) -> bytes:
+    field = create_model_field(name="response", type_=response_type, mode="serialization")
+    content = await serialize_response(field=field, response_content=data)
+    return response_class(content).body
+
+
+def _time(func: Callable[[], bytes], repeat: int) -> dict:
+    func()  # warm up adapters and caches
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {"median_ms": round(samples[len(samples) // 2], 3), "min_ms": round(samples[0], 3)}
+
+
+@cli.command()
+def main(
+    rows: int = typer.Option(1000, help="Objects per response"),
+    repeat: int = typer.Option(20, help="Timed repetitions per case"),
+    output: Optional[Path] = typer.Option(None, help="Write results as JSON"),
+):
+    """Time default vs fast serialization for job and application lists."""
+    loop = asyncio.new_event_loop()
+    cases = {
+        "jobs": (List[JobResponse], build_jobs(rows)),
+        "applications": (List[JobApplicationResponse], build_applications(rows)),
+    }
+    results = {}
+    for name, (response_type, data) in cases.items():
+        default = _time(
+            lambda: loop.run_until_complete(_default_path(response_type, data, JSONResponse)), repeat
+        )
+        default_orjson = _time(
+            lambda: loop.run_until_complete(_default_path(response_type, data, FastJSONResponse)), repeat
+        )
+        fast = _time(lambda: dump_json(response_type, data), repeat)
+        assert json.loads(dump_json(response_type, data)) == json.loads(
+            loop.run_until_complete(_default_path(response_type, data, JSONResponse))
+        )
+        results[name] = {
+            "rows": rows,
+            "default": default,
+            "default_fast_json_response": default_orjson,
+            "type_adapter": fast,
+            "speedup": round(default["median_ms"] / fast["median_ms"], 2),
+        }
+        typer.echo(
+            f"{name:<13} default {default['median_ms']:>8.2f} ms   "
+            f"default+FastJSONResponse {default_orjson['median_ms']:>8.2f} ms   "
+            f"TypeAdapter {fast['median_ms']:>8.2f} ms   x{results[name]['speedup']}"
+        )
+    loop.close()
+    if output:
+        output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    cli()
@@ -2,11 +2,17 @@ import typer
 import subprocess
 import os
 import asyncio
+import importlib
+import importlib.util
+import time
+from typing import Optional
 from sqlalchemy import create_engine, select
 from app.config import get_settings
 from app.db import Base
-from app.db.database import AsyncSessionLocal
+from app.db.database import AsyncSessionLocal, get_engine, pool_size_for_budget
 from app.db.models import User
+from app.db.rollups import rebuild_application_rollups
+from app.db.seed import SCALES, SEED_PASSWORD, Scale, seed_dataset
 
 app = typer.Typer()
 settings = get_settings()
@@ -19,6 +25,83 @@ def run():
     subprocess.run(["uvicorn", "app.main:app", "--host", "0.0.0.0", "--port", "8000", "--reload"])
 
 
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("0.0.0.0", help="Interface to bind."),
+    port: int = typer.Option(8000, help="Port to bind."),
+    workers: Optional[int] = typer.Option(None, help="Worker processes (default: CPU count)."),
+    max_requests: int = typer.Option(
+        10000, help="Recycle a worker after this many requests (0 disables)."
+    ),
+    keep_alive: int = typer.Option(
+        65, help="Keep-alive timeout in seconds; keep above the load balancer's idle timeout."
+    ),
+    backlog: int = typer.Option(2048, help="Pending connection queue length."),
+    graceful_timeout: int = typer.Option(30, help="Seconds to finish requests on shutdown."),
+    connection_budget: Optional[int] = typer.Option(
+        None, help="Database connections shared by all workers (default: DB_CONNECTION_BUDGET)."
+    ),
+):
+    """Run the API in production mode with multiple worker processes."""
+    import uvicorn
+
+    workers = workers or os.cpu_count() or 1
+    budget = connection_budget or settings.DB_CONNECTION_BUDGET
+    if budget:
+        try:
+            pool_size, max_overflow = pool_size_for_budget(budget, workers)
+        except ValueError as e:
+            typer.secho(str(e), fg=typer.colors.RED, err=True)
+            raise typer.Exit(code=1)
+        # Workers are separate processes and read their settings from the environment
+        os.environ["DB_POOL_SIZE"] = str(pool_size)
+        os.environ["DB_MAX_OVERFLOW"] = str(max_overflow)
+        typer.echo(
+            f"Connection budget {budget}: pool_size={pool_size}, max_overflow={max_overflow} per worker"
+        )
+    if "PASSWORD_HASH_WORKERS" not in settings.model_fields_set:
+        # Share the cores between workers instead of giving each its own full pool
+        os.environ["PASSWORD_HASH_WORKERS"] = str(max(1, (os.cpu_count() or 1) // workers))
+    if settings.DB_REPLICA_URLS and not settings.CACHE_URL and workers > 1:
+        typer.secho(
+            "Warning: without CACHE_URL, read-your-own-writes pinning is per worker.",
+            fg=typer.colors.YELLOW,
+        )
+    if not settings.CACHE_URL and workers > 1:
+        typer.secho(
+            "Warning: without CACHE_URL, caches are per worker; other workers can serve "
+            f"applied-job checks up to {settings.APPLIED_JOBS_LOCAL_CACHE_TTL:g}s stale.",
+            fg=typer.colors.YELLOW,
+        )
+
+    # Import the app before starting workers so configuration and import
+    # errors fail here, once, instead of in every worker
+    importlib.import_module("app.main")
+
+    loop = "uvloop" if _available("uvloop") else "asyncio"
+    http = "httptools" if _available("httptools") else "h11"
+    typer.echo(f"Starting {workers} workers on {host}:{port} (loop={loop}, http={http})...")
+    uvicorn.run(
+        "app.main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        limit_max_requests=max_requests or None,
+        timeout_keep_alive=keep_alive,
+        backlog=backlog,
+        timeout_graceful_shutdown=graceful_timeout,
+        proxy_headers=True,
+        # One line per request costs more than the request itself at high rates
+        access_log=False,
+    )
+
+
 @app.command()
 def makemigrations(message: str = "Auto migration"):
     """Generate a new Alembic migration."""
@@ -110,5 +193,95 @@ def createsuperuser(
         )
 
 
+async def _rebuild_rollups_async(job_id: Optional[int]) -> int:
+    """Async helper to rebuild the application rollup table."""
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            return await rebuild_application_rollups(session, job_id)
+
+
+@app.command()
+def rebuild_rollups(
+    job_id: Optional[int] = typer.Option(None, help="Only rebuild rollups for this job."),
+):
+    """Backfill or rebuild the daily application-count rollups used by analytics."""
+    typer.echo("Rebuilding application rollups...")
+    try:
+        rows = asyncio.run(_rebuild_rollups_async(job_id))
+        typer.secho(f"Wrote {rows} rollup rows.", fg=typer.colors.GREEN)
+    except Exception as e:
+        typer.secho(f"An error occurred while rebuilding rollups: {e}", fg=typer.colors.RED, err=True)
+
+
+async def _seed_async(dataset: Scale, seed: int, batch_size: int, workers: Optional[int]) -> dict:
+    """Async helper to load a synthetic dataset."""
+    last_report = {}
+
+    def _progress(table: str, inserted: int):
+        # Report roughly every 100k rows per table
+        if inserted // 100_000 != last_report.get(table, -1):
+            last_report[table] = inserted // 100_000
+            typer.echo(f"  {table}: {inserted:,} rows")
+
+    engine = get_engine()
+    try:
+        return await seed_dataset(
+            engine, dataset, seed=seed, batch_size=batch_size, workers=workers, progress=_progress
+        )
+    finally:
+        await engine.dispose()
+
+
+@app.command()
+def seed(
+    scale: str = typer.Option("10k", help=f"Preset dataset size: {', '.join(SCALES)}."),
+    users: Optional[int] = typer.Option(None, help="Override the number of users."),
+    jobs: Optional[int] = typer.Option(None, help="Override the number of jobs."),
+    applications: Optional[int] = typer.Option(None, help="Override the number of applications."),
+    interviews: Optional[int] = typer.Option(None, help="Override the number of interviews."),
+    random_seed: int = typer.Option(42, "--random-seed", help="Seed for reproducible data."),
+    batch_size: int = typer.Option(5000, help="Rows per COPY / INSERT batch."),
+    workers: Optional[int] = typer.Option(
+        None, help="Concurrent writer connections (PostgreSQL only; default 4)."
+    ),
+):
+    """
+    Bulk-load synthetic users, jobs, applications and interviews for profiling.
+
+    Not atomic: every batch commits on its own, so a failed run leaves a
+    partially seeded database and a rerun appends rather than retries. Seed
+    a dedicated database and recreate it after a failure.
+    """
+    if scale not in SCALES:
+        typer.secho(f"Unknown scale '{scale}'. Choose from: {', '.join(SCALES)}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+    preset = SCALES[scale]
+    dataset = Scale(
+        users=users if users is not None else preset.users,
+        jobs=jobs if jobs is not None else preset.jobs,
+        applications=applications if applications is not None else preset.applications,
+        interviews=interviews if interviews is not None else preset.interviews,
+    )
+    typer.echo(f"Seeding {dataset} into {get_engine().dialect.name}...")
+    started = time.perf_counter()
+    try:
+        counts = asyncio.run(_seed_async(dataset, random_seed, batch_size, workers))
+    except Exception as e:
+        typer.secho(f"An error occurred while seeding: {e}", fg=typer.colors.RED, err=True)
+        typer.secho(
+            "Rows loaded before the failure were kept; recreate the database before seeding again.",
+            fg=typer.colors.YELLOW,
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    typer.secho(
+        f"Inserted {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s): {counts}",
+        fg=typer.colors.GREEN,
+    )
+    typer.echo(f"Every seeded account uses the password '{SEED_PASSWORD}'.")
+
+
 if __name__ == "__main__":
     app()
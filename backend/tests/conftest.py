@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import sys
+from contextlib import contextmanager
 from typing import AsyncGenerator, Generator
 
 import pytest
@@ -26,7 +27,8 @@ sys.path.insert(0, PROJECT_ROOT)
 
 from app.config import Settings, get_settings  # noqa: E402  pylint: disable=wrong-import-position
 from app.db import Base  # noqa: E402  pylint: disable=wrong-import-position
-from app.db.database import get_db  # noqa: E402  pylint: disable=wrong-import-position
+from app.db.database import get_db, get_read_db  # noqa: E402  pylint: disable=wrong-import-position
+from app.db.profiler import install_query_profiler, profile_queries  # noqa: E402  pylint: disable=wrong-import-position
 from app.main import app  # noqa: E402  pylint: disable=wrong-import-position
 
 # ---------------------------------------------------------------------------
@@ -99,6 +101,57 @@ async def test_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, N
         yield db_session
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     async with AsyncClient(app=app, base_url="http://test") as client:
         yield client
     app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_read_db, None)
+
+
+@pytest_asyncio.fixture()
+async def auth_headers(test_client: AsyncClient):
+    """Return a factory that registers a user, logs in and returns auth headers."""
+
+    async def _auth_headers(
+        email: str,
+        username: str,
+        is_supervisor: bool = False,
+        password: str = "strongpassword123",
+    ) -> dict:
+        await test_client.post(
+            "/api/auth/register",
+            json={
+                "email": email,
+                "username": username,
+                "password": password,
+                "is_supervisor": is_supervisor,
+            },
+        )
+        response = await test_client.post(
+            "/api/auth/login", json={"email": email, "password": password}
+        )
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    return _auth_headers
+
+
+@pytest.fixture()
+def query_budget():
+    """
+    Return a context manager failing the test when the code inside it runs
+    more SQL statements than the declared budget.
+
+        with query_budget(3):
+            await test_client.get("/api/jobs/")
+    """
+    install_query_profiler()
+
+    @contextmanager
+    def _query_budget(max_queries: int):
+        with profile_queries() as profile:
+            yield profile
+        assert profile.count <= max_queries, (
+            f"Query budget exceeded: {profile.count} > {max_queries}\n{profile.report()}"
+        )
+
+    return _query_budget
@@ -0,0 +1,101 @@
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.db.models import ApplicationDailyCount
+from app.db.rollups import rebuild_application_rollups
+
+settings = get_settings()
+API_PREFIX = settings.API_PREFIX
+
+
+async def _rollup_rows(db_session: AsyncSession, job_id: int):
+    result = await db_session.execute(
+        select(ApplicationDailyCount.status, ApplicationDailyCount.count)
+        .filter(ApplicationDailyCount.job_id == job_id)
+        .order_by(ApplicationDailyCount.status)
+    )
+    return [tuple(row) for row in result]
+
+
+@pytest.mark.asyncio
+async def test_analytics_read_incrementally_maintained_rollups(
+    test_client: AsyncClient, db_session: AsyncSession, auth_headers
+):
+    """Test that applying and status changes keep the rollup and dashboards in sync."""
+    employer = await auth_headers("rollups@example.com", "rollupemployer", is_supervisor=True)
+    response = await test_client.post(
+        f"{API_PREFIX}/jobs",
+        json={
+            "title": "Rollup engineer",
+            "company_name": "Acme",
+            "location": "Remote",
+            "description": "Count things",
+            "requirements": "SQL",
+            "employment_type": "full-time",
+        },
+        headers=employer,
+    )
+    job_id = response.json()["id"]
+
+    application_ids = []
+    for i in range(3):
+        seeker = await auth_headers(f"rollupseeker{i}@example.com", f"rollupseeker{i}")
+        response = await test_client.post(
+            f"{API_PREFIX}/applications",
+            json={"job_id": job_id, "resume_url": "https://example.com/cv.pdf"},
+            headers=seeker,
+        )
+        assert response.status_code == 200
+        application_ids.append(response.json()["id"])
+
+    response = await test_client.put(
+        f"{API_PREFIX}/applications/{application_ids[0]}/status",
+        json={"status": "rejected"},
+        headers=employer,
+    )
+    assert response.status_code == 200
+
+    assert await _rollup_rows(db_session, job_id) == [("applied", 2), ("rejected", 1)]
+
+    response = await test_client.get(f"{API_PREFIX}/analytics/employer", headers=employer)
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary[0]["job_title"] == "Rollup engineer"
+    assert summary[0]["total_applications"] == 3
+    assert summary[0]["status_counts"]["rejected"] == 1
+
+    today = date.today()
+    response = await test_client.get(
+        f"{API_PREFIX}/analytics/employer/timeline",
+        params={
+            "start_date": (today - timedelta(days=2)).isoformat(),
+            "end_date": (today + timedelta(days=1)).isoformat(),
+        },
+        headers=employer,
+    )
+    assert response.status_code == 200
+    timeline = response.json()
+    assert len(timeline) == 4
+    assert sum(day["applications"] for day in timeline) == 3
+
+    # A rebuild from job_applications produces the same rollup
+    await rebuild_application_rollups(db_session, job_id)
+    await db_session.commit()
+    assert await _rollup_rows(db_session, job_id) == [("applied", 2), ("rejected", 1)]
+
+
+@pytest.mark.asyncio
+async def test_analytics_timeline_rejects_bad_dates(test_client: AsyncClient, auth_headers):
+    """Test that malformed dates are a 400, not a 500."""
+    employer = await auth_headers("baddates@example.com", "baddates", is_supervisor=True)
+    response = await test_client.get(
+        f"{API_PREFIX}/analytics/employer/timeline",
+        params={"start_date": "yesterday", "end_date": "2026-01-01"},
+        headers=employer,
+    )
+    assert response.status_code == 400
@@ -0,0 +1,241 @@
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from app.config import get_settings
+from app.db.database import get_engine
+from app.services.applications import stream_job_application_rows
+
+settings = get_settings()
+API_PREFIX = settings.API_PREFIX
+
+
+async def _create_job(test_client: AsyncClient, headers: dict, title: str) -> int:
+    response = await test_client.post(
+        f"{API_PREFIX}/jobs",
+        json={
+            "title": title,
+            "company_name": "Acme",
+            "location": "Remote",
+            "description": "A long description " * 50,
+            "requirements": "Python",
+            "employment_type": "full-time",
+        },
+        headers=headers,
+    )
+    return response.json()["id"]
+
+
+async def _apply(test_client: AsyncClient, headers: dict, job_id: int):
+    return await test_client.post(
+        f"{API_PREFIX}/applications",
+        json={"job_id": job_id, "resume_url": "https://example.com/cv.pdf"},
+        headers=headers,
+    )
+
+
+@pytest.mark.asyncio
+async def test_job_application_summaries_are_flat_and_paginated(
+    test_client: AsyncClient, auth_headers
+):
+    """Test the summary listing embeds the job once and pages with a cursor."""
+    employer = await auth_headers("summary@example.com", "summaryemployer", is_supervisor=True)
+    job_id = await _create_job(test_client, employer, "Summary role")
+    for i in range(3):
+        seeker = await auth_headers(f"summaryseeker{i}@example.com", f"summaryseeker{i}")
+        assert (await _apply(test_client, seeker, job_id)).status_code == 200
+
+    response = await test_client.get(
+        f"{API_PREFIX}/applications/job/{job_id}/summary", params={"limit": 2}, headers=employer
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert page["job"]["id"] == job_id
+    assert len(page["items"]) == 2
+    assert page["items"][0]["applicant_username"] == "summaryseeker2"
+    assert page["items"][0]["interview_count"] == 0
+    assert "job" not in page["items"][0]
+
+    response = await test_client.get(
+        f"{API_PREFIX}/applications/job/{job_id}/summary",
+        params={"limit": 2, "cursor": page["next_cursor"]},
+        headers=employer,
+    )
+    page = response.json()
+    assert [item["applicant_username"] for item in page["items"]] == ["summaryseeker0"]
+    assert page["next_cursor"] is None
+
+    seeker = await auth_headers("summaryseeker0@example.com", "summaryseeker0")
+    response = await test_client.get(
+        f"{API_PREFIX}/applications/job/{job_id}/summary", headers=seeker
+    )
+    assert response.status_code == 403
+
+    response = await test_client.get(
+        f"{API_PREFIX}/applications/my-applications/summary", headers=seeker
+    )
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [(item["job_id"], item["job_title"]) for item in items] == [(job_id, "Summary role")]
+
+
+@pytest.mark.asyncio
+async def test_apply_returns_full_response_and_rejects_duplicates(
+    test_client: AsyncClient, auth_headers
+):
+    """Test applying builds the nested response and a second apply is a 400."""
+    employer = await auth_headers("dupes@example.com", "dupesemployer", is_supervisor=True)
+    job_id = await _create_job(test_client, employer, "Duplicate check")
+    seeker = await auth_headers("dupeseeker@example.com", "dupeseeker")
+
+    response = await _apply(test_client, seeker, job_id)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["job"]["id"] == job_id
+    assert body["applicant"]["username"] == "dupeseeker"
+    assert body["status"] == "applied"
+    assert body["created_at"] and body["interviews"] == []
+
+    response = await _apply(test_client, seeker, job_id)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "You have already applied for this job"
+
+    response = await _apply(test_client, seeker, 999999)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_application_status_query_budget(
+    test_client: AsyncClient, auth_headers, query_budget
+):
+    """Test a status update loads the application once instead of reloading it."""
+    employer = await auth_headers("budget@example.com", "budgetemployer", is_supervisor=True)
+    seeker = await auth_headers("budgetseeker@example.com", "budgetseeker")
+    job_id = await _create_job(test_client, employer, "Budget role")
+    application_id = (await _apply(test_client, seeker, job_id)).json()["id"]
+
+    with query_budget(7) as profile:
+        response = await test_client.put(
+            f"{API_PREFIX}/applications/{application_id}/status",
+            json={"status": "under_review"},
+            headers=employer,
+        )
+    assert response.status_code == 200, profile.report()
+    assert response.json()["status"] == "under_review"
+    assert response.json()["job"]["id"] == job_id
+
+
+@pytest.mark.asyncio
+async def test_batch_applied_check(test_client: AsyncClient, auth_headers, query_budget):
+    """Test the batch check returns the applied subset and tracks new applications."""
+    employer = await auth_headers("batch@example.com", "batchemployer", is_supervisor=True)
+    job_ids = [await _create_job(test_client, employer, f"Batch role {i}") for i in range(3)]
+    seeker = await auth_headers("batchseeker@example.com", "batchseeker")
+    await _apply(test_client, seeker, job_ids[1])
+
+    response = await test_client.get(
+        f"{API_PREFIX}/applications/check", params={"job_ids": job_ids}, headers=seeker
+    )
+    assert response.status_code == 200
+    assert response.json() == {"job_ids": [job_ids[1]]}
+
+    # Answered from the applied set cache, which the next application drops
+    await _apply(test_client, seeker, job_ids[2])
+    response = await test_client.get(
+        f"{API_PREFIX}/applications/check", params={"job_ids": job_ids}, headers=seeker
+    )
+    assert response.json() == {"job_ids": job_ids[1:]}
+    with query_budget(0):
+        response = await test_client.get(
+            f"{API_PREFIX}/applications/check", params={"job_ids": job_ids}, headers=seeker
+        )
+    assert response.json() == {"job_ids": job_ids[1:]}
+
+    # The single-job check always asks the database
+    with query_budget(1):
+        single = await test_client.get(
+            f"{API_PREFIX}/applications/check/{job_ids[0]}", headers=seeker
+        )
+    assert single.json() is False
+    single = await test_client.get(f"{API_PREFIX}/applications/check/{job_ids[2]}", headers=seeker)
+    assert single.json() is True
+
+    response = await test_client.get(
+        f"{API_PREFIX}/applications/check", params={"job_ids": job_ids}, headers=employer
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_job_applications(test_client: AsyncClient, auth_headers, monkeypatch):
+    """Test applications export as NDJSON and CSV, read from the cursor in batches."""
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    employer = await auth_headers("export@example.com", "exportemployer", is_supervisor=True)
+    job_id = await _create_job(test_client, employer, "Export role")
+    application_ids = []
+    for i in range(5):
+        seeker = await auth_headers(f"exportseeker{i}@example.com", f"exportseeker{i}")
+        application_ids.append((await _apply(test_client, seeker, job_id)).json()["id"])
+
+    response = await test_client.get(
+        f"{API_PREFIX}/applications/job/{job_id}/export", headers=employer
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert 'filename="job-' in response.headers["content-disposition"]
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(row["id"] for row in rows) == application_ids
+    assert rows[0]["applicant_username"].startswith("exportseeker")
+    assert rows[0]["status"] == "applied"
+    assert rows[0]["interview_count"] == 0
+
+    response = await test_client.get(
+        f"{API_PREFIX}/applications/job/{job_id}/export",
+        params={"format": "csv"},
+        headers=employer,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    records = list(csv.DictReader(io.StringIO(response.text)))
+    assert sorted(int(record["id"]) for record in records) == application_ids
+    assert records[0]["applicant_email"].endswith("@example.com")
+
+    # The cursor is read EXPORT_BATCH_SIZE rows at a time
+    batches = [
+        [row.id for row in batch]
+        async for batch in stream_job_application_rows(get_engine(), job_id, 2)
+    ]
+    assert batches == [application_ids[:2], application_ids[2:4], application_ids[4:]]
+
+    other = await auth_headers("otherexport@example.com", "otherexport", is_supervisor=True)
+    response = await test_client.get(
+        f"{API_PREFIX}/applications/job/{job_id}/export", headers=other
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_reads_from_the_permission_check_engine(
+    test_client: AsyncClient, auth_headers, db_session, monkeypatch
+):
+    """Test the export streams from the engine its read session is bound to."""
+    from app.routes import applications as applications_routes
+
+    engines = []
+
+    def _stream(db_engine, job_id, batch_size):
+        engines.append(db_engine)
+        return stream_job_application_rows(db_engine, job_id, batch_size)
+
+    monkeypatch.setattr(applications_routes, "stream_job_application_rows", _stream)
+    employer = await auth_headers("bindexport@example.com", "bindexport", is_supervisor=True)
+    job_id = await _create_job(test_client, employer, "Bind export role")
+
+    response = await test_client.get(
+        f"{API_PREFIX}/applications/job/{job_id}/export", headers=employer
+    )
+    assert response.status_code == 200
+    assert engines == [db_session.bind]
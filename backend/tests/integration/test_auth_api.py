@@ -1,11 +1,14 @@
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import event, select
 
 # UserCreate schema is not directly used, json payloads are dicts
 from app.db.models import User  # To verify DB state
 from app.config import get_settings
+from app.db.database import get_engine
+from app.main import app
+from app.services.auth import user_cache
 
 settings = get_settings()
 API_PREFIX = settings.API_PREFIX
@@ -130,3 +133,78 @@ async def test_login_user_not_found(test_client: AsyncClient):
         response.status_code == 401
     )  # Or 404, depending on desired behavior for non-existent user
     assert response.json()["detail"] == "Incorrect email or password"
+
+
+@pytest.mark.asyncio
+async def test_current_user_cache_invalidated_on_password_reset(
+    test_client: AsyncClient, db_session: AsyncSession, auth_headers
+):
+    """Test that /auth/me populates the user cache and a reset evicts the entry."""
+    from app.services.auth import user_cache
+
+    email = "cached@example.com"
+    headers = await auth_headers(email, "cacheduser")
+
+    response = await test_client.get(f"{API_PREFIX}/auth/me", headers=headers)
+    assert response.status_code == 200
+    assert email in user_cache
+
+    # Served from the cache on the next request
+    response = await test_client.get(f"{API_PREFIX}/auth/me", headers=headers)
+    assert response.json()["email"] == email
+
+    await test_client.post(f"{API_PREFIX}/auth/request-password-reset", params={"email": email})
+    assert email not in user_cache
+
+
+@pytest.mark.asyncio
+async def test_write_route_holds_one_connection_on_user_cache_miss():
+    """Test the current-user lookup releases its connection before the handler's session,
+    using the real session dependencies rather than the test overrides."""
+    pool = get_engine().sync_engine.pool
+    checked_out = peak = 0
+
+    def _checkout(*args):
+        nonlocal checked_out, peak
+        checked_out += 1
+        peak = max(peak, checked_out)
+
+    def _checkin(*args):
+        nonlocal checked_out
+        checked_out -= 1
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        credentials = {"email": "pooluser@example.com", "password": "strongpassword123"}
+        await client.post(
+            f"{API_PREFIX}/auth/register",
+            json={**credentials, "username": "pooluser", "is_supervisor": True},
+        )
+        token = (await client.post(f"{API_PREFIX}/auth/login", json=credentials)).json()
+        headers = {"Authorization": f"Bearer {token['access_token']}"}
+        await user_cache.clear()
+
+        event.listen(pool, "checkout", _checkout)
+        event.listen(pool, "checkin", _checkin)
+        try:
+            response = await client.post(
+                f"{API_PREFIX}/jobs",
+                json={
+                    "title": "Pool role",
+                    "company_name": "Acme",
+                    "location": "Remote",
+                    "description": "A description long enough to pass validation",
+                    "requirements": "Python",
+                    "employment_type": "full-time",
+                },
+                headers=headers,
+            )
+        finally:
+            event.remove(pool, "checkout", _checkout)
+            event.remove(pool, "checkin", _checkin)
+        assert response.status_code == 200, response.text
+        assert peak == 1
+
+        # Reads go through the real read-only session dependency
+        response = await client.get(f"{API_PREFIX}/jobs/my-jobs", headers=headers)
+        assert response.status_code == 200
+        assert [job["title"] for job in response.json()] == ["Pool role"]
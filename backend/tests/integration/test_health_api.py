@@ -0,0 +1,46 @@
+import pytest
+from httpx import AsyncClient
+
+from app.config import get_settings
+
+settings = get_settings()
+API_PREFIX = settings.API_PREFIX
+
+
+@pytest.mark.asyncio
+async def test_db_pool_stats(test_client: AsyncClient):
+    """Test that pool usage and checkout wait metrics are exposed."""
+    response = await test_client.get(f"{API_PREFIX}/health/db-pool")
+    assert response.status_code == 200
+    primary = response.json()[0]
+    assert primary["name"] == "primary"
+    assert primary["pool"] == "InstrumentedAsyncQueuePool"
+    assert {"checked_out", "overflow", "checkout_timeouts", "checkout_wait"} <= primary.keys()
+    assert "+Inf" in primary["checkout_wait"]["buckets"]
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_stats(test_client: AsyncClient):
+    """Test that hashing pool queue depth is exposed."""
+    response = await test_client.get(f"{API_PREFIX}/health/password-hasher")
+    assert response.status_code == 200
+    assert {"queue_depth", "max_queue", "completed"} <= response.json().keys()
+
+
+@pytest.mark.asyncio
+async def test_readiness_gated_on_startup(test_client: AsyncClient):
+    """Test readiness is 503 until the lifespan has finished starting up."""
+    from app.main import app
+
+    previous = getattr(app.state, "ready", False)
+    try:
+        app.state.ready = False
+        response = await test_client.get(f"{API_PREFIX}/health/ready")
+        assert response.status_code == 503
+
+        app.state.ready = True
+        response = await test_client.get(f"{API_PREFIX}/health/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
+    finally:
+        app.state.ready = previous
@@ -0,0 +1,258 @@
+import pytest
+from httpx import AsyncClient
+
+from app.config import get_settings
+
+settings = get_settings()
+API_PREFIX = settings.API_PREFIX
+
+
+def _job_payload(title: str, location: str, **overrides) -> dict:
+    payload = {
+        "title": title,
+        "company_name": "Acme",
+        "location": location,
+        "description": "Build things",
+        "requirements": "Python",
+        "employment_type": "full-time",
+        "salary_min": 50000,
+        "salary_max": 80000,
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.mark.asyncio
+async def test_list_active_jobs_keyset_pagination(test_client: AsyncClient, auth_headers):
+    """Test paging through the active job feed with the X-Next-Cursor header."""
+    employer = await auth_headers("pager@example.com", "pager", is_supervisor=True)
+    titles = [f"Pager job {i}" for i in range(5)]
+    for title in titles:
+        response = await test_client.post(
+            f"{API_PREFIX}/jobs", json=_job_payload(title, "Pagination City"), headers=employer
+        )
+        assert response.status_code == 200
+
+    seen = []
+    params = {"limit": 2, "location": "Pagination City"}
+    for _ in range(5):
+        response = await test_client.get(f"{API_PREFIX}/jobs", params=params, headers=employer)
+        assert response.status_code == 200
+        seen.extend(job["title"] for job in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        params["cursor"] = next_cursor
+
+    # Newest first, every job exactly once
+    assert seen == list(reversed(titles))
+
+
+@pytest.mark.asyncio
+async def test_list_active_jobs_filters(test_client: AsyncClient, auth_headers):
+    """Test server-side location, employment type and salary filters."""
+    employer = await auth_headers("filters@example.com", "filters", is_supervisor=True)
+    await test_client.post(
+        f"{API_PREFIX}/jobs",
+        json=_job_payload("Contract gig", "Filter Town", employment_type="contract",
+                          salary_min=20000, salary_max=30000),
+        headers=employer,
+    )
+    await test_client.post(
+        f"{API_PREFIX}/jobs",
+        json=_job_payload("Senior role", "Filter Town", salary_min=120000, salary_max=150000),
+        headers=employer,
+    )
+    await test_client.post(
+        f"{API_PREFIX}/jobs",
+        json=_job_payload("Closed role", "Filter Town", status="closed"),
+        headers=employer,
+    )
+
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs",
+        params={"location": "Filter Town", "employment_type": "contract"},
+        headers=employer,
+    )
+    assert [job["title"] for job in response.json()] == ["Contract gig"]
+
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs",
+        params={"location": "Filter Town", "min_salary": 100000},
+        headers=employer,
+    )
+    assert [job["title"] for job in response.json()] == ["Senior role"]
+
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs",
+        params={"location": "Filter Town", "max_salary": 25000},
+        headers=employer,
+    )
+    assert [job["title"] for job in response.json()] == ["Contract gig"]
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_list_active_jobs_rejects_bad_cursor(test_client: AsyncClient, auth_headers):
+    """Test that a malformed cursor is a client error, not a server error."""
+    headers = await auth_headers("badcursor@example.com", "badcursor")
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs", params={"cursor": "not-a-cursor"}, headers=headers
+    )
+    assert response.status_code == 400
+
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs", params={"limit": settings.JOBS_MAX_PAGE_SIZE + 1}, headers=headers
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_jobs_ranks_title_matches_first(test_client: AsyncClient, auth_headers):
+    """Test full-text search ranks title hits above description hits."""
+    employer = await auth_headers("search@example.com", "searcher", is_supervisor=True)
+    await test_client.post(
+        f"{API_PREFIX}/jobs",
+        json=_job_payload("Office manager", "Search City",
+                          description="Support our zephyrine platform developers"),
+        headers=employer,
+    )
+    await test_client.post(
+        f"{API_PREFIX}/jobs",
+        json=_job_payload("Zephyrine developer", "Search City"),
+        headers=employer,
+    )
+
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs/search", params={"q": "zephyrine developers"}, headers=employer
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert [job["title"] for job in results] == ["Zephyrine developer", "Office manager"]
+    assert results[0]["rank"] > results[1]["rank"]
+
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs/search", params={"q": "zephyrine plumber"}, headers=employer
+    )
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_job_list_conditional_get(test_client: AsyncClient, auth_headers, db_session):
+    """Test ETag revalidation of the job feed and ETag / Last-Modified of a single job."""
+    from datetime import datetime, timedelta
+    from sqlalchemy import update
+    from app.db.models import Job
+    from app.services.jobs import invalidate_job_feed
+
+    employer = await auth_headers("etag@example.com", "etagger", is_supervisor=True)
+    created = await test_client.post(
+        f"{API_PREFIX}/jobs", json=_job_payload("Cached job", "ETag City"), headers=employer
+    )
+    job_id = created.json()["id"]
+    params = {"location": "ETag City"}
+
+    response = await test_client.get(f"{API_PREFIX}/jobs", params=params, headers=employer)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs", params=params, headers={**employer, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    # Lists revalidate by ETag only: removing a job need not move the newest updated_at
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs", params=params,
+        headers={**employer, "If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"},
+    )
+    assert response.status_code == 200
+    assert "Last-Modified" not in response.headers
+
+    response = await test_client.get(f"{API_PREFIX}/jobs/{job_id}", headers=employer)
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs/{job_id}",
+        headers={**employer, "If-Modified-Since": response.headers["Last-Modified"]},
+    )
+    assert response.status_code == 304
+
+    # Any change to a job on the page changes its validators
+    await db_session.execute(
+        update(Job).where(Job.id == job_id).values(updated_at=datetime.utcnow() + timedelta(hours=1))
+    )
+    await db_session.commit()
+    await invalidate_job_feed()  # Direct SQL bypasses the service layer
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs", params=params, headers={**employer, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs/my-jobs", headers={**employer, "If-None-Match": "*"}
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_job_list_compressed(test_client: AsyncClient, auth_headers):
+    """Test large responses are gzipped and their ETag still revalidates."""
+    employer = await auth_headers("gzip@example.com", "gzipper", is_supervisor=True)
+    for i in range(5):
+        await test_client.post(
+            f"{API_PREFIX}/jobs",
+            json=_job_payload(f"Compressed job {i}", "Gzip City", description="Build things " * 50),
+            headers=employer,
+        )
+    params = {"location": "Gzip City"}
+
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs", params=params, headers={**employer, "Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"].endswith('-gzip"')
+    assert len(response.json()) == 5
+
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs",
+        params=params,
+        headers={**employer, "Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]},
+    )
+    assert response.status_code == 304
+
+    # Small responses are sent as-is
+    response = await test_client.get(
+        f"{API_PREFIX}/jobs", params={"location": "Nowhere"},
+        headers={**employer, "Accept-Encoding": "gzip"},
+    )
+    assert "Content-Encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_job_feed_cached_until_job_write(test_client: AsyncClient, auth_headers, query_budget):
+    """Test repeat feed requests skip the database and job writes invalidate them."""
+    employer = await auth_headers("feedcache@example.com", "feedcache", is_supervisor=True)
+    params = {"location": "Cache Town"}
+    await test_client.post(
+        f"{API_PREFIX}/jobs", json=_job_payload("First cached", "Cache Town"), headers=employer
+    )
+    response = await test_client.get(f"{API_PREFIX}/jobs", params=params, headers=employer)
+    assert [job["title"] for job in response.json()] == ["First cached"]
+
+    with query_budget(0):
+        cached = await test_client.get(f"{API_PREFIX}/jobs", params=params, headers=employer)
+    assert cached.content == response.content
+
+    created = await test_client.post(
+        f"{API_PREFIX}/jobs", json=_job_payload("Second cached", "Cache Town"), headers=employer
+    )
+    response = await test_client.get(f"{API_PREFIX}/jobs", params=params, headers=employer)
+    assert [job["title"] for job in response.json()] == ["Second cached", "First cached"]
+
+    await test_client.delete(f"{API_PREFIX}/jobs/{created.json()['id']}", headers=employer)
+    response = await test_client.get(f"{API_PREFIX}/jobs", params=params, headers=employer)
+    assert [job["title"] for job in response.json()] == ["First cached"]
@@ -0,0 +1,35 @@
+import pytest
+from httpx import AsyncClient
+
+from app.config import get_settings
+
+settings = get_settings()
+API_PREFIX = settings.API_PREFIX
+
+
+@pytest.mark.asyncio
+async def test_responses_carry_server_timing(test_client: AsyncClient):
+    """Test every response reports DB and total time in a Server-Timing header."""
+    response = await test_client.get(f"{API_PREFIX}/health")
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert "app;dur=" in response.headers["server-timing"]
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_templates(test_client: AsyncClient):
+    """Test requests are aggregated by route template in Prometheus format."""
+    await test_client.get(f"{API_PREFIX}/jobs/999999")
+    await test_client.get(f"{API_PREFIX}/no-such-path")
+
+    response = await test_client.get(f"{API_PREFIX}/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/api/jobs/{job_id}"' in body
+    assert 'route="unmatched"' in body
+    assert "/api/jobs/999999" not in body
+    assert 'db_pool_checked_out_connections{pool="primary"}' in body
+    assert "# TYPE cache_hits_total counter" in body
+    assert 'cache_hits_total{cache="job-feed"}' in body
+    assert "# TYPE password_hasher_rejected_total counter" in body
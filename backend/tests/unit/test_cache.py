@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import pytest
+
+from app.config import get_settings
+from app.utils.cache import MemoryCache, SingleFlight, create_cache
+
+settings = get_settings()
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used():
+    """Test that the cache stays within maxsize, evicting the LRU entry."""
+    cache = MemoryCache("test", ttl=60, maxsize=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1  # "b" is now least recently used
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_expires_entries(monkeypatch):
+    """Test that entries are dropped once their TTL has passed."""
+    now = time.monotonic()
+    monkeypatch.setattr("app.utils.cache.time.monotonic", lambda: now)
+    cache = MemoryCache("test", ttl=10, maxsize=10)
+    await cache.set("key", "value")
+
+    monkeypatch.setattr("app.utils.cache.time.monotonic", lambda: now + 11)
+    assert await cache.get("key") is None
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_delete_nowait():
+    """Test synchronous deletion used from SQLAlchemy session events."""
+    cache = MemoryCache("test", ttl=60, maxsize=10)
+    await cache.set("x", 1)
+    cache.delete_nowait(["x", "missing"])
+    assert "x" not in cache
+
+
+def test_applied_jobs_cache_in_another_worker_expires_within_local_ttl(monkeypatch):
+    """Test another worker's stale applied set expires within APPLIED_JOBS_LOCAL_CACHE_TTL."""
+    from app.services.applications import applied_jobs_cache
+
+    assert applied_jobs_cache.ttl == settings.APPLIED_JOBS_LOCAL_CACHE_TTL
+    now = time.monotonic()
+    monkeypatch.setattr("app.utils.cache.time.monotonic", lambda: now)
+    other_worker = create_cache("applied-jobs", ttl=applied_jobs_cache.ttl, maxsize=10)
+    other_worker.set_nowait(7, frozenset())
+
+    # The apply is handled here and only drops this process's entry
+    applied_jobs_cache.delete_nowait([7])
+    assert other_worker.get_nowait(7) == frozenset()
+
+    now += settings.APPLIED_JOBS_LOCAL_CACHE_TTL
+    assert other_worker.get_nowait(7) is None
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_calls():
+    """Test that concurrent callers for one key share a single computation."""
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    waiters = [asyncio.create_task(flight.run("page", compute)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*waiters) == [1] * 10
+    assert calls == 1
+    assert len(flight) == 0
+
+    # Failures reach every waiter and are not remembered
+    async def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await flight.run("page", fail)
+    assert await flight.run("page", compute) == 2
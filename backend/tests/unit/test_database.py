@@ -0,0 +1,115 @@
+import time
+
+import pytest
+from sqlalchemy import select
+
+from app.db.database import AsyncReadSessionLocal
+from app.db.models import User
+
+
+@pytest.mark.asyncio
+async def test_read_only_session_reads_but_rejects_writes():
+    """Test that the read-only session can query but refuses to flush changes."""
+    async with AsyncReadSessionLocal() as session:
+        result = await session.execute(select(User).limit(1))
+        result.scalars().all()
+
+        session.add(User(email="readonly@example.com", username="readonly", hashed_password="x"))
+        with pytest.raises(RuntimeError, match="read-only"):
+            await session.flush()
+
+
+def test_read_sessions_begin_read_only_on_postgres():
+    """Test read sessions on PostgreSQL bind to an engine view that opens READ ONLY transactions."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    primary = create_async_engine("postgresql+asyncpg://user@localhost/app")
+    session = AsyncReadSessionLocal(bind=primary)
+    assert session.bind.get_execution_options()["postgresql_readonly"] is True
+    assert session.bind.sync_engine.pool is primary.sync_engine.pool
+    assert AsyncReadSessionLocal(bind=primary).bind is session.bind
+    # A read session's own bind (e.g. handed to a streaming export) is reused as is
+    assert AsyncReadSessionLocal(bind=session.bind).bind is session.bind
+    assert "postgresql_readonly" not in primary.get_execution_options()
+
+
+@pytest.mark.asyncio
+async def test_replica_router_round_robin_with_primary_fallback(monkeypatch):
+    """Test replicas rotate, failed replicas are skipped and the primary is the fallback."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.db.database import ReplicaRouter
+
+    primary = create_async_engine("sqlite+aiosqlite://")
+    replicas = [create_async_engine("sqlite+aiosqlite://") for _ in range(2)]
+    router = ReplicaRouter(primary, replicas, retry_after=30)
+    try:
+        assert [router.pick() for _ in range(3)] == [replicas[0], replicas[1], replicas[0]]
+
+        router.mark_down(1)
+        assert [router.pick() for _ in range(2)] == [replicas[0], replicas[0]]
+
+        router.mark_down(0)
+        assert router.pick() is primary
+
+        now = time.monotonic()
+        monkeypatch.setattr("app.db.database.time.monotonic", lambda: now + 31)
+        assert router.pick() in replicas
+    finally:
+        for engine in [primary, *replicas]:
+            await engine.dispose()
+
+
+def test_pool_size_for_budget_never_exceeds_the_budget():
+    """Test the per-worker pool split keeps all workers within the connection budget."""
+    from app.db.database import pool_size_for_budget
+
+    for budget, workers in [(90, 4), (100, 8), (10, 3), (5, 5)]:
+        pool_size, max_overflow = pool_size_for_budget(budget, workers)
+        assert pool_size >= 1 and max_overflow >= 0
+        assert workers * (pool_size + max_overflow) <= budget
+
+    with pytest.raises(ValueError):
+        pool_size_for_budget(3, 4)
+
+
+def test_schema_revision_matches_alembic_head():
+    """Test SCHEMA_REVISION was bumped along with the newest migration."""
+    from pathlib import Path
+
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    from app.db.database import SCHEMA_REVISION
+
+    backend_dir = Path(__file__).resolve().parents[2]
+    config = Config(str(backend_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(backend_dir / "alembic"))
+    assert ScriptDirectory.from_config(config).get_heads() == [SCHEMA_REVISION]
+
+
+@pytest.mark.asyncio
+async def test_check_schema_revision():
+    """Test the alembic startup mode accepts migrated databases and refuses others."""
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.db.database import SCHEMA_REVISION, check_schema_revision
+
+    db_engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        with pytest.raises(RuntimeError, match="alembic upgrade head"):
+            await check_schema_revision(db_engine)
+
+        async with db_engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32))"))
+        with pytest.raises(RuntimeError, match="no Alembic revision"):
+            await check_schema_revision(db_engine)
+
+        async with db_engine.begin() as conn:
+            await conn.execute(
+                text("INSERT INTO alembic_version VALUES (:revision)"), {"revision": SCHEMA_REVISION}
+            )
+        assert await check_schema_revision(db_engine) == SCHEMA_REVISION
+    finally:
+        await db_engine.dispose()
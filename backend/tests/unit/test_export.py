@@ -0,0 +1,49 @@
+import csv
+import io
+import json
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.utils.export import csv_chunks, ndjson_chunks
+
+
+class Row(BaseModel):
+    id: int
+    note: Optional[str] = None
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+async def _collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+async def test_csv_quotes_formula_text_but_ndjson_stays_raw():
+    """Test CSV cells that a spreadsheet would run as formulas are prefixed with '."""
+    notes = ["=HYPERLINK(\"http://evil\")", "+1", "-2", "@SUM(A1)", "\tx", "\rx", "plain", None]
+    rows = [Row(id=i, note=note) for i, note in enumerate(notes)]
+
+    chunks = await _collect(csv_chunks(_batches(rows), Row))
+    records = list(csv.DictReader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert [record["note"] for record in records] == [
+        "'=HYPERLINK(\"http://evil\")", "'+1", "'-2", "'@SUM(A1)", "'\tx", "'\rx", "plain", ""
+    ]
+
+    chunks = await _collect(ndjson_chunks(_batches(rows), Row))
+    lines = b"".join(chunks).decode("utf-8").splitlines()
+    assert json.loads(lines[0])["note"] == notes[0]
+
+
+async def test_one_chunk_per_batch():
+    """Test each batch is written as one chunk, with the CSV header in the first."""
+    batches = ([Row(id=1), Row(id=2)], [Row(id=3)])
+    csv_output = await _collect(csv_chunks(_batches(*batches), Row))
+    assert len(csv_output) == 2
+    assert csv_output[0].startswith(b"id,note\r\n")
+
+    assert len(await _collect(ndjson_chunks(_batches(*batches), Row))) == 2
+    assert await _collect(csv_chunks(_batches(), Row)) == [b"id,note\r\n"]
@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.importtime import BACKEND_DIR, IMPORT_BUDGET_MS, measure_import
+
+LAZY_CHECK = """
+import sys
+import app.main
+from app.db import database
+loaded = [name for name in ("jose", "passlib", "bcrypt", "cryptography") if name in sys.modules]
+assert not loaded, f"imported at startup: {loaded}"
+assert database._engine is None, "engine created at import"
+"""
+
+
+def test_importing_the_app_defers_engines_and_crypto():
+    """Test the engine and crypto libraries are created/loaded on first use, not at import."""
+    subprocess.run(
+        [sys.executable, "-c", LAZY_CHECK], cwd=BACKEND_DIR, check=True, capture_output=True
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"), reason="wall-clock benchmark; set RUN_BENCHMARKS=1"
+)
+def test_app_import_time_within_budget():
+    """Test a cold import of app.main stays within the import-time budget."""
+    # Best of two runs, to ride out a noisy neighbour
+    total_ms = min(measure_import("app.main")[0] for _ in range(2))
+    assert total_ms < IMPORT_BUDGET_MS, f"import app.main took {total_ms:.0f} ms"
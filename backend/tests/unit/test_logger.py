@@ -0,0 +1,93 @@
+import json
+import logging
+import queue
+
+from app.utils.logger import (
+    BoundedQueueHandler,
+    DebugSampler,
+    JSONFormatter,
+    get_logging_stats,
+    setup_logger,
+    shutdown_logging,
+)
+
+
+def _record(message: str, *args) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, args, None)
+
+
+def test_bounded_queue_handler_drops_when_full():
+    """Test the drop policy counts records that do not fit in the queue."""
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1), policy="drop")
+    handler.handle(_record("first %s", 1))
+    handler.handle(_record("second"))
+
+    assert handler.dropped == 1
+    queued = handler.queue.get_nowait()
+    # The message is interpolated before it crosses threads
+    assert queued.msg == "first 1" and queued.args is None
+
+
+def test_queued_logger_writes_on_background_thread_and_flushes(tmp_path):
+    """Test records reach the file handlers once the pipeline is flushed."""
+    logger = setup_logger("app.tests.queued", log_level="INFO", log_dir=tmp_path, use_queue=True)
+    try:
+        logger.info("hello from the queue")
+        assert get_logging_stats()["queued"] is True
+    finally:
+        shutdown_logging()
+
+    assert "hello from the queue" in (tmp_path / "app.log").read_text()
+
+    # Records logged after shutdown are written directly instead of being lost
+    logger.warning("after shutdown")
+    assert "after shutdown" in (tmp_path / "app.log").read_text()
+
+
+def test_queued_child_logger_records_reach_the_parent_route(tmp_path):
+    """Test records propagating from an unconfigured child logger are written in queue mode."""
+    setup_logger("app.tests.parent", log_level="INFO", log_dir=tmp_path, use_queue=True)
+    try:
+        logging.getLogger("app.tests.parent.child.grandchild").warning("from the child")
+        logging.getLogger("app.tests.unrouted").warning("no configured ancestor")
+    finally:
+        shutdown_logging()
+
+    lines = [json.loads(line) for line in (tmp_path / "app.log").read_text().splitlines()]
+    assert [(line["name"], line["message"]) for line in lines] == [
+        ("app.tests.parent.child.grandchild", "from the child")
+    ]
+
+
+def test_loggers_share_one_handler_set(tmp_path):
+    """Test every module logger writes through the same file handlers."""
+    first = setup_logger("app.tests.first", log_level="INFO", log_dir=tmp_path, use_queue=False)
+    second = setup_logger("app.tests.second", log_level="INFO", log_dir=tmp_path, use_queue=False)
+
+    assert first.handlers == second.handlers
+    first.info("from first")
+    second.error("from second")
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["app.error.log", "app.log"]
+    lines = [json.loads(line) for line in (tmp_path / "app.log").read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["app.tests.first", "app.tests.second"]
+    assert "from second" in (tmp_path / "app.error.log").read_text()
+
+
+def test_json_formatter_serializes_record():
+    """Test the JSON formatter output parses back with the expected fields."""
+    payload = json.loads(JSONFormatter().format(_record("value %s", 42)))
+
+    assert payload["message"] == "value 42"
+    assert payload["level"] == "INFO"
+
+
+def test_debug_sampler_keeps_one_in_n_per_call_site():
+    """Test DEBUG records are sampled per call site and other levels pass."""
+    sampler = DebugSampler(every=3)
+    debug = logging.LogRecord("test", logging.DEBUG, __file__, 10, "tick", None, None)
+    other_site = logging.LogRecord("test", logging.DEBUG, __file__, 20, "tock", None, None)
+
+    assert [sampler.filter(debug) for _ in range(6)] == [True, False, False, True, False, False]
+    assert sampler.filter(other_site) is True
+    assert all(sampler.filter(_record("info")) for _ in range(3))
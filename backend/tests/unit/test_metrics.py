@@ -0,0 +1,67 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.utils.metrics import (
+    MetricsRegistry,
+    RequestStats,
+    StartupTimings,
+    _request_stats,
+    instrument_engine,
+)
+
+
+@pytest.mark.asyncio
+async def test_instrumented_engine_counts_statements_for_current_request():
+    """Test SQL statements and DB time are attributed to the active request only."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    instrument_engine(engine)
+    stats = RequestStats()
+    token = _request_stats.set(stats)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+    finally:
+        _request_stats.reset(token)
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 3"))  # outside a request: not counted
+    await engine.dispose()
+
+    assert stats.statements == 2
+    assert stats.db_seconds > 0
+
+
+def test_registry_renders_prometheus_text():
+    """Test per-route counters and histogram series in exposition format."""
+    registry = MetricsRegistry()
+    stats = RequestStats()
+    stats.statements, stats.db_seconds = 3, 0.004
+    registry.record("GET", "/api/jobs/{job_id}", 200, 0.02, stats, 512)
+    registry.record("GET", "/api/jobs/{job_id}", 404, 0.01, RequestStats(), 30)
+
+    body = registry.render()
+
+    labels = 'method="GET",route="/api/jobs/{job_id}"'
+    assert f'http_requests_total{{{labels},status="200"}} 1' in body
+    assert f'http_requests_total{{{labels},status="404"}} 1' in body
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.025"}} 2' in body
+    assert f"http_request_duration_seconds_count{{{labels}}} 2" in body
+    assert f"http_request_db_statements_total{{{labels}}} 3" in body
+    assert f"http_response_bytes_total{{{labels}}} 542" in body
+
+
+def test_startup_timings_accumulate_phases_in_order():
+    """Test repeated phases add up and the summary keeps their order."""
+    timings = StartupTimings()
+    timings.record("import", 0.25)
+    with timings.phase("engine"):
+        pass
+    timings.record("engine", 0.5)
+
+    assert list(timings.phases) == ["import", "engine"]
+    assert timings.phases["engine"] >= 0.5
+    summary = timings.summary()
+    assert summary.startswith("import=250.0ms, engine=")
+    assert summary.endswith("ms") and "total=" in summary
@@ -0,0 +1,48 @@
+import asyncio
+import threading
+
+import pytest
+from passlib.context import CryptContext
+
+from app.db.models import User
+from app.utils.passwords import PasswordHasher, PasswordHasherBusy, pwd_context
+
+
+@pytest.mark.asyncio
+async def test_verify_password_async_rehashes_outdated_cost():
+    """Test that a hash with an old cost factor is upgraded on successful verify."""
+    old_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    user = User(email="rehash@example.com", username="rehash")
+    user.hashed_password = old_context.hash("secret")
+
+    assert await user.verify_password_async("wrong") is False
+    assert pwd_context.needs_update(user.hashed_password)
+
+    assert await user.verify_password_async("secret") is True
+    assert not pwd_context.needs_update(user.hashed_password)
+    assert user.verify_password("secret")
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_sheds_load_when_queue_full():
+    """Test that calls beyond workers + queue are rejected and counted."""
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = asyncio.ensure_future(hasher.run(release.wait))
+        waiting = asyncio.ensure_future(hasher.run(release.wait))
+        await asyncio.sleep(0)
+        assert hasher.stats()["queue_depth"] == 1
+
+        with pytest.raises(PasswordHasherBusy):
+            await hasher.run(release.wait)
+
+        release.set()
+        await asyncio.gather(running, waiting)
+        stats = hasher.stats()
+        assert stats["completed"] == 2
+        assert stats["rejected"] == 1
+        assert stats["queue_depth"] == 0
+    finally:
+        release.set()
+        hasher.shutdown()
@@ -0,0 +1,46 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db import profiler
+from app.db.profiler import install_query_profiler, profile_queries
+
+
+@pytest.mark.asyncio
+async def test_profile_records_statements_and_flags_repeats():
+    """Test statements are recorded with parameter shapes and repeats are reported."""
+    install_query_profiler()
+    engine = create_async_engine("sqlite+aiosqlite://")
+    with profile_queries("outer") as outer:
+        with profile_queries("inner") as inner:
+            async with engine.connect() as conn:
+                for i in range(3):
+                    await conn.execute(text("SELECT :value"), {"value": i})
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    await engine.dispose()
+
+    assert inner.count == 3
+    assert outer.count == 4
+    assert inner.queries[0].parameters == "(1 positional)"
+    assert inner.repeated(threshold=3) == [("SELECT ?", 3)]
+    assert outer.repeated(threshold=4) == []
+    assert "SELECT ?" in inner.report()
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged_without_parameter_values(monkeypatch, caplog):
+    """Test statements over the threshold are logged with their parameter shape only."""
+    install_query_profiler()
+    monkeypatch.setattr(profiler.settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+    engine = create_async_engine("sqlite+aiosqlite://")
+    with caplog.at_level(logging.WARNING, logger=profiler.logger.name):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT :secret"), {"secret": "hunter2"})
+    await engine.dispose()
+
+    slow = [record.getMessage() for record in caplog.records if "Slow query" in record.getMessage()]
+    assert slow and "SELECT ?" in slow[0]
+    assert "hunter2" not in slow[0]
@@ -0,0 +1,174 @@
+import re
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select
+
+from app.db.models import Interview, Job, JobApplication, User
+from app.services.applications import (
+    get_application_summaries_by_applicant,
+    get_application_summaries_by_job,
+    get_applications_by_applicant,
+    get_applications_by_job,
+    get_applied_job_ids,
+)
+from app.services.interviews import get_application_interviews
+from app.services.jobs import get_active_jobs, get_employer_job_versions, get_jobs_by_employer
+
+# Service queries (given the ids from `plan_rows`) and the index the first
+# statement is expected to be served by. Only the first statement runs the
+# query itself; the rest are selectin loads by primary or foreign key, which
+# are checked for table scans but not tied to a particular index.
+SERVICE_QUERIES = [
+    # The partial status = 'active' feed indexes (revision 3b9d2f61a7c4). SQLite
+    # orders the feed by julianday(created_at), so there any of them serves the
+    # unfiltered page; on PostgreSQL it is ix_jobs_active_created_at_id.
+    (lambda db, ids: get_active_jobs(db, limit=20), "ix_jobs_active_"),
+    (
+        lambda db, ids: get_active_jobs(db, limit=20, location="Plan City"),
+        "ix_jobs_active_location_created_at_id",
+    ),
+    (
+        lambda db, ids: get_active_jobs(db, limit=20, employment_type="contract"),
+        "ix_jobs_active_employment_type_created_at_id",
+    ),
+    (
+        lambda db, ids: get_active_jobs(db, limit=20, max_salary=90_000),
+        "ix_jobs_active_salary_range",
+    ),
+    (lambda db, ids: get_jobs_by_employer(db, ids["employer"]), "ix_jobs_posted_by_id_created_at"),
+    (
+        lambda db, ids: get_employer_job_versions(db, ids["employer"]),
+        "ix_jobs_posted_by_id_created_at",
+    ),
+    (
+        lambda db, ids: get_applications_by_job(db, ids["job"]),
+        "ix_job_applications_job_id_created_at_id",
+    ),
+    (
+        lambda db, ids: get_applications_by_applicant(db, ids["seeker"]),
+        "ix_job_applications_applicant_id_created_at_id",
+    ),
+    (
+        lambda db, ids: get_application_summaries_by_job(db, ids["job"], limit=20),
+        "ix_job_applications_job_id_created_at_id",
+    ),
+    (
+        lambda db, ids: get_application_summaries_by_applicant(db, ids["seeker"], limit=20),
+        "ix_job_applications_applicant_id_created_at_id",
+    ),
+    (
+        lambda db, ids: get_applied_job_ids(db, ids["seeker"]),
+        "ix_job_applications_applicant_id_created_at_id",
+    ),
+    (
+        lambda db, ids: get_application_interviews(db, ids["application"]),
+        "ix_interviews_application_id_scheduled_at",
+    ),
+    (lambda db, ids: db.execute(select(User).filter(User.reset_token == "token")), None),
+]
+
+PLAN_EMPLOYER_EMAIL = "plan-employer@example.com"
+
+
+@pytest_asyncio.fixture()
+async def plan_rows(db_session) -> dict:
+    """
+    One job, application and interview, so queries return rows and their
+    selectin follow-up statements run too. Created once per test session.
+    """
+    employer = await db_session.scalar(select(User).filter(User.email == PLAN_EMPLOYER_EMAIL))
+    if employer is None:
+        employer = User(email=PLAN_EMPLOYER_EMAIL, username="planemployer", hashed_password="x")
+        seeker = User(email="plan-seeker@example.com", username="planseeker", hashed_password="x")
+        db_session.add_all([employer, seeker])
+        await db_session.flush()
+        job = Job(
+            title="Plan role",
+            company_name="Acme",
+            location="Plan City",
+            description="Plans",
+            requirements="EXPLAIN",
+            employment_type="contract",
+            salary_min=50_000,
+            salary_max=80_000,
+            posted_by_id=employer.id,
+        )
+        db_session.add(job)
+        await db_session.flush()
+        application = JobApplication(
+            job_id=job.id, applicant_id=seeker.id, resume_url="https://example.com/cv.pdf"
+        )
+        db_session.add(application)
+        await db_session.flush()
+        db_session.add(
+            Interview(
+                application_id=application.id,
+                scheduled_at=datetime(2030, 1, 1),
+                duration_minutes=30,
+                interview_type="technical",
+            )
+        )
+        await db_session.commit()
+
+    row = (
+        await db_session.execute(
+            select(Job.posted_by_id, Job.id, JobApplication.applicant_id, JobApplication.id)
+            .join(JobApplication, JobApplication.job_id == Job.id)
+            .join(User, User.id == Job.posted_by_id)
+            .filter(User.email == PLAN_EMPLOYER_EMAIL)
+        )
+    ).one()
+    return dict(zip(("employer", "job", "seeker", "application"), row))
+
+
+@contextmanager
+def _capture_statements(db_session):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+async def _plan(db_session, statement, parameters) -> str:
+    connection = await db_session.connection()
+    if connection.dialect.name == "postgresql":
+        # Tiny test tables are always cheaper to scan; ask which index would be used
+        await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    else:
+        result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return "\n".join(str(row[-1]) for row in result)
+
+
+def _table_scans(plan: str) -> list:
+    """Plan lines reading a whole table: Postgres Seq Scan, SQLite SCAN without an index."""
+    return [
+        line
+        for line in plan.splitlines()
+        if "Seq Scan" in line or re.match(r"\s*SCAN (?!CONSTANT ROW)\S+$", line)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("run_query,index_name", SERVICE_QUERIES)
+async def test_service_queries_use_indexes(db_session, plan_rows, run_query, index_name):
+    """Test that every statement a service query runs, including selectin loads, uses an index."""
+    with _capture_statements(db_session) as statements:
+        await run_query(db_session, plan_rows)
+    assert statements
+
+    plans = [await _plan(db_session, statement, parameters) for statement, parameters in statements]
+    for (statement, _), plan in zip(statements, plans):
+        assert not _table_scans(plan), f"{statement}\n{plan}"
+    if index_name is not None:
+        assert index_name in plans[0]
@@ -0,0 +1,38 @@
+import json
+from datetime import datetime
+from typing import List
+
+from app.db.models import Job
+from app.schemas.jobs import JobResponse
+from app.utils.responses import FastJSONResponse, dump_json, get_type_adapter, model_response
+
+
+def _job(job_id: int) -> Job:
+    now = datetime(2025, 1, 1, 12, 30)
+    return Job(
+        id=job_id, title="Engineer", company_name="Acme", location="Remote",
+        description="Build things", requirements="Python", salary_min=None, salary_max=None,
+        employment_type="full-time", status="active", created_at=now, updated_at=now,
+        posted_by_id=1,
+    )
+
+
+def test_dump_json_matches_pydantic_model_output():
+    """Test the TypeAdapter path renders ORM rows exactly like the response models."""
+    jobs = [_job(1), _job(2)]
+
+    payload = json.loads(dump_json(List[JobResponse], jobs))
+
+    assert payload == [json.loads(JobResponse.model_validate(job).model_dump_json()) for job in jobs]
+    assert payload[0]["created_at"] == "2025-01-01T12:30:00"
+    assert get_type_adapter(List[JobResponse]) is get_type_adapter(List[JobResponse])
+
+
+def test_model_response_and_fast_json_response():
+    """Test list responses carry JSON bytes and headers, and the default class renders JSON."""
+    response = model_response(List[JobResponse], [_job(1)], headers={"X-Next-Cursor": "abc"})
+    assert response.media_type == "application/json"
+    assert response.headers["x-next-cursor"] == "abc"
+    assert json.loads(response.body)[0]["id"] == 1
+
+    assert json.loads(FastJSONResponse({"a": [1, "é"], 2: None}).body) == {"a": [1, "é"], "2": None}
@@ -0,0 +1,59 @@
+from unittest.mock import Mock
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.database import create_search_vector
+from app.services.search import InvertedIndex, postgres_search_statement, tokenize
+
+
+def test_tokenize_drops_stop_words_and_stems():
+    """Test that tokenize normalises case, stop words and plurals."""
+    assert tokenize("The Python Developers") == ["python", "develop"]
+    assert tokenize(None) == []
+
+
+def test_inverted_index_and_semantics_and_ranking():
+    """Test that all terms must match and title weight outranks description."""
+    index = InvertedIndex()
+    index.add(1, {"title": "Backend engineer", "description": "Python services"})
+    index.add(2, {"title": "Python engineer", "description": "Backend work"})
+    index.add(3, {"title": "Designer", "description": "Python scripting"})
+
+    assert [doc_id for doc_id, _ in index.search("python engineer", 10)] == [2, 1]
+    assert index.search("python plumber", 10) == []
+
+
+def test_inverted_index_reindex_and_remove():
+    """Test that re-adding replaces old terms and remove drops postings."""
+    index = InvertedIndex()
+    index.add(1, {"title": "Rust developer"})
+    index.add(1, {"title": "Go developer"})
+    assert index.search("rust", 10) == []
+    assert [doc_id for doc_id, _ in index.search("go", 10)] == [1]
+
+    index.remove(1)
+    assert index.search("developer", 10) == []
+    assert len(index) == 0
+
+
+def test_postgres_search_statement_uses_search_vector():
+    """Test the PostgreSQL query matches and ranks on jobs.search_vector."""
+    sql = str(
+        postgres_search_statement("python developer", 20).compile(dialect=postgresql.dialect())
+    )
+    assert "jobs.search_vector @@ websearch_to_tsquery(" in sql
+    assert "ts_rank_cd(jobs.search_vector, websearch_to_tsquery(" in sql
+    assert "ORDER BY rank DESC, jobs.id DESC" in sql
+
+
+def test_create_search_vector_only_on_postgres():
+    """Test create_all mode adds the search column and GIN index on PostgreSQL only."""
+    connection = Mock(dialect=postgresql.dialect())
+    create_search_vector(connection)
+    executed = [call.args[0] for call in connection.exec_driver_sql.call_args_list]
+    assert "ADD COLUMN IF NOT EXISTS search_vector tsvector" in executed[0]
+    assert "USING gin (search_vector)" in executed[1]
+
+    sqlite_connection = Mock(dialect=sqlite.dialect())
+    create_search_vector(sqlite_connection)
+    sqlite_connection.exec_driver_sql.assert_not_called()
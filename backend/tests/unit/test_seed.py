@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.db import Base
+from app.db.models import ApplicationDailyCount, JobApplication
+from app.db.seed import DatasetGenerator, Scale, seed_dataset, seed_email
+
+
+def test_dataset_generator_rows_are_consistent():
+    """Test generated ids continue after the offsets and references are valid."""
+    scale = Scale(users=50, jobs=20, applications=200, interviews=30)
+    generator = DatasetGenerator(
+        scale, seed=1, id_offsets={"users": 100, "jobs": 10}, password_hash="hash"
+    )
+
+    users = list(generator.users())
+    jobs = list(generator.jobs())
+    applications = list(generator.applications())
+    interviews = list(generator.interviews())
+
+    user_ids = {user["id"] for user in users}
+    employer_ids = {user["id"] for user in users if user["is_supervisor"]}
+    job_ids = {job["id"] for job in jobs}
+    application_ids = {application["id"] for application in applications}
+
+    assert min(user_ids) == 101 and len(user_ids) == 50
+    assert users[0]["email"] == seed_email(101)
+    assert min(job_ids) == 11
+    assert {job["posted_by_id"] for job in jobs} <= employer_ids
+    assert {application["job_id"] for application in applications} <= job_ids
+    assert not {application["applicant_id"] for application in applications} & employer_ids
+    pairs = {(application["job_id"], application["applicant_id"]) for application in applications}
+    assert len(pairs) == len(applications)  # respects the one-application-per-job constraint
+    assert {interview["application_id"] for interview in interviews} <= application_ids
+    assert len(interviews) == 30
+
+
+@pytest.mark.asyncio
+async def test_seed_dataset_loads_rows_and_rollups():
+    """Test seeding inserts every table, appends after existing ids and fills rollups."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    scale = Scale(users=20, jobs=10, applications=40, interviews=5)
+    first = await seed_dataset(engine, scale, seed=3, batch_size=7)
+    second = await seed_dataset(engine, scale, seed=4, batch_size=7)
+
+    async with engine.connect() as conn:
+        applications = (
+            await conn.execute(select(func.count()).select_from(JobApplication))
+        ).scalar()
+        rolled_up = (await conn.execute(select(func.sum(ApplicationDailyCount.count)))).scalar()
+    await engine.dispose()
+
+    assert first["users"] == second["users"] == 20
+    assert first["interviews"] == 5
+    # Seekers are capped at half the jobs, so tiny scales may lose a few
+    assert 0 < first["job_applications"] <= 40
+    assert applications == first["job_applications"] + second["job_applications"]
+    assert rolled_up == applications